@@ -1,12 +1,138 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from selenium.common.exceptions import WebDriverException
 import logging
+import os
+import threading
+import time
+import weakref
+from urllib.parse import parse_qs, urlsplit
+import config
 from config import HEADLESS_MODE
+import totp
+from waits import wait_for_document_ready, wait_for_url_without
+from spans import timed
 
 logger = logging.getLogger(__name__)
 
+# URL fragments NetSuite redirects to when the session is not authenticated.
+LOGIN_URL_MARKERS = (
+    "/app/login/",
+    "login.nl",
+    "securityquestions.nl",
+    "loginchallenge/entry.nl",
+)
+
+
+def is_login_url(url):
+    """Return True when ``url`` is one of NetSuite's login/challenge pages."""
+
+    url = (url or "").lower()
+    return any(marker in url for marker in LOGIN_URL_MARKERS)
+
+
+# Environment variable holding the base32 authenticator secret when it is not
+# set as NETSUITE_TOTP_SECRET in config.py.
+TOTP_SECRET_ENV = "NETSUITE_TOTP_SECRET"
+# Wait for the next code rather than submit one this close to expiring.
+TOTP_MIN_VALIDITY = 3
+
+
+def get_totp_secret():
+    """Return the configured TOTP secret, or ``None`` when 2FA must be typed in."""
+
+    return getattr(config, "NETSUITE_TOTP_SECRET", None) or os.environ.get(TOTP_SECRET_ENV)
+
+
+# Pooled browsers log in side by side; console prompts must take turns.
+_prompt_lock = threading.Lock()
+
+
+def get_2fa_code():
+    """Return a 2FA code, generated from the TOTP secret or prompted for in the console."""
+
+    secret = get_totp_secret()
+    if not secret:
+        with _prompt_lock:
+            return input(f"🔢 Enter 2FA Code ({threading.current_thread().name}): ")  # Prompt user for 6-digit code
+
+    remaining = totp.seconds_remaining()
+    if remaining < TOTP_MIN_VALIDITY:
+        time.sleep(remaining)
+    logger.info("🔑 Generated 2FA code from the TOTP secret.")
+    return totp.totp(secret)
+
+
+class RoleTracker:
+    """Remember which NetSuite role is active in each driver's session.
+
+    Role switches are full ``changerole.nl`` navigations (sometimes with 2FA),
+    so callers check here first and skip the switch when the role is already
+    active. Entries disappear with their driver.
+    """
+
+    def __init__(self):
+        self._roles = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, driver):
+        with self._lock:
+            return self._roles.get(driver)
+
+    def set(self, driver, role_id):
+        with self._lock:
+            self._roles[driver] = role_id
+
+    def clear(self, driver):
+        with self._lock:
+            self._roles.pop(driver, None)
+
+
+ROLE_TRACKER = RoleTracker()
+
+
+def role_id_from_url(role_url):
+    """Return the role ID from a ``changerole.nl?id=<account>~<user>~<role>~N`` URL."""
+
+    role_param = parse_qs(urlsplit(role_url).query).get("id", [""])[0]
+    parts = role_param.split("~")
+    return parts[2] if len(parts) > 2 else role_param
+
+
+def current_role(driver):
+    """Return the role ID last switched to on ``driver``, or ``None`` if unknown."""
+
+    return ROLE_TRACKER.get(driver)
+
+
+# NetSuite app pages expose the SuiteScript 1.0 client API, which knows the
+# session's role even when no role switch has happened yet.
+SESSION_ROLE_SCRIPT = """
+try {
+    if (typeof nlapiGetRole === "function") return String(nlapiGetRole());
+    if (typeof nlapiGetContext === "function") return String(nlapiGetContext().getRole());
+} catch (e) {}
+return null;
+"""
+
+
+def session_role(driver):
+    """Return the active role ID as reported by the open NetSuite page, or ``None``.
+
+    A role found this way is recorded in ``ROLE_TRACKER``.
+    """
+
+    try:
+        role_id = driver.execute_script(SESSION_ROLE_SCRIPT)
+    except WebDriverException:
+        return None
+    if not role_id or role_id == "-1":
+        return None
+    ROLE_TRACKER.set(driver, role_id)
+    return role_id
+
+
 def tick_remember_device_if_present(driver):
     """
     Attempts to tick NetSuite's remember/trust device checkbox if present.
@@ -79,9 +205,13 @@ def tick_remember_device_if_present(driver):
         return False
 
 
+@timed("switch_role", attrs=("role_url",))
 def switch_to_admin_role(driver, role_url):
     """Switch the current session to an administrator role, handling 2FA if necessary.
 
+    Does nothing when ``ROLE_TRACKER`` shows the role in ``role_url`` is
+    already active on ``driver``.
+
     Parameters
     ----------
     driver : selenium.webdriver
@@ -89,7 +219,13 @@ def switch_to_admin_role(driver, role_url):
     role_url : str
         URL for switching to the desired role.
     """
+    role_id = role_id_from_url(role_url)
+    if ROLE_TRACKER.get(driver) == role_id:
+        logger.info(f"✅ Role {role_id} already active, skipping role switch.")
+        return
+
     logger.info("➡️ Switching to admin role…")
+    ROLE_TRACKER.clear(driver)
     driver.get(role_url)
 
     if "loginchallenge/entry.nl" in getattr(driver, "current_url", ""):
@@ -97,8 +233,8 @@ def switch_to_admin_role(driver, role_url):
         
         tick_remember_device_if_present(driver)
 
-        if HEADLESS_MODE:
-            two_fa_code = input("🔢 Enter 2FA Code: ")
+        if HEADLESS_MODE or get_totp_secret():
+            two_fa_code = get_2fa_code()
             try:
                 WebDriverWait(driver, 15).until(
                     EC.presence_of_element_located((By.ID, "uif56_input"))
@@ -114,7 +250,7 @@ def switch_to_admin_role(driver, role_url):
                 )
                 driver.execute_script("arguments[0].click();", submit_button)
                 logger.info("✅ 2FA Code Submitted.")
-                time.sleep(5)
+                wait_for_url_without(driver, "loginchallenge/entry.nl")
             except Exception as e:  # pragma: no cover - real browser failures
                 logger.error(f"⚠️ Error entering 2FA code: {e}")
                 driver.quit()
@@ -127,7 +263,8 @@ def switch_to_admin_role(driver, role_url):
             )
 
             logger.info("✅ Manual 2FA completed.")
-            time.sleep(3)
+            wait_for_document_ready(driver)
 
     WebDriverWait(driver, 10).until(EC.url_contains("whence"))
+    ROLE_TRACKER.set(driver, role_id)
     logger.info("🔄 Switched to admin role.")
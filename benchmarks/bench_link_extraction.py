@@ -0,0 +1,69 @@
+"""Micro-benchmark: streaming href extraction vs. a full BeautifulSoup tree.
+
+Run from the repository root:
+
+    python benchmarks/bench_link_extraction.py [repeat]
+
+Each saved NetSuite page in ``tests/fixtures/netsuite_pages`` is parsed with
+the previous ``BeautifulSoup(..., "html.parser")`` path and with
+``link_parser.iter_hrefs``; the best of ``repeat`` runs is reported along with
+peak memory from ``tracemalloc``.
+"""
+
+import glob
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from link_parser import iter_hrefs
+
+FIXTURES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tests",
+    "fixtures",
+    "netsuite_pages",
+)
+
+
+def soup_hrefs(html):
+    soup = BeautifulSoup(html, "html.parser")
+    return [a["href"] for a in soup.find_all("a", href=True)]
+
+
+def streaming_hrefs(html):
+    return list(iter_hrefs(html))
+
+
+def peak_memory(func, html):
+    tracemalloc.start()
+    func(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main(repeat=5):
+    print(f"{'fixture':<16}{'links':>7}{'soup ms':>10}{'stream ms':>11}{'speedup':>9}"
+          f"{'soup KiB':>10}{'stream KiB':>12}")
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        assert set(soup_hrefs(html)) == set(streaming_hrefs(html))
+
+        soup_s = min(timeit.repeat(lambda: soup_hrefs(html), number=1, repeat=repeat))
+        stream_s = min(timeit.repeat(lambda: streaming_hrefs(html), number=1, repeat=repeat))
+        print(
+            f"{os.path.basename(path):<16}{len(streaming_hrefs(html)):>7}"
+            f"{soup_s * 1000:>10.1f}{stream_s * 1000:>11.1f}{soup_s / stream_s:>8.1f}x"
+            f"{peak_memory(soup_hrefs, html) / 1024:>10.0f}"
+            f"{peak_memory(streaming_hrefs, html) / 1024:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,71 @@
+"""Benchmark: CLI startup cost of ``import main`` and of each scraper module.
+
+Run from the repository root:
+
+    python benchmarks/bench_main_import.py [repeat]
+
+Every module is imported in a fresh interpreter with ``-X importtime`` and the
+best cumulative time of ``repeat`` runs is reported. ``main`` should stay far
+below the scrapers, since those are only imported when they run. Scraper
+modules need a ``config.py``; a dummy one is supplied on ``PYTHONPATH``.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = (
+    "main",
+    "scraper_registry",
+    "crawler",
+    "workflow_scraper",
+    "user_roles_scraper",
+    "list_values_scraper",
+    "record_catalogs_scraper",
+)
+
+DUMMY_CONFIG = """\
+NETSUITE_URL = NETSUITE_EMAIL = NETSUITE_PASSWORD = SECURITY_ANSWER = ADMIN_ITEM_URL = ""
+NETSUITE_BASE_URL = "https://example.com"
+HEADLESS_MODE = True
+PERSIST_BROWSER_PROFILE = False
+CHROME_PROFILE_DIR = ""
+"""
+
+
+def import_time(module, config_dir):
+    """Return the cumulative import time of ``module`` in microseconds."""
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, config_dir]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f"no importtime line for {module}")
+
+
+def main(repeat=5):
+    # config.py in the repo root (if any) wins over the dummy one.
+    with tempfile.TemporaryDirectory() as config_dir:
+        with open(os.path.join(config_dir, "config.py"), "w", encoding="utf-8") as fh:
+            fh.write(DUMMY_CONFIG)
+
+        print(f"{'module':<26}{'import ms':>12}")
+        for module in MODULES:
+            best = min(import_time(module, config_dir) for _ in range(repeat))
+            print(f"{module:<26}{best / 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,112 @@
+import logging
+
+from selenium.common.exceptions import WebDriverException
+
+from auth_utils import is_login_url
+
+logger = logging.getLogger(__name__)
+
+# fetch() calls in flight inside the page, URLs sent per execute_async_script
+# round trip, and the script timeout (seconds) for one batch.
+FETCH_CONCURRENCY = 6
+BATCH_SIZE = 30
+SCRIPT_TIMEOUT = 120
+
+# Runs inside the authenticated NetSuite tab. A small pool of async workers
+# fetch() the URLs with the page's own cookies and either return the raw HTML
+# or, when selectors are given, the text/attribute values DOMParser finds.
+# A selector of the form "css@attr" reads that attribute instead of the text.
+FETCH_BATCH_SCRIPT = """
+const urls = arguments[0];
+const concurrency = arguments[1];
+const selectors = arguments[2];
+const done = arguments[arguments.length - 1];
+const results = new Array(urls.length);
+let next = 0;
+
+function extract(html) {
+    const doc = new DOMParser().parseFromString(html, "text/html");
+    const fields = {};
+    for (const [name, spec] of Object.entries(selectors)) {
+        const [css, attr] = spec.split("@");
+        fields[name] = [...doc.querySelectorAll(css)].map(el =>
+            attr ? (el.getAttribute(attr) || "") : (el.textContent || "").trim()
+        );
+    }
+    return fields;
+}
+
+async function worker() {
+    while (next < urls.length) {
+        const i = next++;
+        try {
+            const resp = await fetch(urls[i], {credentials: "include"});
+            const html = await resp.text();
+            const result = {url: urls[i], status: resp.status, final_url: resp.url};
+            if (selectors) {
+                result.fields = extract(html);
+            } else {
+                result.html = html;
+            }
+            results[i] = result;
+        } catch (e) {
+            results[i] = {url: urls[i], status: 0, final_url: urls[i], error: String(e)};
+        }
+    }
+}
+
+const workers = [];
+for (let i = 0; i < Math.min(concurrency, urls.length); i++) workers.push(worker());
+Promise.all(workers).then(() => done(results));
+"""
+
+
+def fetch_batch(driver, urls, concurrency=FETCH_CONCURRENCY, selectors=None, timeout=SCRIPT_TIMEOUT):
+    """Fetch ``urls`` inside the logged-in page in one WebDriver round trip.
+
+    Returns one dict per URL, in order, with ``url``, ``status``,
+    ``final_url`` and ``login_required`` plus either ``html`` or, when
+    ``selectors`` (field name → CSS selector) is given, ``fields``. Network
+    failures are reported in ``error`` with ``status`` 0.
+    """
+
+    if not urls:
+        return []
+    driver.set_script_timeout(timeout)
+    results = driver.execute_async_script(
+        FETCH_BATCH_SCRIPT, list(urls), concurrency, selectors
+    )
+    for result in results:
+        result["login_required"] = is_login_url(result.get("final_url"))
+    return results
+
+
+def iter_fetch(driver, urls, batch_size=BATCH_SIZE, concurrency=FETCH_CONCURRENCY, selectors=None):
+    """Yield :func:`fetch_batch` results for ``urls``, ``batch_size`` URLs per round trip.
+
+    A batch whose script fails or times out yields an ``error`` result per
+    URL, like a network failure, so callers fall back for just that batch.
+    """
+
+    urls = list(urls)
+    for start in range(0, len(urls), batch_size):
+        batch = urls[start:start + batch_size]
+        logger.info(f"🌐 In-browser fetch of {len(batch)} pages ({start + len(batch)}/{len(urls)})")
+        try:
+            results = fetch_batch(driver, batch, concurrency, selectors)
+        except WebDriverException as e:
+            logger.warning(f"⚠️ In-browser fetch of {len(batch)} pages failed: {e}")
+            results = [
+                {"url": url, "status": 0, "final_url": url, "error": str(e), "login_required": False}
+                for url in batch
+            ]
+        yield from results
+
+
+def fetch_html(driver, url):
+    """Return the HTML of ``url`` fetched in-page, or ``None`` if it did not load cleanly."""
+
+    result = fetch_batch(driver, [url])[0]
+    if result.get("error") or result["login_required"] or not 200 <= result["status"] < 300:
+        return None
+    return result["html"]
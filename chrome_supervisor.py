@@ -0,0 +1,138 @@
+"""Start a long-running Chrome with remote debugging and keep it alive.
+
+Scrapers attach to it with ``python main.py --attach 127.0.0.1:9222 ...``,
+reusing the live NetSuite session instead of launching a browser per run::
+
+    python chrome_supervisor.py --port 9222
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import time
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 9222
+READY_TIMEOUT = 30
+RESTART_DELAY = 2
+
+CHROME_NAMES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+WINDOWS_CHROME_PATHS = (
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+)
+MAC_CHROME_PATH = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+
+
+def find_chrome():
+    """Return the Chrome executable from ``CHROME_BINARY`` or the usual install locations."""
+
+    candidates = [os.environ.get("CHROME_BINARY")]
+    candidates += [shutil.which(name) for name in CHROME_NAMES]
+    candidates += [*WINDOWS_CHROME_PATHS, MAC_CHROME_PATH]
+    for candidate in candidates:
+        if candidate and os.path.exists(candidate):
+            return candidate
+    raise FileNotFoundError("Chrome not found; set the CHROME_BINARY environment variable.")
+
+
+def chrome_command(binary, port, profile_dir, headless=False):
+    """Build the command line for a debuggable Chrome on ``profile_dir``."""
+
+    command = [
+        binary,
+        f"--remote-debugging-port={port}",
+        "--remote-debugging-address=127.0.0.1",
+        f"--user-data-dir={profile_dir}",
+        "--profile-directory=Default",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--start-maximized",
+    ]
+    if headless:
+        command.append("--headless=new")
+    return command
+
+
+def debugger_version(port, host="127.0.0.1"):
+    """Return Chrome's ``/json/version`` info, or ``None`` if it is not listening."""
+
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}/json/version", timeout=1) as resp:
+            return json.load(resp)
+    except (OSError, ValueError):
+        return None
+
+
+def wait_until_ready(port, timeout=READY_TIMEOUT):
+    """Poll the debugging endpoint until Chrome answers or ``timeout`` passes."""
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if debugger_version(port):
+            return True
+        time.sleep(0.25)
+    return False
+
+
+def supervise(command, port, max_restarts=None, popen=subprocess.Popen):
+    """Run Chrome and restart it whenever it exits, until interrupted.
+
+    Returns the number of restarts performed once ``max_restarts`` is reached
+    or on Ctrl+C.
+    """
+
+    restarts = 0
+    process = None
+    try:
+        while True:
+            process = popen(command)
+            if wait_until_ready(port):
+                logger.info(f"🟢 Chrome ready for attach on 127.0.0.1:{port} (pid {process.pid})")
+            else:
+                logger.warning(f"⚠️ Chrome did not open port {port} within {READY_TIMEOUT}s")
+            code = process.wait()
+            logger.warning(f"⚠️ Chrome exited with code {code}")
+            if max_restarts is not None and restarts >= max_restarts:
+                return restarts
+            restarts += 1
+            time.sleep(RESTART_DELAY)
+            logger.info(f"🔁 Restarting Chrome ({restarts})…")
+    except KeyboardInterrupt:
+        logger.info("🛑 Stopping Chrome…")
+        if process is not None and process.poll() is None:
+            process.terminate()
+            process.wait()
+        return restarts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Start and supervise a debuggable Chrome")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--profile-dir", default=None, help="Defaults to CHROME_PROFILE_DIR from config.py")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--chrome", default=None, help="Path to the Chrome executable")
+    args = parser.parse_args(argv)
+
+    profile_dir = args.profile_dir
+    if profile_dir is None:
+        from config import CHROME_PROFILE_DIR
+        profile_dir = CHROME_PROFILE_DIR
+
+    if debugger_version(args.port):
+        print(f"❌ Something is already listening on port {args.port}.")
+        sys.exit(1)
+
+    command = chrome_command(args.chrome or find_chrome(), args.port, profile_dir, args.headless)
+    supervise(command, args.port)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
@@ -0,0 +1,128 @@
+import sqlite3
+import time
+
+CRAWL_DB_FILE = "crawl_frontier.sqlite3"
+
+QUEUED = "queued"
+IN_PROGRESS = "in_progress"
+DONE = "done"
+ERROR = "error"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    discovered_at REAL NOT NULL,
+    fetched_at REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS pages_status ON pages (status, discovered_at);
+CREATE TABLE IF NOT EXISTS edges (
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    PRIMARY KEY (source, target)
+) WITHOUT ROWID;
+"""
+
+
+class CrawlStore:
+    """On-disk crawl frontier and visited store.
+
+    Every URL the crawler has seen lives in one SQLite table (WAL mode) with
+    its fetch status, depth and timestamps, so memory stays flat on large
+    tenants and an interrupted crawl can pick up where it stopped. The links
+    found on each fetched page are kept in a second table, so a resumed crawl
+    still exports the whole link graph. The store is only used from the crawl
+    coordinator thread.
+    """
+
+    def __init__(self, path=CRAWL_DB_FILE, resume=False):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        if resume:
+            # Pages that were in flight when the last run died get fetched again.
+            self.conn.execute(
+                "UPDATE pages SET status = ? WHERE status = ?", (QUEUED, IN_PROGRESS)
+            )
+        else:
+            self.conn.execute("DELETE FROM pages")
+            self.conn.execute("DELETE FROM edges")
+        self.conn.commit()
+
+    def __contains__(self, url):
+        row = self.conn.execute("SELECT 1 FROM pages WHERE url = ?", (url,)).fetchone()
+        return row is not None
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def add(self, url, depth):
+        """Queue ``url`` at ``depth``; returns False if it was already known."""
+
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO pages (url, status, depth, discovered_at) "
+            "VALUES (?, ?, ?, ?)",
+            (url, QUEUED, depth, time.time()),
+        )
+        return cursor.rowcount == 1
+
+    def claim(self, limit):
+        """Mark up to ``limit`` queued pages in progress and return ``(url, depth)`` pairs."""
+
+        if limit <= 0:
+            return []
+        rows = self.conn.execute(
+            "SELECT url, depth FROM pages WHERE status = ? "
+            "ORDER BY discovered_at LIMIT ?",
+            (QUEUED, limit),
+        ).fetchall()
+        self.conn.executemany(
+            "UPDATE pages SET status = ? WHERE url = ?",
+            [(IN_PROGRESS, url) for url, _ in rows],
+        )
+        self.conn.commit()
+        return rows
+
+    def add_edges(self, source, targets):
+        """Record links from ``source``; committed together with :meth:`mark_done`."""
+
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO edges (source, target) VALUES (?, ?)",
+            [(source, target) for target in targets],
+        )
+
+    def edges(self):
+        """Yield every recorded ``(source, target)`` link."""
+
+        yield from self.conn.execute("SELECT source, target FROM edges")
+
+    def mark_done(self, url):
+        self._finish(url, DONE, None)
+
+    def mark_error(self, url, error):
+        self._finish(url, ERROR, str(error))
+
+    def _finish(self, url, status, error):
+        self.conn.execute(
+            "UPDATE pages SET status = ?, fetched_at = ?, error = ? WHERE url = ?",
+            (status, time.time(), error, url),
+        )
+        self.conn.commit()
+
+    def urls(self):
+        """Yield every URL in the store, in discovery order."""
+
+        for (url,) in self.conn.execute("SELECT url FROM pages ORDER BY discovered_at"):
+            yield url
+
+    def status_counts(self):
+        return dict(
+            self.conn.execute("SELECT status, COUNT(*) FROM pages GROUP BY status")
+        )
+
+    def close(self):
+        self.conn.close()
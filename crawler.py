@@ -5,11 +5,32 @@ from selenium.webdriver.support.ui import WebDriverWait  # Handle delays
 from selenium.webdriver.support import expected_conditions as EC  # Handle dynamic elements
 from config import NETSUITE_BASE_URL
 import time  # For delays
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import nullcontext
 from urllib.parse import urljoin  # Handle URLs
 import requests  # requests for HTTP requests
-from bs4 import BeautifulSoup  # Parses HTML to extract links
-from auth_utils import tick_remember_device_if_present
+from link_parser import iter_hrefs  # Streams <a href> values out of the HTML
+from auth_utils import (
+    tick_remember_device_if_present,
+    is_login_url,
+    current_role,
+    session_role,
+    ROLE_TRACKER,
+    get_2fa_code,
+    get_totp_secret,
+)
+from http_session import SessionBridge
+from session_probe import SESSION_PROBE
+from spans import timed
+from throttle import RateLimiter, HostLimiter
+from url_canon import canonicalize, PatternCap, MAX_URLS_PER_PATTERN
+from crawl_store import CrawlStore, CRAWL_DB_FILE
+from page_cache import PageCache, PAGE_CACHE_FILE
+from link_graph import LinkGraph
+from browser_fetch import fetch_html
+from waits import wait_for_document_ready, wait_for_url_change, wait_for_url_without
 from config import (
     NETSUITE_URL,
     NETSUITE_EMAIL,
@@ -31,23 +52,36 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# Concurrent crawl settings: HTTP workers pulling from the shared frontier,
+# in-flight requests allowed per host, and a global request rate cap.
+CRAWL_WORKERS = 4
+MAX_REQUESTS_PER_HOST = 4
+REQUESTS_PER_SECOND = 5.0
+
+DASHBOARD_URL = f"{NETSUITE_BASE_URL}/app/center/card.nl?whence="
+
 def is_netsuite_logged_in(driver, timeout=8):
     """
     Checks whether the persistent browser profile already has a valid NetSuite session.
-    """
-    driver.get(f"{NETSUITE_BASE_URL}/app/center/card.nl?whence=")
-    time.sleep(2)
-
-    current_url = driver.current_url.lower()
 
-    login_indicators = [
-        "/app/login/",
-        "login.nl",
-        "securityquestions.nl",
-        "loginchallenge/entry.nl",
-    ]
-
-    if any(marker in current_url for marker in login_indicators):
+    Asks the cheap ``SESSION_PROBE`` (cookies plus one unrendered HTTP request,
+    cached briefly) first and only loads the dashboard when it cannot tell.
+    A dead session also forgets the tracked role: the next login lands in the
+    user's default role, whatever was switched to before.
+    """
+    alive = SESSION_PROBE.check(driver)
+    if alive is not None:
+        if alive:
+            logger.info("✅ Existing NetSuite session is valid.")
+        else:
+            ROLE_TRACKER.clear(driver)
+        return alive
+
+    driver.get(DASHBOARD_URL)
+    wait_for_document_ready(driver, timeout)
+
+    if is_login_url(driver.current_url):
+        ROLE_TRACKER.clear(driver)
         return False
 
     try:
@@ -55,17 +89,25 @@ def is_netsuite_logged_in(driver, timeout=8):
             lambda d: "app.netsuite.com" in d.current_url.lower()
         )
         logger.info("✅ Existing NetSuite browser session/profile is valid.")
+        SESSION_PROBE.remember(driver)
         return True
     except Exception:
+        ROLE_TRACKER.clear(driver)
         return False
 
 
+@timed()
 def login_netsuite(driver):
-    """Check for existing NetSuite Session before the NetSuite login workflow logic"""
+    """Check for existing NetSuite Session before the NetSuite login workflow logic.
+
+    Returns True once the browser is past the login, 2FA and security
+    question pages, False otherwise. The driver is left open either way.
+    """
     if is_netsuite_logged_in(driver):
         logger.info("✅ Skipping login because existing NetSuite session is active.")
         return True
     """Logs into NetSuite, handles 2FA dynamically, and navigates to the 'Admin Item' Custom Record."""
+    ROLE_TRACKER.clear(driver)  # a fresh login starts in the default role
     driver.get(NETSUITE_URL)
 
     try:
@@ -76,21 +118,23 @@ def login_netsuite(driver):
         driver.find_element(By.ID, "email").send_keys(NETSUITE_EMAIL)
         driver.find_element(By.ID, "password").send_keys(NETSUITE_PASSWORD)
 
-        # Click login
+        # Click login and wait for NetSuite to move on to the next page
+        login_url = driver.current_url
         driver.find_element(By.ID, "login-submit").click()
-        time.sleep(7)
+        wait_for_url_change(driver, login_url)
+        wait_for_document_ready(driver)
 
         # ✅ Print the current URL for debugging
-        print(f"🔍 Current page URL: {driver.current_url}")
+        logger.info(f"🔍 Current page URL: {driver.current_url}")
 
         # ✅ Handle 2FA Authentication
         if "loginchallenge/entry.nl" in driver.current_url:
-            print("🔐 2FA Authentication Required!")
+            logger.info("🔐 2FA Authentication Required!")
             tick_remember_device_if_present(driver)
 
-            if HEADLESS_MODE:
-                # Headless Mode → Enter 2FA Code in Console
-                two_fa_code = input("🔢 Enter 2FA Code: ")  # Prompt user for 6-digit code
+            if HEADLESS_MODE or get_totp_secret():
+                # Headless Mode or TOTP secret → Generate the code, or enter it in the console
+                two_fa_code = get_2fa_code()
 
                 try:
                     # Wait for the 2FA input field
@@ -98,10 +142,10 @@ def login_netsuite(driver):
                         EC.presence_of_element_located((By.ID, "uif56_input"))
                     )
 
-                    # Enter the 2FA code from the console
+                    # Enter the 2FA code
                     two_fa_input = driver.find_element(By.ID, "uif56_input")
                     two_fa_input.send_keys(two_fa_code)
-                    print("✅ 2FA Code Entered.")
+                    logger.info("✅ 2FA Code Entered.")
 
                     # Wait for the submit button
                     WebDriverWait(driver, 10).until(
@@ -111,26 +155,25 @@ def login_netsuite(driver):
                     # Click submit using JavaScript (since it's inside a <div>)
                     submit_button = driver.find_element(By.CSS_SELECTOR, "div[data-type='primary'][role='button']")
                     driver.execute_script("arguments[0].click();", submit_button)
-                    print("✅ 2FA Code Submitted.")
+                    logger.info("✅ 2FA Code Submitted.")
 
-                    time.sleep(5)  # Wait for redirection
+                    wait_for_url_without(driver, "loginchallenge/entry.nl")  # Wait for redirection
                 except Exception as e:
-                    print(f"⚠️ Error entering 2FA code: {e}")
-                    driver.quit()
-                    return
+                    logger.warning(f"⚠️ Error entering 2FA code: {e}")
+                    return False
 
             else:
                 # Non-Headless Mode → User enters 2FA manually
-                print("⏳ Waiting for manual 2FA entry in the browser...")
+                logger.info("⏳ Waiting for manual 2FA entry in the browser...")
                 WebDriverWait(driver, 180).until(
                     lambda d: "loginchallenge/entry.nl" not in d.current_url
                 )
-                print("✅ Manual 2FA completed.")
-                time.sleep(3)
+                logger.info("✅ Manual 2FA completed.")
+                wait_for_document_ready(driver)
 
         # ✅ Handle security questions
         if "securityquestions.nl" in driver.current_url:
-            print("🔐 Security questions detected! Answering...")
+            logger.info("🔐 Security questions detected! Answering...")
 
             try:
                 # Wait for answer input field
@@ -138,28 +181,36 @@ def login_netsuite(driver):
                     EC.presence_of_element_located((By.CSS_SELECTOR, "input[name='answer'][type='password']"))
                 )
                 driver.find_element(By.CSS_SELECTOR, "input[name='answer'][type='password']").send_keys(SECURITY_ANSWER)
-                print("✅ Answered security question.")
+                logger.info("✅ Answered security question.")
 
                 # Click submit
                 driver.find_element(By.CSS_SELECTOR, "input[name='submitter'][type='submit']").click()
-                time.sleep(5)
+                wait_for_url_without(driver, "securityquestions.nl")
 
             except Exception as e:
-                print(f"⚠️ Error filling the security answer: {e}")
+                logger.warning(f"⚠️ Error filling the security answer: {e}")
+
+        # The waits above give up without raising, so a wrong password or a
+        # stuck challenge leaves us on a login page.
+        if is_login_url(driver.current_url) or driver.current_url.split("?")[0] == login_url.split("?")[0]:
+            logger.error(f"❌ Login failed: still on {driver.current_url}")
+            return False
 
         # ✅ Navigate directly to Admin Item page
         # time.sleep(5)
-        print("✅ Login successful! Handing over control to main.py...")
+        SESSION_PROBE.remember(driver)
+        logger.info("✅ Login successful! Handing over control to main.py...")
         # navigate_to_admin_item(driver)
+        return True
 
     except Exception as e:
-        print(f"⚠️ Error during login: {e}")
-        driver.quit()
+        logger.warning(f"⚠️ Error during login: {e}")
+        return False
 
 def navigate_to_admin_item(driver):
     """Navigates directly to the 'Admin Item' Custom Record page and waits."""
     driver.get(ADMIN_ITEM_URL)
-    print("🔍 Navigated to Custom Record: 'Admin Item'.")
+    logger.info("🔍 Navigated to Custom Record: 'Admin Item'.")
 
     try:
         # Wait until the page loads (adjust selector as needed)
@@ -171,53 +222,221 @@ def navigate_to_admin_item(driver):
         driver.quit()  # Close browser when user presses Enter
 
     except Exception as e:
-        print(f"⚠️ Error navigating to 'Admin Item': {e}")
-
-def extract_links(driver, url):
-    """Extracts all links from a given webpage using BeautifulSoup & requests (faster than Selenium)."""
+        logger.warning(f"⚠️ Error navigating to 'Admin Item': {e}")
+
+def needs_browser(html):
+    """Return True when ``html`` is a script shell whose links only appear after JavaScript runs."""
+    lowered = html.lower()
+    return "<a " not in lowered and "<script" in lowered
+
+def extract_links(driver, url, session=None, browser_lock=None, cache=None):
+    """Extracts all links from a given webpage using requests & a streaming HTML parser (faster than Selenium).
+
+    When ``session`` (a ``SessionBridge``) is given the page is fetched with the
+    browser's cookies, so authenticated NetSuite pages stay on the HTTP path.
+    When that fails or NetSuite still asks for a login, the page is fetched
+    inside the browser tab (``browser_fetch``); full Selenium navigation is only
+    used when that fails too or the page needs JavaScript to render its links.
+    ``browser_lock`` serialises the browser fallbacks when several crawl workers
+    share one browser.
+
+    With a ``PageCache`` the request is conditional; a ``304`` or an unchanged
+    body returns the cached link set without parsing the page again.
+    """
+    html = None
+    response = None
+    needs_js = False
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-    except:
-        # Fall back to Selenium if requests fail (e.g., need authentication)
-        driver.get(url)
-        time.sleep(3)
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-
-    links = {urljoin(url, a["href"]) for a in soup.find_all("a", href=True)}
-    return links
+        if session is not None and cache is not None:
+            cached = cache.get(url)
+            response = session.get(url, headers=cache.conditional_headers(cached))
+            if response is not None:
+                links = cache.reuse(url, cached, response)
+                if links is not None:
+                    return links
+        elif session is not None:
+            response = session.get(url)
+        else:
+            response = requests.get(url, timeout=10)
+            response.raise_for_status()
+        if response is not None:
+            needs_js = needs_browser(response.text)
+            if not needs_js:
+                html = response.text
+    except Exception:
+        pass
 
-def crawl_netsuite(driver):
-    """Crawls NetSuite after login and extracts all links."""
-    visited = set()
-    to_visit = {driver.current_url}  # Start from the dashboard
+    if html is None:
+        with browser_lock or nullcontext():
+            if not needs_js:
+                # Let the browser fetch() the raw page with its own cookies first
+                try:
+                    html = fetch_html(driver, url)
+                except Exception:
+                    html = None
+            if html is None:
+                # Fall back to Selenium navigation (e.g., page renders links with JavaScript)
+                driver.get(url)
+                time.sleep(3)
+                html = driver.page_source
+        response = None
 
-    while to_visit:
-        current_url = to_visit.pop()
-        print(f"🔍 Crawling: {current_url}")
+    links = set()
+    for href in iter_hrefs(html):
+        try:
+            links.add(urljoin(url, href))
+        except ValueError:
+            # e.g. a broken IPv6 host like "http://[::1/x"; skip just this link.
+            logger.debug(f"Skipping malformed link {href!r} on {url}")
+    if cache is not None and response is not None:
+        cache.put(url, response, links)
+    return links
 
-        if current_url in visited:
-            continue
-        visited.add(current_url)
+@timed()
+def crawl_netsuite(
+    driver,
+    workers=CRAWL_WORKERS,
+    max_per_host=MAX_REQUESTS_PER_HOST,
+    requests_per_second=REQUESTS_PER_SECOND,
+    base_url=None,
+    max_per_pattern=MAX_URLS_PER_PATTERN,
+    db_path=CRAWL_DB_FILE,
+    resume=False,
+    cache_path=PAGE_CACHE_FILE,
+    role="",
+    graph=None,
+):
+    """Crawls NetSuite after login and extracts all links.
+
+    Up to ``workers`` pages are fetched at once from a shared frontier, with at
+    most ``max_per_host`` in flight per host and ``requests_per_second`` overall
+    so the crawl stays inside NetSuite's governance limits.
+
+    Links are canonicalized before they enter the frontier: volatile parameters
+    are dropped, other hosts than ``base_url`` (default ``NETSUITE_BASE_URL``)
+    are ignored, and each path/parameter pattern admits at most
+    ``max_per_pattern`` distinct URLs.
+
+    The frontier lives in a SQLite ``CrawlStore`` at ``db_path``. With
+    ``resume=True`` the crawl continues from the pages left queued or in flight
+    by a previous run instead of starting over.
+
+    Unless ``cache_path`` is ``None``, pages are revalidated against the
+    ``PageCache`` there (keyed by URL and ``role``), so unchanged pages on a
+    repeat crawl cost one conditional request and no parsing.
+
+    When a ``LinkGraph`` is passed as ``graph``, every in-scope link found on a
+    page is stored as an edge from that page, and the graph is filled from the
+    store once the crawl (including any part before a resume) is complete.
+    """
+    base_url = base_url or NETSUITE_BASE_URL
+    workers = max(workers, 1)
+    session = SessionBridge(driver, pool_size=workers)
+    rate_limiter = RateLimiter(requests_per_second)
+    host_limiter = HostLimiter(max_per_host)
+    pattern_cap = PatternCap(max_per_pattern)
+    store = CrawlStore(db_path, resume=resume)
+    cache = PageCache(cache_path, role) if cache_path else None
+
+    def fetch(url):
+        with host_limiter.slot(url):
+            rate_limiter.acquire()
+            return extract_links(driver, url, session, session.driver_lock, cache)
+
+    if resume and len(store):
+        logger.info(f"♻️ Resuming crawl from {db_path}: {store.status_counts()}")
+        for url in store.urls():
+            pattern_cap.admit(url)
+    else:
+        if not driver.current_url.startswith("http"):
+            # The login check no longer leaves the browser on a NetSuite page.
+            driver.get(DASHBOARD_URL if base_url == NETSUITE_BASE_URL else base_url)
+        start_url = canonicalize(driver.current_url) or driver.current_url  # Start from the dashboard
+        store.add(start_url, 0)
+
+    pending = {}
 
-        try:
-            new_links = extract_links(driver, current_url)
-            to_visit.update(new_links - visited)
-        except Exception as e:
-            print(f"⚠️ Error crawling {current_url}: {e}")
-
-    print("\n✅ Crawling complete!")
-    print(f"Total Links Found: {len(visited)}")
-    print("\n".join(visited))
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while True:
+                for current_url, depth in store.claim(workers - len(pending)):
+                    logger.info(f"🔍 Crawling: {current_url}")
+                    # Copy the context so logs stay tied to e.g. the daemon job.
+                    future = pool.submit(contextvars.copy_context().run, fetch, current_url)
+                    pending[future] = (current_url, depth)
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    current_url, depth = pending.pop(future)
+                    try:
+                        new_links = future.result()
+                    except Exception as e:
+                        logger.warning(f"⚠️ Error crawling {current_url}: {e}")
+                        store.mark_error(current_url, e)
+                        continue
+
+                    targets = {canonicalize(link, base_url) for link in new_links}
+                    targets.discard(None)
+                    if graph is not None:
+                        store.add_edges(current_url, targets)
+                    for link in targets:
+                        if link not in store and pattern_cap.admit(link):
+                            store.add(link, depth + 1)
+                    store.mark_done(current_url)
+
+        visited = set(store.urls())
+        if graph is not None:
+            # Includes the links found before a --resume.
+            for source, target in store.edges():
+                graph.add_edges(source, (target,))
+    finally:
+        store.close()
+        if cache is not None:
+            logger.info(f"🗄️ Page cache: {cache.hits} unchanged, {cache.misses} fetched in full")
+            cache.close()
+
+    for pattern, count in pattern_cap.rejected.most_common():
+        logger.warning(f"⚠️ Crawl trap capped: skipped {count} URLs matching {pattern}")
+
+    logger.info("✅ Crawling complete!")
+    logger.info(f"Total Links Found: {len(visited)}")
+    logger.debug("\n".join(visited))
     return visited
 
 
-def run(driver):
+def crawl_role(driver):
+    """Return the active role ID, asking the session when no switch was recorded."""
+
+    role_id = current_role(driver)
+    if role_id:
+        return role_id
+    if not driver.current_url.startswith("http"):
+        driver.get(DASHBOARD_URL)
+    return session_role(driver)
+
+
+def run(driver, workers=CRAWL_WORKERS, resume=False):
     """Run the standalone site crawler.
 
     Assumes ``driver`` is already logged into NetSuite.  Returns the set of
-    visited links for further processing if needed.
+    visited links for further processing if needed. ``resume`` continues an
+    interrupted crawl from its on-disk frontier. The link graph is exported
+    as CSV and JSONL edge lists.
     """
 
-    return crawl_netsuite(driver)
+    graph = LinkGraph()
+    role = crawl_role(driver)
+    cache_path = PAGE_CACHE_FILE
+    if role is None:
+        # Pages differ per role, so an unknown role must not share cache entries.
+        logger.warning("⚠️ Could not tell the active role; crawling without the page cache.")
+        cache_path = None
+    visited = crawl_netsuite(
+        driver, workers=workers, resume=resume, cache_path=cache_path, role=role or "", graph=graph
+    )
+    graph.save_csv()
+    graph.save_jsonl()
+    return visited
@@ -0,0 +1,204 @@
+import contextvars
+import logging
+import queue
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from config import NETSUITE_BASE_URL
+from fast_profile import apply_fast_options, enable_fast_profile
+
+logger = logging.getLogger(__name__)
+
+POOL_SIZE = 3
+# Browsers started per pool slot before a failed login aborts the pool.
+LOGIN_ATTEMPTS = 2
+
+# Cookies that carry the NetSuite server session itself. Dropping them keeps the
+# remembered-device cookies, so a fresh login on a pooled driver skips 2FA but
+# gets its own session (and therefore its own active role).
+SESSION_COOKIE_NAMES = {"JSESSIONID"}
+
+# Selenium cookie keys → CDP Network.CookieParam keys.
+CDP_COOKIE_KEYS = {
+    "name": "name",
+    "value": "value",
+    "domain": "domain",
+    "path": "path",
+    "secure": "secure",
+    "httpOnly": "httpOnly",
+    "sameSite": "sameSite",
+    "expiry": "expires",
+}
+
+
+def export_session(driver):
+    """Return the authenticated session cookies of a logged-in ``driver``."""
+
+    return driver.get_cookies()
+
+
+def create_pool_driver(profile_dir, headless=True, fast=False):
+    """Start a (headless) Chrome on a throwaway ``profile_dir``.
+
+    ``fast=True`` applies the resource-blocking profile from ``fast_profile``.
+    """
+
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument(f"--user-data-dir={profile_dir}")
+    if fast:
+        apply_fast_options(options)
+    driver = webdriver.Chrome(options=options)
+    if fast:
+        enable_fast_profile(driver)
+    return driver
+
+
+def inject_session(driver, cookies):
+    """Load ``cookies`` into ``driver`` so it shares the exported NetSuite session.
+
+    Uses CDP ``Network.setCookies`` so cookies for every NetSuite domain can be
+    set without visiting each domain; falls back to ``add_cookie`` on the
+    account domain when CDP is unavailable.
+    """
+
+    cdp_cookies = [
+        {CDP_COOKIE_KEYS[key]: value for key, value in cookie.items() if key in CDP_COOKIE_KEYS}
+        for cookie in cookies
+    ]
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+        return
+    except (AttributeError, WebDriverException):
+        pass
+
+    driver.get(f"{NETSUITE_BASE_URL}/favicon.ico")
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+        except WebDriverException:
+            logger.debug(f"Skipping cookie {cookie.get('name')} for {cookie.get('domain')}")
+
+
+def _map_in_context(executor, func, items):
+    """``executor.map`` that runs each call in a copy of the caller's context."""
+
+    futures = [executor.submit(contextvars.copy_context().run, func, item) for item in items]
+    return [future.result() for future in futures]
+
+
+class DriverPool:
+    """Headless Chrome drivers that share one authenticated NetSuite session.
+
+    The session cookies exported from the logged-in main driver are injected
+    into ``size`` new drivers, each on its own temporary profile, so no further
+    logins or 2FA prompts are needed. Check drivers out with :meth:`driver` or
+    spread work items across the pool with :meth:`map`.
+
+    NetSuite keeps the active role per session, so every pooled driver is in
+    the same role as the driver the cookies came from. Pass
+    ``fresh_session=True`` with a ``login`` callable to give each driver its own
+    session instead: the session cookie is withheld and ``login(driver)`` runs
+    on every new driver, reusing the remembered-device cookies to avoid 2FA.
+    ``login`` returns True on success; a driver whose login fails is replaced
+    with a new one, up to ``LOGIN_ATTEMPTS`` browsers per slot, after which
+    the pool raises ``RuntimeError``.
+    """
+
+    def __init__(
+        self,
+        cookies,
+        size=POOL_SIZE,
+        driver_factory=create_pool_driver,
+        fresh_session=False,
+        login=None,
+    ):
+        self.size = size
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._profiles = [tempfile.mkdtemp(prefix="netsuite_pool_") for _ in range(size)]
+        if fresh_session:
+            cookies = [c for c in cookies if c.get("name") not in SESSION_COOKIE_NAMES]
+
+        def spawn(profile_dir):
+            for attempt in range(1, LOGIN_ATTEMPTS + 1):
+                driver = driver_factory(profile_dir)
+                self._drivers.append(driver)
+                inject_session(driver, cookies)
+                if login is None or login(driver):
+                    return driver
+                logger.warning(f"⚠️ Pooled browser failed to log in (attempt {attempt}/{LOGIN_ATTEMPTS})")
+                self._drivers.remove(driver)
+                try:
+                    driver.quit()
+                except WebDriverException:
+                    pass
+            raise RuntimeError("Pooled browser could not log in to NetSuite")
+
+        try:
+            # Browsers start (and log in) side by side rather than one after another.
+            with ThreadPoolExecutor(max_workers=max(size, 1)) as executor:
+                for driver in _map_in_context(executor, spawn, self._profiles):
+                    self._idle.put(driver)
+        except Exception:
+            self.close()
+            raise
+        logger.info(f"🚗 Driver pool ready with {size} authenticated browsers")
+
+    @classmethod
+    def from_driver(cls, driver, size=POOL_SIZE, **kwargs):
+        """Build a pool that shares the session of the logged-in ``driver``."""
+
+        return cls(export_session(driver), size=size, **kwargs)
+
+    @property
+    def drivers(self):
+        """Every driver in the pool, whether checked out or idle."""
+
+        return list(self._drivers)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Check out an idle driver for the duration of the ``with`` block."""
+
+        driver = self._idle.get(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
+
+    def map(self, func, items):
+        """Call ``func(driver, item)`` for every item across the pool; results keep item order."""
+
+        def call(item):
+            with self.driver() as driver:
+                return func(driver, item)
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return _map_in_context(executor, call, items)
+
+    def close(self):
+        """Quit every pooled driver and delete the throwaway profiles."""
+
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+        for profile_dir in self._profiles:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        self._drivers = []
+        self._profiles = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
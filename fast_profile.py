@@ -0,0 +1,130 @@
+"""Opt-in "fast" browsing profile: skip resources no scraper reads.
+
+``apply_fast_options`` switches a driver to ``pageLoadStrategy=eager`` so
+``driver.get`` returns at DOMContentLoaded (the scrapers wait for the elements
+they need anyway), and ``enable_fast_profile`` uses CDP
+``Network.setBlockedURLs`` to drop images, fonts, media, stylesheets and
+analytics beacons.
+
+The workflow diagram and the Record Catalog grids are laid out by NetSuite's
+scripts from computed styles, so they need stylesheets and images. Wrap that
+work in :func:`full_resources`, which keeps only ``ALWAYS_BLOCKED_PATTERNS``
+blocked. Scripts are never blocked apart from third-party beacons.
+"""
+
+import logging
+import threading
+import weakref
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Blocked everywhere, including on full_resources pages.
+ALWAYS_BLOCKED_PATTERNS = (
+    # Fonts and media
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.eot",
+    "*.mp4",
+    "*.webm",
+    "*.mp3",
+    # Analytics beacons
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*nr-data.net*",
+    "*js-agent.newrelic.com*",
+    "*hotjar.com*",
+)
+
+# Blocked only while no full_resources block is active.
+RENDER_PATTERNS = (
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.ico",
+    "*.webp",
+    "*.css",
+    "*.css?*",
+)
+
+BLOCKED_URL_PATTERNS = ALWAYS_BLOCKED_PATTERNS + RENDER_PATTERNS
+
+_fast_drivers = weakref.WeakKeyDictionary()  # driver → open full_resources blocks
+_lock = threading.Lock()
+
+
+def fast_profile_requested(flag=False):
+    """True when ``flag`` is set or config.py has ``FAST_BROWSER_PROFILE = True``."""
+
+    return bool(flag or getattr(config, "FAST_BROWSER_PROFILE", False))
+
+
+def apply_fast_options(options):
+    """Make ``driver.get`` return at DOMContentLoaded instead of the load event."""
+
+    options.page_load_strategy = "eager"
+    return options
+
+
+def _set_blocked(driver, patterns):
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+
+
+def enable_fast_profile(driver):
+    """Block ``BLOCKED_URL_PATTERNS`` on ``driver``; returns False when CDP is unavailable."""
+
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        _set_blocked(driver, BLOCKED_URL_PATTERNS)
+    except (AttributeError, WebDriverException) as e:
+        logger.warning(f"⚠️ Fast profile unavailable, loading all resources: {e}")
+        return False
+    with _lock:
+        _fast_drivers[driver] = 0
+    logger.info(f"⚡ Fast profile on: blocking {len(BLOCKED_URL_PATTERNS)} resource patterns")
+    return True
+
+
+def is_fast(driver):
+    with _lock:
+        return driver in _fast_drivers
+
+
+@contextmanager
+def full_resources(driver):
+    """Load stylesheets and images on ``driver`` for the duration of the block.
+
+    A no-op for drivers without the fast profile. Blocks may nest; the render
+    patterns come back when the outermost one exits.
+    """
+
+    with _lock:
+        depth = _fast_drivers.get(driver)
+        if depth is not None:
+            _fast_drivers[driver] = depth + 1
+    if depth is None:
+        yield driver
+        return
+
+    if depth == 0:
+        _set_blocked(driver, ALWAYS_BLOCKED_PATTERNS)
+    try:
+        yield driver
+    finally:
+        with _lock:
+            _fast_drivers[driver] -= 1
+            restore = _fast_drivers[driver] == 0
+        if restore:
+            try:
+                _set_blocked(driver, BLOCKED_URL_PATTERNS)
+            except WebDriverException as e:
+                logger.warning(f"⚠️ Could not restore fast profile blocking: {e}")
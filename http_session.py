@@ -0,0 +1,80 @@
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import WebDriverException
+
+from auth_utils import is_login_url
+
+logger = logging.getLogger(__name__)
+
+# Size of the keep-alive connection pool shared by every HTTP fetch.
+POOL_SIZE = 10
+REQUEST_TIMEOUT = 10
+
+
+class SessionBridge:
+    """Pooled ``requests.Session`` that reuses the browser's NetSuite login.
+
+    The logged-in Selenium cookies and user agent are copied into the HTTP
+    session so authenticated pages can be fetched without driving the browser.
+    When NetSuite answers with a login redirect the cookies are re-copied from
+    the browser once before giving up on the page.
+
+    ``driver_lock`` guards every use of the shared browser, so crawl workers on
+    different threads can share one bridge.
+    """
+
+    def __init__(self, driver, pool_size=POOL_SIZE, timeout=REQUEST_TIMEOUT):
+        self.driver = driver
+        self.timeout = timeout
+        self.driver_lock = threading.RLock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.sync_from_driver()
+
+    def sync_from_driver(self):
+        """Copy the browser cookies and user agent into the HTTP session."""
+
+        with self.driver_lock:
+            cookies = self.driver.get_cookies()
+            try:
+                user_agent = self.driver.execute_script("return navigator.userAgent;")
+            except WebDriverException:
+                user_agent = None
+
+            # Other crawl workers keep sending requests while this runs, so
+            # fill a fresh jar and swap it in whole instead of emptying the
+            # shared one.
+            jar = requests.cookies.RequestsCookieJar()
+            for cookie in cookies:
+                jar.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain", ""),
+                    path=cookie.get("path", "/"),
+                )
+            self.session.cookies = jar
+            if user_agent:
+                self.session.headers["User-Agent"] = user_agent
+
+    def get(self, url, headers=None):
+        """Fetch ``url`` with the bridged cookies and any extra ``headers``.
+
+        Returns the response, or ``None`` when NetSuite still redirects to a
+        login page after the cookies were refreshed from the browser.
+        """
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if is_login_url(response.url):
+            logger.info(f"🔄 Login redirect for {url}, refreshing browser cookies…")
+            self.sync_from_driver()
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if is_login_url(response.url):
+                logger.warning(f"⚠️ Bridged session still not authenticated for {url}")
+                return None
+        response.raise_for_status()
+        return response
@@ -0,0 +1,82 @@
+import csv
+import json
+import logging
+from array import array
+
+logger = logging.getLogger(__name__)
+
+# Edges per array chunk. Each chunk holds interleaved (source, target) node IDs
+# as unsigned ints, so growing the graph never copies one huge buffer.
+EDGE_CHUNK_SIZE = 65536
+
+
+class LinkGraph:
+    """Directed page-link graph with URLs interned to integer node IDs.
+
+    Each URL is stored once; edges are kept as pairs of node IDs in
+    ``array('I')`` chunks, so memory stays flat on crawls with hundreds of
+    thousands of links.
+    """
+
+    def __init__(self, chunk_size=EDGE_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.ids = {}
+        self.urls = []
+        self._chunks = []
+
+    def node_id(self, url):
+        """Return the integer ID for ``url``, assigning the next one if new."""
+
+        node = self.ids.get(url)
+        if node is None:
+            node = self.ids[url] = len(self.urls)
+            self.urls.append(url)
+        return node
+
+    def add_edges(self, source, targets):
+        """Record an edge from ``source`` to every URL in ``targets``."""
+
+        source_id = self.node_id(source)
+        for target in targets:
+            if not self._chunks or len(self._chunks[-1]) >= 2 * self.chunk_size:
+                self._chunks.append(array("I"))
+            self._chunks[-1].extend((source_id, self.node_id(target)))
+
+    def __len__(self):
+        return sum(len(chunk) for chunk in self._chunks) // 2
+
+    def edges(self):
+        """Yield every edge as a ``(source_id, target_id)`` pair."""
+
+        for chunk in self._chunks:
+            for i in range(0, len(chunk), 2):
+                yield chunk[i], chunk[i + 1]
+
+    def save_csv(self, edges_file="crawl_edges.csv", nodes_file="crawl_nodes.csv"):
+        """Write the node table and the integer edge list as two CSV files."""
+
+        with open(nodes_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Node ID", "URL"])
+            writer.writerows(enumerate(self.urls))
+
+        with open(edges_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Source ID", "Target ID"])
+            writer.writerows(self.edges())
+
+        logger.info(f"💾 Saved {len(self.urls)} nodes to {nodes_file} and {len(self)} edges to {edges_file}")
+
+    def save_jsonl(self, filename="crawl_edges.jsonl"):
+        """Write one JSON object per edge with both node IDs and URLs."""
+
+        with open(filename, "w", encoding="utf-8") as f:
+            for source, target in self.edges():
+                f.write(json.dumps({
+                    "source": source,
+                    "target": target,
+                    "source_url": self.urls[source],
+                    "target_url": self.urls[target],
+                }) + "\n")
+
+        logger.info(f"💾 Saved {len(self)} edges to {filename}")
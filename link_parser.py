@@ -0,0 +1,32 @@
+from html.parser import HTMLParser
+
+# Characters fed to the parser per step; hrefs are yielded after every chunk.
+CHUNK_SIZE = 64 * 1024
+
+
+class LinkParser(HTMLParser):
+    """Collect ``<a href>`` values as HTML is fed in, without building a tree."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.hrefs = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "a":
+            return
+        for name, value in attrs:
+            if name == "href":
+                self.hrefs.append(value or "")
+                return
+
+
+def iter_hrefs(html, chunk_size=CHUNK_SIZE):
+    """Yield every ``<a href>`` value in ``html``, parsing it chunk by chunk."""
+
+    parser = LinkParser()
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start:start + chunk_size])
+        yield from parser.hrefs
+        parser.hrefs.clear()
+    parser.close()
+    yield from parser.hrefs
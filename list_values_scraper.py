@@ -1,13 +1,39 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 import csv
+import hashlib
+import json
 import logging
+import os
+import re
+import time
+from collections import namedtuple
+from urllib.parse import parse_qs, urlsplit
+from bs4 import BeautifulSoup
 from auth_utils import switch_to_admin_role as _switch_to_admin_role
+from browser_fetch import iter_fetch
+from spans import timed
 
 logger = logging.getLogger(__name__)
 
+# List detail pages fetched at once (inside the logged-in tab) and parsed
+# offline. 1 visits every list in the browser one after another.
+LIST_WORKERS = 6
+
+# Previous run's lists (ID, name, table-row fingerprint, value count, content
+# hash and values) for incremental refreshes, and the changed-lists report.
+STATE_FILE = "list_values_state.json"
+CHANGES_FILE = "list_values_changes.csv"
+OUTPUT_FILE = "list_values.csv"
+# Lists scraped this run, one JSON line each, appended as soon as a list is
+# read. list_values.csv and the state file are only replaced once every list
+# is done, so a crash keeps the old outputs and --resume reuses the journal.
+JOURNAL_FILE = "list_values_journal.jsonl"
+# Cached lists are scraped again after this long even if their row is unchanged.
+STATE_MAX_AGE_DAYS = 7
+
 # ── Phase 1: List Values Navigation & Scrape ─────────────────────────────
 ADMIN_ROLE_URL = (
     "https://4891605.app.netsuite.com/app/login/secure/changerole.nl?"
@@ -22,6 +48,7 @@ def switch_to_admin_role(driver):
     _switch_to_admin_role(driver, ADMIN_ROLE_URL)
 
 
+@timed()
 def navigate_to_list_values_table(driver):
     """Navigate directly to the NetSuite page that lists all list values."""
 
@@ -63,64 +90,617 @@ def _extract_value_from_row(row):
         return ""
 
 
-def scrape_list_values(driver):
-    """Collect list values for each list on the table."""
+VALUE_ROWS = '#customvalue_splits tr[id^="customvalue_row_"]'
+
+# Reads every value row in one round trip, with the same selector fallbacks as
+# _extract_value_from_row. Returns a JSON string (cheaper for the driver to
+# marshal than an array of objects), or null when the table is missing.
+EXTRACT_VALUES_SCRIPT = """
+const table = document.getElementById("customvalue_splits");
+if (!table) return null;
+const selectors = ['td[data-ns-tooltip="Value"]', 'td[data-label="Value"]'];
+const rows = [...table.querySelectorAll('tr[id^="customvalue_row_"]')].map(row => {
+    let cell = null;
+    for (const selector of selectors) {
+        cell = row.querySelector(selector);
+        if (cell) break;
+    }
+    if (!cell) cell = row.querySelector("td:nth-child(2)");
+    const text = cell ? (cell.innerText || cell.textContent || "") : "";
+    return {row_id: row.id, value: text.trim()};
+});
+return JSON.stringify(rows);
+"""
+
+
+def extract_list_values(driver):
+    """Return ``[{"row_id", "value"}, ...]`` for the open list in one ``execute_script``.
+
+    Returns ``None`` when the script cannot run or the values table is
+    missing, so callers can fall back to reading the rows one by one.
+    """
+
+    try:
+        payload = driver.execute_script(EXTRACT_VALUES_SCRIPT)
+    except WebDriverException as e:
+        logger.warning(f"⚠️ Bulk value extraction failed, reading rows one by one: {e}")
+        return None
+    if payload is None:
+        return None
+    return json.loads(payload)
+
+
+def parse_list_values(html):
+    """Return the values in a list detail page's HTML, or ``None`` if it has no values table.
+
+    Offline twin of ``EXTRACT_VALUES_SCRIPT``, with the same selector fallbacks.
+    """
+
+    soup = BeautifulSoup(html, "html.parser")
+    if soup.find(id="customvalue_splits") is None:
+        return None
+    values = []
+    for row in soup.select(VALUE_ROWS):
+        cell = (
+            row.select_one('td[data-ns-tooltip="Value"]')
+            or row.select_one('td[data-label="Value"]')
+            or row.select_one("td:nth-child(2)")
+        )
+        value = re.sub(r"\s+", " ", cell.get_text(" ")).strip() if cell else ""
+        if value:
+            values.append(value)
+    return values
+
+
+def _read_values_row_by_row(driver):
+    values = []
+    for row in driver.find_elements(By.CSS_SELECTOR, VALUE_ROWS):
+        value = _extract_value_from_row(row)
+        if value:
+            values.append(value)
+    return values
+
+
+@timed(attrs=("href",))
+def scrape_list_in_browser(driver, href):
+    """Open one list in the browser and return its values."""
+
+    driver.get(href)
+
+    values_tab = driver.find_element(By.ID, "customvaluelnk")
+    if values_tab.get_attribute("aria-selected") != "true":
+        driver.execute_script("arguments[0].click();", values_tab)
+
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.ID, "customvalue_splits"))
+    )
+    rows = extract_list_values(driver)
+    if rows is None:
+        return _read_values_row_by_row(driver)
+    return [row["value"] for row in rows if row["value"]]
+
+
+def iter_fetch_list_values(driver, urls, workers=LIST_WORKERS):
+    """Yield ``(url, values)`` for each detail page that loads with a values table.
+
+    Pages are fetched ``workers`` at a time and parsed offline as each batch
+    returns; the rest are left for :func:`scrape_list_in_browser`.
+    """
+
+    for page in iter_fetch(driver, urls, concurrency=workers):
+        if page.get("error") or page["login_required"] or not 200 <= page["status"] < 300:
+            continue
+        values = parse_list_values(page["html"])
+        if values is not None:
+            yield page["url"], values
+
+
+ListEntry = namedtuple("ListEntry", ["list_id", "name", "href", "fingerprint"])
+
+
+def _fingerprint(text):
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
 
-    logger.info("🔎 Scraping list values…")
-    results = {}
+def content_hash(values):
+    """Hash of a list's values, in order."""
 
-    rows = driver.find_elements(By.CSS_SELECTOR, "tr.uir-list-row-tr")
-    links = []
-    for row in rows:
+    return hashlib.sha256("\n".join(values).encode("utf-8")).hexdigest()
+
+
+def list_id_from_href(href):
+    """Return the ``id`` parameter of a ``custlist.nl`` link (the href itself if absent)."""
+
+    return parse_qs(urlsplit(href).query).get("id", [href])[0]
+
+
+# One call per page of custlists.nl: every row's link, name and text, plus the
+# segment pagination state (same #segment_fs control as the roles list).
+HARVEST_LISTS_SCRIPT = """
+const rows = [];
+for (const row of document.querySelectorAll("tr.uir-list-row-tr")) {
+    const link = row.querySelector("td:first-child a");
+    if (!link) continue;
+    rows.push({
+        name: (link.innerText || link.textContent || "").trim(),
+        href: link.href,
+        text: row.innerText || row.textContent || "",
+    });
+}
+const pagination = document.getElementById("segment_fs");
+const segment = document.getElementById("segment");
+let hasNext = false;
+if (pagination) {
+    // ensure control is initialized
+    pagination.dispatchEvent(new Event("pointerenter", {bubbles: true}));
+    const next = pagination.querySelector("button.navig-next");
+    hasNext = !!next && !next.classList.contains("disabled");
+}
+return JSON.stringify({
+    rows: rows,
+    has_next: hasNext,
+    segment: segment ? segment.value : null,
+    label: pagination ? pagination.getAttribute("data-pagination-text") : null,
+});
+"""
+
+# [segment value, first row's list href], or null while the page is loading.
+SEGMENT_STATE_SCRIPT = """
+const segment = document.getElementById("segment");
+if (document.readyState === "loading" || !segment) return null;
+const link = document.querySelector("tr.uir-list-row-tr td:first-child a");
+return [segment.value, link ? link.href : null];
+"""
+
+# Safety cap on list index pages, in case the pagination control misbehaves.
+LIST_INDEX_MAX_PAGES = 200
+
+
+class IncompleteListIndexError(WebDriverException):
+    """Raised when the lists table could not be read to its last page.
+
+    A partial index would make every unread list look deleted, so nothing is
+    written from it.
+    """
+
+
+def harvest_list_page(driver):
+    """Return the current lists page's rows and pagination state, or ``None``."""
+
+    try:
+        payload = driver.execute_script(HARVEST_LISTS_SCRIPT)
+    except WebDriverException as e:
+        logger.warning(f"⚠️ Bulk list index harvest failed, reading rows one by one: {e}")
+        return None
+    return json.loads(payload) if payload else None
+
+
+def _list_rows_one_by_one(driver):
+    rows = []
+    for row in driver.find_elements(By.CSS_SELECTOR, "tr.uir-list-row-tr"):
         try:
             link = row.find_element(By.CSS_SELECTOR, "td:first-child a")
-            name = link.text.strip()
-            href = link.get_attribute("href")
-            links.append((name, href))
+            rows.append({"name": link.text.strip(), "href": link.get_attribute("href"), "text": row.text})
         except NoSuchElementException:
             continue
+    return rows
 
-    for name, href in links:
-        driver.get(href)
 
-        values_tab = driver.find_element(By.ID, "customvaluelnk")
-        if values_tab.get_attribute("aria-selected") != "true":
-            driver.execute_script("arguments[0].click();", values_tab)
+def _read_list_page_one_by_one(driver):
+    """Element-by-element version of ``HARVEST_LISTS_SCRIPT``'s result."""
 
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "customvalue_splits"))
-        )
-        rows = driver.find_elements(
-            By.CSS_SELECTOR, '#customvalue_splits tr[id^="customvalue_row_"]'
+    page = {"rows": _list_rows_one_by_one(driver), "has_next": False, "segment": None, "label": None}
+    try:
+        pagination = driver.find_element(By.ID, "segment_fs")
+    except NoSuchElementException:
+        return page  # single-page table
+    # ensure control is initialized
+    driver.execute_script(
+        "arguments[0].dispatchEvent(new Event('pointerenter', {bubbles:true}));",
+        pagination,
+    )
+    try:
+        next_btn = pagination.find_element(By.CSS_SELECTOR, "button.navig-next")
+    except NoSuchElementException:
+        return page
+    page["has_next"] = "disabled" not in (next_btn.get_attribute("class") or "")
+    page["label"] = pagination.get_attribute("data-pagination-text")
+    try:
+        page["segment"] = driver.find_element(By.ID, "segment").get_attribute("value")
+    except NoSuchElementException:
+        pass
+    return page
+
+
+def go_to_next_list_page(driver, segment_value, first_href=None, timeout=15):
+    """Move the lists table to the next segment; returns False if it did not change.
+
+    The segment control can update before the rows do, so with ``first_href``
+    (the first list on the current page) this also waits for the first row to
+    change.
+    """
+
+    parts = (segment_value or "").split(chr(2))
+    if not parts[0].isdigit():
+        logger.error(f"Unexpected pagination value: {segment_value!r}")
+        return False
+    driver.execute_script(
+        "NS.UI.Helpers.PaginationSelect.goToPage(document.getElementById('segment_fs'), arguments[0]);",
+        int(parts[0]) + 1,
+    )
+
+    def moved(d):
+        state = d.execute_script(SEGMENT_STATE_SCRIPT)
+        if not state or state[0] == segment_value:
+            return False
+        return first_href is None or state[1] != first_href
+
+    try:
+        WebDriverWait(driver, timeout).until(moved)
+        return True
+    except TimeoutException:
+        logger.error("⚠️ List index did not move to the next page")
+        return False
+
+
+@timed()
+def collect_list_entries(driver, max_pages=LIST_INDEX_MAX_PAGES):
+    """Return a ``ListEntry`` per list in the lists table, across every page, in order.
+
+    Each page is read with a single ``HARVEST_LISTS_SCRIPT`` call (element by
+    element if the script fails), then the segment pagination moves on until
+    the next button is disabled. Raises ``IncompleteListIndexError`` if the
+    last page cannot be reached. ``fingerprint`` hashes the row's visible text
+    (name, ID, description, owner and any other columns the list view shows),
+    so a change to any of them marks the list as changed.
+    """
+
+    entries, seen = [], set()
+    for page_number in range(1, max_pages + 1):
+        page = harvest_list_page(driver) or _read_list_page_one_by_one(driver)
+        new_rows = [row for row in page["rows"] if row["href"] not in seen]
+        for row in new_rows:
+            seen.add(row["href"])
+            entries.append(
+                ListEntry(list_id_from_href(row["href"]), row["name"], row["href"], _fingerprint(row["text"]))
+            )
+        label = f" ({page['label']})" if page.get("label") else ""
+        logger.info(f"📄 Lists page {page_number}{label}: {len(new_rows)} lists")
+
+        if not page["has_next"]:
+            return entries
+        if not new_rows:
+            raise IncompleteListIndexError(f"Lists page {page_number} repeated the previous page")
+        first_href = page["rows"][0]["href"] if page["rows"] else None
+        if not go_to_next_list_page(driver, page["segment"], first_href):
+            raise IncompleteListIndexError(f"Could not move past lists page {page_number}")
+    raise IncompleteListIndexError(f"Lists table still had more pages after {max_pages}")
+
+
+def iter_list_values(driver, entries, workers=LIST_WORKERS):
+    """Yield ``(entry, values)`` for ``entries`` as each list is read.
+
+    With ``workers`` > 1 the detail pages are fetched concurrently and parsed
+    offline; lists that cannot be read that way are opened in the browser
+    afterwards, in table order.
+    """
+
+    left = list(entries)
+    if workers > 1 and left:
+        by_href = {entry.href: entry for entry in left}
+        fetched = set()
+        for href, values in iter_fetch_list_values(driver, list(by_href), workers):
+            if href in by_href and href not in fetched:
+                fetched.add(href)
+                yield by_href[href], values
+        logger.info(
+            f"⚡ Fetched {len(fetched)}/{len(left)} lists in parallel; "
+            f"{len(left) - len(fetched)} left for the browser."
         )
-        values = []
-        for row in rows:
-            value = _extract_value_from_row(row)
-            if value:
-                values.append(value)
-        results[name] = values
+        left = [entry for entry in left if entry.href not in fetched]
+
+    for entry in left:
+        yield entry, scrape_list_in_browser(driver, entry.href)
+
+
+class ListState(dict):
+    """The previous run's list state: ``{list_id: summary}``.
+
+    The state file holds one JSON line per list. Only each list's summary
+    (name, fingerprint, count, hash and ``scraped_at``) is kept in memory,
+    with the line's offset; ``record`` reads a list's values back from disk.
+    A state file from before this layout is loaded whole, once.
+    """
+
+    def __init__(self, path=STATE_FILE):
+        super().__init__()
+        self.offsets = {}
+        self._legacy = {}
+        self.file = None
+        if not os.path.exists(path):
+            return
+        try:
+            self.file = open(path, "rb")
+            self._load()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable list state {path}: {e}")
+            self.close()
+            self.clear()
+            self.offsets.clear()
+            self._legacy.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _load(self):
+        offset = self.file.tell()
+        for line in iter(self.file.readline, b""):
+            record = json.loads(line)
+            if "lists" in record:
+                self._legacy = record["lists"]
+                for list_id, legacy in self._legacy.items():
+                    self[list_id] = {k: v for k, v in legacy.items() if k != "values"}
+            elif "list_id" in record:
+                list_id = record.pop("list_id")
+                record.pop("values")
+                self[list_id] = record
+                self.offsets[list_id] = offset
+            offset += len(line)
+
+    def record(self, list_id):
+        """Return the full record for ``list_id``, values included."""
+
+        if list_id in self._legacy:
+            return dict(self._legacy[list_id])
+        self.file.seek(self.offsets[list_id])
+        record = json.loads(self.file.readline())
+        record.pop("list_id")
+        return record
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+
+def load_state(path=STATE_FILE):
+    """Return the previous run's ``ListState`` (empty if there is none)."""
+
+    return ListState(path)
+
+
+def _write_state(f, items):
+    f.write(json.dumps({"version": 2}) + "\n")
+    for list_id, record in items:
+        f.write(json.dumps({"list_id": list_id, **record}, ensure_ascii=False) + "\n")
+
+
+class ListJournal:
+    """Append-only JSONL journal of the lists scraped in the current run.
+
+    Use it as a context manager so the file is closed if the run fails.
+    Each list is written and fsynced as soon as it is read, so an interrupted
+    run loses at most the list in progress. Only ``{list_id: offset}`` is kept
+    in memory; values are read back from disk when the outputs are written.
+    """
+
+    def __init__(self, path=JOURNAL_FILE, resume=False):
+        self.path = path
+        self.offsets = {}
+        left_over = os.path.exists(path) and os.path.getsize(path) > 0
+        if left_over and not resume:
+            logger.warning(
+                f"⚠️ Discarding the journal of an interrupted run in {path}; "
+                "pass --resume to continue it instead."
+            )
+        self.file = open(path, "r+b" if resume and left_over else "w+b")
+        if resume:
+            self._load()
+
+    def __enter__(self):
+        return self
 
-    logger.info("✅ Finished scraping list values.")
-    return results
+    def __exit__(self, *exc_info):
+        self.close()
 
+    def _load(self):
+        good = 0
+        for line in iter(self.file.readline, b""):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break  # the run died mid-write
+            if not line.endswith(b"\n"):
+                break
+            self.offsets[record["list_id"]] = good
+            good += len(line)
+        # Drop a torn last line so new records start on a fresh one.
+        self.file.seek(good)
+        self.file.truncate()
 
-def save_list_values(data, filename="list_values.csv"):
-    """Write scraped list values to a CSV file."""
+    def __contains__(self, list_id):
+        return list_id in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def append(self, record):
+        self.file.seek(0, os.SEEK_END)
+        offset = self.file.tell()
+        self.file.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.offsets[record["list_id"]] = offset
+
+    def get(self, list_id):
+        """Return the journaled record for ``list_id``."""
+
+        self.file.seek(self.offsets[list_id])
+        return json.loads(self.file.readline())
+
+    def close(self):
+        self.file.close()
+
+    def discard(self):
+        """Close and delete the journal once the outputs are written."""
+
+        self.close()
+        os.remove(self.path)
+
+
+def plan_refresh(entries, state, now=None, max_age_days=STATE_MAX_AGE_DAYS):
+    """Return the entries that need scraping: new, changed in the table, or stale.
+
+    Edits to a list's values alone do not show in the lists table, so cached
+    lists older than ``max_age_days`` are scraped again as well.
+    """
+
+    now = time.time() if now is None else now
+    max_age = max_age_days * 86400
+    stale = []
+    for entry in entries:
+        cached = state.get(entry.list_id)
+        if (
+            cached is None
+            or cached["fingerprint"] != entry.fingerprint
+            or now - cached["scraped_at"] > max_age
+        ):
+            stale.append(entry)
+    return stale
+
+
+def save_changes(changes, filename=CHANGES_FILE):
+    """Write the changed-lists report."""
 
     with open(filename, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
+        writer.writerow(["List ID", "Custom List", "Change", "Previous Count", "Count"])
+        writer.writerows(changes)
+
+    logger.info(f"💾 Saved {len(changes)} list changes to {filename}")
+
+
+@timed()
+def refresh_list_values(
+    driver,
+    workers=LIST_WORKERS,
+    state_path=STATE_FILE,
+    changes_path=CHANGES_FILE,
+    full=False,
+    output_path=OUTPUT_FILE,
+    journal_path=JOURNAL_FILE,
+    resume=False,
+):
+    """Scrape only the lists that changed since the last run and reuse the rest.
+
+    Scraped lists go to the journal as they finish; the CSV at ``output_path``
+    (in lists-table order) and the state file are then written from the
+    journal and the previous state, and a report of added, changed and removed
+    lists is saved. ``full=True`` scrapes every list. ``resume=True`` keeps
+    the journal of an interrupted run and skips the lists already in it.
+    Returns the number of lists written.
+    """
+
+    logger.info("🔎 Refreshing list values…")
+    with load_state(state_path) as state:
+        entries = collect_list_entries(driver)
+        stale = entries if full else plan_refresh(entries, state)
+
+        with ListJournal(journal_path, resume=resume) as journal:
+            if len(journal):
+                logger.info(f"⏯️ Resuming: {len(journal)} lists already in {journal_path}")
+            todo = [entry for entry in stale if entry.list_id not in journal]
+            logger.info(
+                f"♻️ {len(entries) - len(stale)} lists unchanged, {len(stale) - len(todo)} resumed, "
+                f"scraping {len(todo)}."
+            )
+
+            for done, (entry, values) in enumerate(iter_list_values(driver, todo, workers), 1):
+                journal.append(
+                    {
+                        "list_id": entry.list_id,
+                        "name": entry.name,
+                        "href": entry.href,
+                        "fingerprint": entry.fingerprint,
+                        "count": len(values),
+                        "hash": content_hash(values),
+                        "values": values,
+                        "scraped_at": time.time(),
+                    }
+                )
+                if done % 50 == 0:
+                    logger.info(f"📝 {done}/{len(todo)} lists journaled")
+
+            changes = finalize_list_values(entries, state, journal, output_path, state_path)
+            save_changes(changes, changes_path)
+            journal.discard()
+    logger.info("✅ Finished refreshing list values.")
+    return len(entries)
+
+
+def finalize_list_values(entries, state, journal, output_path=OUTPUT_FILE, state_path=STATE_FILE):
+    """Write the CSV and state for ``entries`` one list at a time; return the changes.
+
+    Both files are written to temporary paths and swapped in with
+    ``os.replace``, so readers never see a half-written file.
+    """
+
+    changes, written = [], set()
+
+    def records():
+        for entry in entries:
+            previous = state.get(entry.list_id)
+            if entry.list_id in journal:
+                record = journal.get(entry.list_id)
+                record.pop("list_id")
+                # A resumed record may predate a rename in the lists table.
+                record["name"] = entry.name
+                if previous is None:
+                    changes.append([entry.list_id, entry.name, "added", "", record["count"]])
+                elif previous["hash"] != record["hash"] or previous["name"] != entry.name:
+                    changes.append(
+                        [entry.list_id, entry.name, "changed", previous["count"], record["count"]]
+                    )
+            else:
+                record = state.record(entry.list_id)
+            written.add(entry.list_id)
+            yield entry.list_id, record
+
+    csv_tmp, state_tmp = f"{output_path}.tmp", f"{state_path}.tmp"
+    with open(csv_tmp, "w", newline="", encoding="utf-8") as out, open(
+        state_tmp, "w", encoding="utf-8"
+    ) as state_file:
+        writer = csv.writer(out)
         writer.writerow(["Custom List", "Values"])
-        for list_name, values in data.items():
-            for value in values:
-                writer.writerow([list_name, value])
 
-    logger.info(f"💾 Saved list values to {filename}")
+        def rows_written():
+            for list_id, record in records():
+                writer.writerows([record["name"], value] for value in record["values"])
+                yield list_id, record
 
+        _write_state(state_file, rows_written())
+    # Windows cannot replace the state file while it is still open for reading.
+    state.close()
+    os.replace(csv_tmp, output_path)
+    os.replace(state_tmp, state_path)
+    logger.info(f"💾 Saved list values to {output_path}")
 
-def run(driver):
-    """Run the list-values scraper end to end."""
+    for list_id, previous in state.items():
+        if list_id not in written:
+            changes.append([list_id, previous["name"], "removed", previous["count"], ""])
+    return changes
+
+
+def run(driver, workers=LIST_WORKERS, full_refresh=False, resume=False):
+    """Run the list-values scraper end to end.
+
+    Lists unchanged since the previous run are taken from ``STATE_FILE``;
+    ``full_refresh=True`` scrapes them all. ``resume=True`` continues an
+    interrupted run from ``JOURNAL_FILE``.
+    """
 
     switch_to_admin_role(driver)
     navigate_to_list_values_table(driver)
-    data = scrape_list_values(driver)
-    save_list_values(data)
+    refresh_list_values(driver, workers, full=full_refresh, resume=resume)
@@ -1,25 +1,47 @@
 import argparse
-import argparse
+import atexit
+import contextlib
+import functools
+import itertools
 import json
 import sys
 import logging
+import time
 
-from selenium import webdriver
+# selenium, config and the scraper modules are imported where they are used,
+# so --help, argument errors and short jobs start without loading them.
+from scraper_registry import SCRAPERS, ADMIN_ROLE, run_scraper
+from spans import RECORDER, span
 
-import crawler
-import workflow_scraper as ws
-import user_roles_scraper as urs
-import list_values_scraper as lvs
-import record_catalogs_scraper as rcs
 
-from config import HEADLESS_MODE, PERSIST_BROWSER_PROFILE, CHROME_PROFILE_DIR
+logging.basicConfig(level=logging.INFO, format="%(message)s")
 
+SCRAPER_ROLES = {name: spec.roles for name, spec in SCRAPERS.items()}
 
-logging.basicConfig(level=logging.INFO, format="%(message)s")
 
+def create_driver(debugger_address=None, fast=False):
+    """Start Chrome, or attach to one already running at ``debugger_address``.
+
+    An attached browser (see ``chrome_supervisor.py``) keeps its own flags,
+    profile and NetSuite session, so only the session capabilities are set.
+    ``fast=True`` applies the resource-blocking profile from ``fast_profile``.
+    """
+
+    from selenium import webdriver
+
+    from config import HEADLESS_MODE, PERSIST_BROWSER_PROFILE, CHROME_PROFILE_DIR
+    from fast_profile import apply_fast_options, enable_fast_profile
 
-def create_driver():
     chrome_options = webdriver.ChromeOptions()
+    if fast:
+        apply_fast_options(chrome_options)
+
+    if debugger_address:
+        chrome_options.add_experimental_option("debuggerAddress", debugger_address)
+        driver = webdriver.Chrome(options=chrome_options)
+        if fast:
+            enable_fast_profile(driver)
+        return driver
 
     if HEADLESS_MODE:
         chrome_options.add_argument("--headless=new")
@@ -31,12 +53,28 @@ def create_driver():
         chrome_options.add_argument("--profile-directory=Default")
 
     driver = webdriver.Chrome(options=chrome_options)
+    if fast:
+        enable_fast_profile(driver)
     return driver
 
 
+def release_driver(driver, attached=False):
+    """Quit ``driver``; an attached browser is left running for the next run."""
+
+    if attached:
+        # Stops chromedriver only; quit() would close the supervised Chrome.
+        driver.service.stop()
+    else:
+        driver.quit()
+
+
 def build_driver():
     """Configure and return a Chrome WebDriver respecting HEADLESS_MODE."""
 
+    from selenium import webdriver
+
+    from config import HEADLESS_MODE
+
     options = webdriver.ChromeOptions()
     if HEADLESS_MODE:
         options.add_argument("--headless")
@@ -53,7 +91,7 @@ def parse_args():
         "--scrapers",
         help=(
             "Comma-separated list of scrapers to run. "
-            "Available: crawler, workflows, user-roles, list-values, record-catalogs"
+            f"Available: {', '.join(SCRAPERS)}"
         ),
         default="",
     )
@@ -62,9 +100,173 @@ def parse_args():
         help="JSON list of record-type names for the workflows scraper",
         default=None,
     )
+    parser.add_argument(
+        "--crawl-workers",
+        type=int,
+        default=None,
+        help="Number of concurrent HTTP workers for the crawler scraper (default: crawler.CRAWL_WORKERS)",
+    )
+    parser.add_argument(
+        "--list-workers",
+        type=int,
+        default=None,
+        help="List pages the list-values scraper fetches at once; 1 visits them one by one (default: 6)",
+    )
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Scrape every custom list instead of only those changed since the last run",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted crawl or list-values run from its on-disk frontier or journal",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run the selected scrapers at the same time, each in its own browser session",
+    )
+    parser.add_argument(
+        "--attach",
+        metavar="HOST:PORT",
+        default=None,
+        help="Attach to a Chrome started by chrome_supervisor.py instead of launching one",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip images, fonts, stylesheets and beacons and return from page loads early",
+    )
+    parser.add_argument(
+        "--profile-webdriver",
+        action="store_true",
+        help="Count and time every WebDriver command and report them per scraper",
+    )
     return parser.parse_args()
 
 
+def build_scrapers(args, records):
+    """Map scraper names to callables that run them on a logged-in driver.
+
+    Each callable passes the options its ``ScraperSpec`` supports (unset ones
+    are left to the scraper's defaults) and imports the scraper on first call.
+    """
+
+    values = {**vars(args), "records": records}
+    scrapers = {}
+    for name, spec in SCRAPERS.items():
+        kwargs = {
+            kwarg: values[option]
+            for option, kwarg in spec.options.items()
+            if values.get(option) is not None
+        }
+        scrapers[name] = functools.partial(run_scraper, spec, **kwargs)
+    return scrapers
+
+
+def scraper_roles(name, records):
+    """Return the roles ``name`` switches through for this run."""
+
+    if name == "workflows":
+        import workflow_scraper as ws
+
+        if records or ws.HARDCODED:
+            # Record types are already known, so the HRA lookup is skipped.
+            return (ADMIN_ROLE,)
+    return SCRAPER_ROLES.get(name, ())
+
+
+def order_by_role(names, records=None):
+    """Order ``names`` to need as few role switches as possible.
+
+    Every ordering is scored by the number of role changes it causes; ties keep
+    the requested order. Duplicates are dropped, so with at most five
+    scrapers this stays cheap.
+    """
+
+    names = list(dict.fromkeys(names))
+
+    def switches(order):
+        active, count = None, 0
+        for name in order:
+            for role in scraper_roles(name, records):
+                if role != active:
+                    active, count = role, count + 1
+        return count
+
+    return list(min(itertools.permutations(names), key=switches)) if names else []
+
+
+def run_timed(name, scraper, driver):
+    """Run one scraper and return ``(name, succeeded, seconds)``."""
+
+    start = time.perf_counter()
+    try:
+        with span(f"scraper.{name}"):
+            scraper(driver)
+        succeeded = True
+    except Exception:
+        logging.exception(f"❌ Scraper {name} failed")
+        succeeded = False
+    return name, succeeded, time.perf_counter() - start
+
+
+def profiled(profiler, driver, name):
+    """Attribute ``driver``'s WebDriver commands to ``name`` when profiling."""
+
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.scope(driver, name)
+
+
+def report_profile(profiler):
+    """Print and save the per-scraper WebDriver profile, if one was recorded."""
+
+    if profiler is None:
+        return
+    for scope in profiler.scopes:
+        print("\n" + profiler.format_report(scope))
+    profiler.save()
+
+
+def run_parallel(driver, names, scrapers, fast=False, profiler=None):
+    """Run ``names`` at the same time, each on its own logged-in browser session.
+
+    The main driver's cookies (minus the session cookie) seed one pooled
+    browser per scraper, which then logs in to a session of its own so role
+    switches in one scraper cannot affect another. Returns True when every
+    scraper succeeded.
+    """
+
+    import crawler
+    from config import HEADLESS_MODE
+    from driver_pool import DriverPool, create_pool_driver, export_session
+
+    cookies = export_session(driver)
+    factory = functools.partial(create_pool_driver, headless=HEADLESS_MODE, fast=fast)
+    with DriverPool(
+        cookies,
+        size=len(names),
+        driver_factory=factory,
+        fresh_session=True,
+        login=crawler.login_netsuite,
+    ) as pool:
+
+        def run_one(pooled_driver, name):
+            if profiler is not None:
+                profiler.install(pooled_driver)
+            with profiled(profiler, pooled_driver, name):
+                return run_timed(name, scrapers[name], pooled_driver)
+
+        results = pool.map(run_one, names)
+
+    print("\n⏱️ Scraper timings:")
+    for name, succeeded, seconds in results:
+        print(f"  {'✅' if succeeded else '❌'} {name:<16} {seconds:8.1f}s")
+    return all(succeeded for _, succeeded, _ in results)
+
+
 def main():
     args = parse_args()
 
@@ -78,33 +280,61 @@ def main():
             )
             sys.exit(1)
 
-    driver = create_driver()
-
-    scrapers = {
-        "crawler": lambda d: crawler.run(d),
-        "workflows": lambda d: ws.run(d, records),
-        "user-roles": lambda d: urs.run(d),
-        "list-values": lambda d: lvs.run(d),
-        "record-catalogs": lambda d: rcs.run(d),
-    }
-
-    crawler.login_netsuite(driver)
-
     requested = [s.strip() for s in args.scrapers.split(",") if s.strip()]
-    valid = [s for s in requested if s in scrapers]
+    # Each scraper once, in the requested order (order_by_role tries every ordering).
+    valid = list(dict.fromkeys(s for s in requested if s in SCRAPERS))
 
     if not valid:
+        # Checked before the browser starts, so a typo costs nothing.
         print("No valid scrapers specified. Available scrapers:")
-        print(", ".join(scrapers.keys()))
-        driver.quit()
+        for spec in SCRAPERS.values():
+            print(f"  {spec.name:<16} {spec.description} → {', '.join(spec.outputs)}")
         return
 
-    for name in valid:
-        scrapers[name](driver)
+    import crawler
+    from fast_profile import fast_profile_requested
+
+    # Timing spans → run_spans.jsonl / run_summary.json, even if a scraper fails.
+    atexit.register(RECORDER.save)
 
-    driver.quit()
+    fast = fast_profile_requested(args.fast)
+    driver = create_driver(args.attach, fast)
+    attached = bool(args.attach)
+
+    scrapers = build_scrapers(args, records)
+
+    profiler = None
+    if args.profile_webdriver:
+        from webdriver_profiler import WebDriverProfiler
+
+        profiler = WebDriverProfiler()
+        profiler.install(driver)
+
+    with profiled(profiler, driver, "login"):
+        logged_in = crawler.login_netsuite(driver)
+    if not logged_in:
+        print("❌ Could not log in to NetSuite.")
+        release_driver(driver, attached)
+        report_profile(profiler)
+        sys.exit(1)
+
+    if args.parallel and len(valid) > 1:
+        try:
+            succeeded = run_parallel(driver, valid, scrapers, fast, profiler)
+        finally:
+            release_driver(driver, attached)
+            report_profile(profiler)
+        sys.exit(0 if succeeded else 1)
+
+    try:
+        for name in order_by_role(valid, records):
+            with profiled(profiler, driver, name), span(f"scraper.{name}"):
+                scrapers[name](driver)
+    finally:
+        report_profile(profiler)
+
+    release_driver(driver, attached)
 
 
 if __name__ == "__main__":
     main()
-
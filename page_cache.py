@@ -0,0 +1,127 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+PAGE_CACHE_FILE = "page_cache.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT NOT NULL,
+    role TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT NOT NULL,
+    links TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (url, role)
+);
+"""
+
+CachedPage = namedtuple("CachedPage", "etag last_modified content_hash links")
+
+
+def content_hash(content):
+    """Return the SHA-256 hex digest of a page body (``bytes`` or ``str``)."""
+
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+class PageCache:
+    """On-disk HTTP cache of crawled pages and the links found on them.
+
+    Entries are keyed by canonical URL and NetSuite role, since the same page
+    shows different links per role. Each entry keeps the ``ETag`` and
+    ``Last-Modified`` validators for conditional requests plus a hash of the
+    body, so an unchanged page can reuse its cached link set without being
+    parsed again. Safe to share between crawl worker threads.
+    """
+
+    def __init__(self, path=PAGE_CACHE_FILE, role=""):
+        self.path = path
+        self.role = role or ""
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def get(self, url):
+        """Return the :class:`CachedPage` for ``url`` or ``None``."""
+
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, content_hash, links FROM pages "
+                "WHERE url = ? AND role = ?",
+                (url, self.role),
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, digest, links = row
+        return CachedPage(etag, last_modified, digest, json.loads(links))
+
+    @staticmethod
+    def conditional_headers(page):
+        """Build ``If-None-Match``/``If-Modified-Since`` headers for a cached page."""
+
+        headers = {}
+        if page is not None:
+            if page.etag:
+                headers["If-None-Match"] = page.etag
+            if page.last_modified:
+                headers["If-Modified-Since"] = page.last_modified
+        return headers
+
+    def reuse(self, url, page, response):
+        """Return the cached links when ``response`` shows the page is unchanged.
+
+        A ``304 Not Modified`` or a body with the same content hash counts as
+        unchanged. Returns ``None`` when the page must be parsed again.
+        """
+
+        if page is None or (
+            response.status_code != 304
+            and content_hash(response.content) != page.content_hash
+        ):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            self.conn.execute(
+                "UPDATE pages SET fetched_at = ? WHERE url = ? AND role = ?",
+                (time.time(), url, self.role),
+            )
+            self.conn.commit()
+        return set(page.links)
+
+    def put(self, url, response, links):
+        """Store the validators, body hash and extracted ``links`` for ``url``."""
+
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(url, role, etag, last_modified, content_hash, links, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    self.role,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    content_hash(response.content),
+                    json.dumps(sorted(links)),
+                    time.time(),
+                ),
+            )
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
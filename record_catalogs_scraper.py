@@ -20,6 +20,8 @@ import time
 from datetime import datetime
 
 from auth_utils import switch_to_admin_role as _switch_to_admin_role
+from fast_profile import full_resources
+from spans import timed
 
 
 logger = logging.getLogger(__name__)
@@ -257,6 +259,7 @@ def switch_to_admin_role(driver):
     _switch_to_admin_role(driver, ADMIN_ROLE_URL)
 
 
+@timed()
 def navigate_to_record_catalog(driver):
     logger.info("➡️ Navigating to Record Catalog…")
     driver.get(RECORD_CATALOG_URL)
@@ -436,6 +439,7 @@ def ensure_left_records_tab(driver, timeout=10):
         pass
 
 
+@timed(attrs=("tab_name",))
 def select_catalog_tab(driver, tab_name, timeout=15):
     """
     Selects one of the right-side detail tabs: Overview, Fields, or Joins.
@@ -597,6 +601,7 @@ def extract_record_identity(record_item):
     return record_name, record_id
 
 
+@timed()
 def expand_record(driver, record_item):
     """
     Expands one top-level record so the child 'SuiteScript and REST Query API'
@@ -629,6 +634,7 @@ def expand_record(driver, record_item):
     return parent_id, child
 
 
+@timed()
 def collapse_record(driver, parent_id):
     """
     Collapse after each scrape so data-index scrolling remains predictable.
@@ -699,6 +705,7 @@ def record_tokens(record_name, record_id):
     return [t for t in dict.fromkeys(tokens) if t]
 
 
+@timed(attrs=("record_name",))
 def wait_for_grid_to_match_record(driver, record_name, record_id, old_signature="", timeout=25):
     """
     Wait until the visible right-side Fields grid belongs to the selected record,
@@ -1617,6 +1624,7 @@ def read_visible_grid_rows(driver, record_name, record_id, parent_lookup=None, n
     return parsed
 
 
+@timed(attrs=("record_name",))
 def scrape_fields_grid(driver, record_name, record_id, max_scrolls=180):
     """
     Scrapes all rows from the Fields tab, including nested/subfield rows exposed
@@ -2111,6 +2119,7 @@ def wait_for_joins_grid_ready(driver, record_name, record_id, timeout=None):
     return None
 
 
+@timed(attrs=("record_name",))
 def scrape_joins_grid(driver, record_name, record_id, max_scrolls=220):
     """
     Scrapes the Joins tab into a separate CSV output.
@@ -2550,6 +2559,7 @@ def remove_existing_record_rows(rows, record_id, record_name=""):
     ]
 
 
+@timed()
 def scrape_record_catalogs(driver):
     logger.info("🔎 Scraping Record Catalogs…")
 
@@ -2955,9 +2965,10 @@ def save_joins(rows, filename=FINAL_JOINS_FILE):
 
 def run(driver):
     switch_to_admin_role(driver)
-    navigate_to_record_catalog(driver)
-
-    field_rows, join_rows = scrape_record_catalogs(driver)
+    # The catalog tree and grids are virtualised from computed layout.
+    with full_resources(driver):
+        navigate_to_record_catalog(driver)
+        field_rows, join_rows = scrape_record_catalogs(driver)
 
     save_fields(field_rows, FINAL_FIELDS_FILE)
     save_joins(join_rows, FINAL_JOINS_FILE)
@@ -0,0 +1,418 @@
+"""Keep logged-in browsers warm and run scrape jobs sent over local HTTP.
+
+Start the daemon once (optionally attached to ``chrome_supervisor.py``)::
+
+    python scrape_daemon.py serve --port 8765 --workers 2
+
+then submit jobs from another terminal; progress streams back as JSON lines::
+
+    python scrape_daemon.py submit list-values,user-roles
+    python scrape_daemon.py submit workflows --records '["Feedback"]'
+
+The HTTP API listens on 127.0.0.1 only:
+
+- ``POST /jobs`` with ``{"scrapers": [...], "records": [...]}`` queues a job and
+  streams its events (pass ``"stream": false`` to get ``{"id": ...}`` back).
+- ``GET /jobs`` lists jobs; ``GET /jobs/<id>`` returns one job's state.
+- ``GET /jobs/<id>/events`` streams a job's events from the start.
+"""
+
+import argparse
+import contextvars
+import functools
+import itertools
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+import urllib.request
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from spans import RECORDER
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DAEMON_WORKERS = 1
+# The daemon runs for days: finished jobs beyond this many are forgotten, and
+# each job keeps only its latest events (followers see a gap, not a stall).
+FINISHED_JOBS_KEPT = 50
+MAX_JOB_EVENTS = 5000
+
+# Job whose scrapers are running in this context. Worker threads started by
+# the crawler and the driver pool copy the context, so their logs follow it.
+_current_job = contextvars.ContextVar("scrape_job", default=None)
+
+
+class Job:
+    """One queued scrape request and the events it has produced so far."""
+
+    def __init__(self, job_id, scrapers, records=None, options=None):
+        self.id = job_id
+        self.scrapers = scrapers
+        self.records = records
+        self.options = options or {}
+        self.status = "queued"
+        self.events = deque(maxlen=MAX_JOB_EVENTS)
+        self._emitted = 0  # events ever emitted; events[0] is number _emitted - len(events)
+        self._changed = threading.Condition()
+        self.emit("queued", scrapers=scrapers)
+
+    @property
+    def finished(self):
+        return self.status in ("succeeded", "failed")
+
+    def emit(self, event, **fields):
+        with self._changed:
+            self.events.append({"event": event, "job": self.id, "time": time.time(), **fields})
+            self._emitted += 1
+            self._changed.notify_all()
+
+    def finish(self, succeeded):
+        with self._changed:
+            self.status = "succeeded" if succeeded else "failed"
+        self.emit("finished", status=self.status)
+
+    def event_list(self):
+        with self._changed:
+            return list(self.events)
+
+    def iter_events(self, timeout=1.0):
+        """Yield every retained event, waiting for new ones until the job finishes."""
+
+        index = 0  # number of the next event to yield
+        while True:
+            with self._changed:
+                while index >= self._emitted and not self.finished:
+                    self._changed.wait(timeout)
+                first = self._emitted - len(self.events)
+                pending = list(self.events)[max(index - first, 0):]
+                index = self._emitted
+                done = self.finished
+            yield from pending
+            if done:
+                with self._changed:
+                    if index >= self._emitted:
+                        return
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "scrapers": self.scrapers,
+            "records": self.records,
+            "status": self.status,
+        }
+
+
+class _JobLogHandler(logging.Handler):
+    """Forward log records to the job running in the logging thread's context."""
+
+    def emit(self, record):
+        job = _current_job.get()
+        if job is not None:
+            job.emit("log", level=record.levelname, message=record.getMessage())
+
+
+class ScrapeDaemon:
+    """Run queued jobs on a set of already logged-in drivers.
+
+    Each driver gets a worker thread that takes the next job off a shared
+    queue, so up to ``len(drivers)`` jobs run at once. Jobs list the
+    scrapers to run (ordered by ``main.order_by_role``), plus the options
+    ``main.build_scrapers`` understands.
+    """
+
+    def __init__(self, drivers, login=None):
+        import main
+
+        self._main = main
+        self.drivers = list(drivers)
+        self.login = login
+        self.jobs = {}
+        self._queue = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._log_handler = _JobLogHandler()
+        self._workers = []
+        # Scrapers write fixed files (crawl frontier, list-values journal), so
+        # one scraper never runs in two jobs at once; other scrapers can.
+        self._scraper_locks = {name: threading.Lock() for name in main.SCRAPER_ROLES}
+
+    def start(self):
+        logging.getLogger().addHandler(self._log_handler)
+        for index, driver in enumerate(self.drivers):
+            worker = threading.Thread(
+                target=self._work, args=(driver,), name=f"scrape-worker-{index}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+        logger.info(f"🔥 Scrape daemon ready with {len(self.drivers)} warm browser(s)")
+
+    def stop(self):
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        logging.getLogger().removeHandler(self._log_handler)
+
+    def submit(self, scrapers, records=None, options=None):
+        """Queue a job and return it; raises ValueError for unknown scrapers."""
+
+        if isinstance(scrapers, str):
+            scrapers = [s.strip() for s in scrapers.split(",") if s.strip()]
+        if not isinstance(scrapers, list) or not all(isinstance(s, str) for s in scrapers):
+            raise ValueError("scrapers must be a list of scraper names")
+        scrapers = list(dict.fromkeys(scrapers))
+        unknown = [s for s in scrapers if s not in self._main.SCRAPER_ROLES]
+        if not scrapers or unknown:
+            raise ValueError(
+                f"Unknown scrapers {unknown}; available: {', '.join(self._main.SCRAPER_ROLES)}"
+            )
+        with self._lock:
+            job = Job(next(self._ids), scrapers, records, options)
+            self.jobs[job.id] = job
+            self._evict_finished()
+        self._queue.put(job)
+        logger.info(f"📥 Queued job {job.id}: {', '.join(scrapers)}")
+        return job
+
+    def _evict_finished(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[:max(len(finished) - FINISHED_JOBS_KEPT, 0)]:
+            del self.jobs[job_id]
+
+    def _work(self, driver):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            token = _current_job.set(job)
+            try:
+                self.run_job(driver, job)
+            finally:
+                _current_job.reset(token)
+            try:
+                # Timing spans go to disk per job, not all at shutdown.
+                RECORDER.flush()
+            except OSError as e:
+                logger.warning(f"⚠️ Could not save timing spans: {e}")
+            with self._lock:
+                self._evict_finished()
+
+    def run_job(self, driver, job):
+        job.status = "running"
+        job.emit("started", worker=threading.current_thread().name)
+        succeeded = True
+        try:
+            # Cheap when the session is still alive; logs in again when it expired.
+            if self.login is not None and not self.login(driver):
+                raise RuntimeError("NetSuite login failed")
+            args = argparse.Namespace(
+                crawl_workers=job.options.get("crawl_workers"),
+                list_workers=job.options.get("list_workers"),
+                full_refresh=bool(job.options.get("full_refresh", False)),
+                resume=bool(job.options.get("resume", False)),
+            )
+            scrapers = self._main.build_scrapers(args, job.records)
+            for name in self._main.order_by_role(job.scrapers, job.records):
+                lock = self._scraper_locks[name]
+                if not lock.acquire(blocking=False):
+                    job.emit("scraper_waiting", scraper=name)
+                    lock.acquire()
+                try:
+                    job.emit("scraper_started", scraper=name)
+                    _, ok, seconds = self._main.run_timed(name, scrapers[name], driver)
+                finally:
+                    lock.release()
+                job.emit("scraper_finished", scraper=name, succeeded=ok, seconds=round(seconds, 3))
+                succeeded = succeeded and ok
+        except Exception as e:
+            logger.exception(f"❌ Job {job.id} failed")
+            job.emit("error", message=str(e))
+            succeeded = False
+        job.finish(succeeded)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    daemon = None  # set by make_server
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, job):
+        # HTTP/1.0 without Content-Length: the body ends when the job does.
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        try:
+            for event in job.iter_events():
+                self.wfile.write(json.dumps(event).encode("utf-8") + b"\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            logger.info(f"ℹ️ Client stopped following job {job.id}; it keeps running.")
+
+    def _job(self, part):
+        try:
+            return self.daemon.jobs.get(int(part))
+        except ValueError:
+            return None
+
+    def do_GET(self):
+        parts = [p for p in self.path.split("?")[0].split("/") if p]
+        if parts == ["jobs"]:
+            return self._send_json(200, [job.to_dict() for job in list(self.daemon.jobs.values())])
+        if len(parts) in (2, 3) and parts[0] == "jobs":
+            job = self._job(parts[1])
+            if job is None:
+                return self._send_json(404, {"error": "no such job"})
+            if len(parts) == 2:
+                return self._send_json(200, {**job.to_dict(), "events": job.event_list()})
+            if parts[2] == "events":
+                return self._stream(job)
+        self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path.split("?")[0].rstrip("/") != "/jobs":
+            return self._send_json(404, {"error": "not found"})
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            job = self.daemon.submit(
+                payload.get("scrapers", []), payload.get("records"), payload.get("options")
+            )
+        except ValueError as e:
+            return self._send_json(400, {"error": str(e)})
+        if payload.get("stream", True):
+            return self._stream(job)
+        self._send_json(202, {"id": job.id})
+
+
+def make_server(daemon, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Return an HTTP server that hands requests to ``daemon``."""
+
+    handler = type("ScrapeDaemonHandler", (_Handler,), {"daemon": daemon})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def submit_job(scrapers, records=None, options=None, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Send a job to a running daemon and yield its events as they arrive."""
+
+    payload = {"scrapers": scrapers, "records": records, "options": options or {}}
+    request = urllib.request.Request(
+        f"http://{host}:{port}/jobs",
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request) as response:
+        for line in response:
+            if line.strip():
+                yield json.loads(line)
+
+
+def serve(args):
+    import crawler
+    import main
+    from config import HEADLESS_MODE
+    from driver_pool import DriverPool, create_pool_driver
+    from fast_profile import fast_profile_requested
+
+    fast = fast_profile_requested(args.fast)
+    driver = main.create_driver(args.attach, fast)
+    if not crawler.login_netsuite(driver):
+        main.release_driver(driver, bool(args.attach))
+        raise SystemExit("❌ Could not log in to NetSuite.")
+    drivers, pool = [driver], None
+    if args.workers > 1:
+        factory = functools.partial(create_pool_driver, headless=HEADLESS_MODE, fast=fast)
+        pool = DriverPool.from_driver(
+            driver,
+            size=args.workers - 1,
+            driver_factory=factory,
+            fresh_session=True,
+            login=crawler.login_netsuite,
+        )
+        drivers += pool.drivers
+
+    daemon = ScrapeDaemon(drivers, login=crawler.login_netsuite)
+    server = make_server(daemon, args.host, args.port)
+    daemon.start()
+    logger.info(f"🌐 Listening on http://{args.host}:{args.port}/jobs (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("🛑 Stopping scrape daemon…")
+    finally:
+        server.server_close()
+        daemon.stop()
+        if pool is not None:
+            pool.close()
+        main.release_driver(driver, bool(args.attach))
+        RECORDER.flush()
+
+
+def submit(args):
+    records = json.loads(args.records) if args.records else None
+    options = {"resume": args.resume}
+    if args.crawl_workers is not None:
+        options["crawl_workers"] = args.crawl_workers
+    succeeded = False
+    for event in submit_job(args.scrapers, records, options, args.host, args.port):
+        if event["event"] == "log":
+            print(event["message"])
+        elif event["event"] == "scraper_finished":
+            mark = "✅" if event["succeeded"] else "❌"
+            print(f"{mark} {event['scraper']} in {event['seconds']:.1f}s")
+        elif event["event"] == "finished":
+            succeeded = event["status"] == "succeeded"
+        else:
+            print(f"ℹ️ {event['event']} (job {event['job']})")
+    sys.exit(0 if succeeded else 1)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Warm-browser scrape daemon")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="Log in and wait for jobs")
+    serve_parser.add_argument(
+        "--workers", type=int, default=DAEMON_WORKERS, help="Warm browsers, i.e. jobs run at once"
+    )
+    serve_parser.add_argument(
+        "--attach", metavar="HOST:PORT", default=None, help="Use a Chrome from chrome_supervisor.py"
+    )
+    serve_parser.add_argument(
+        "--fast", action="store_true", help="Use the resource-blocking browser profile"
+    )
+
+    submit_parser = commands.add_parser("submit", help="Send a job to a running daemon")
+    submit_parser.add_argument("scrapers", help="Comma-separated list of scrapers to run")
+    submit_parser.add_argument("--records", default=None, help="JSON list of record-type names")
+    submit_parser.add_argument(
+        "--crawl-workers", type=int, default=None, help="Defaults to crawler.CRAWL_WORKERS"
+    )
+    submit_parser.add_argument("--resume", action="store_true")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = parse_args()
+    if args.command == "serve":
+        serve(args)
+    else:
+        submit(args)
@@ -0,0 +1,94 @@
+"""Registry of the available scrapers and what each one needs.
+
+Scraper modules pull in selenium, bs4 and ``config`` (``record_catalogs_scraper``
+alone is ~3,000 lines), so they are only imported when a scraper actually
+runs. Everything the CLI needs to validate, order and describe a run lives in
+the ``ScraperSpec`` entries below.
+"""
+
+import importlib
+from collections import namedtuple
+
+ADMIN_ROLE = "1114"
+HRA_ROLE = "1059"
+CATALOG_ROLE = "1073"
+
+ScraperSpec = namedtuple(
+    "ScraperSpec",
+    ["name", "module", "entry_point", "roles", "outputs", "options", "description"],
+)
+ScraperSpec.__doc__ = """A scraper's lazily imported entry point and metadata.
+
+``module.entry_point(driver, **kwargs)`` runs the scraper. ``roles`` are the
+role IDs it switches through, in order. ``outputs`` are the files it writes.
+``options`` maps CLI option names to the entry point's keyword arguments.
+"""
+
+
+def load_entry_point(spec):
+    """Import ``spec.module`` and return its entry point."""
+
+    return getattr(importlib.import_module(spec.module), spec.entry_point)
+
+
+def run_scraper(spec, driver, **kwargs):
+    """Run ``spec`` on ``driver``, importing the scraper module on first use."""
+
+    return load_entry_point(spec)(driver, **kwargs)
+
+
+SCRAPERS = {
+    spec.name: spec
+    for spec in (
+        ScraperSpec(
+            name="crawler",
+            module="crawler",
+            entry_point="run",
+            roles=(),  # crawls in whatever role is active
+            outputs=("crawl_nodes.csv", "crawl_edges.csv", "crawl_edges.jsonl", "crawl_frontier.sqlite3"),
+            options={"crawl_workers": "workers", "resume": "resume"},
+            description="Site crawler that maps every reachable NetSuite page",
+        ),
+        ScraperSpec(
+            name="workflows",
+            module="workflow_scraper",
+            entry_point="run",
+            roles=(HRA_ROLE, ADMIN_ROLE),
+            outputs=("workflow_actions.csv",),
+            options={"records": "records"},
+            description="Workflow states and actions per record type",
+        ),
+        ScraperSpec(
+            name="user-roles",
+            module="user_roles_scraper",
+            entry_point="run",
+            roles=(ADMIN_ROLE,),
+            outputs=("user_role_permissions.csv",),
+            options={},
+            description="Permissions of every role",
+        ),
+        ScraperSpec(
+            name="list-values",
+            module="list_values_scraper",
+            entry_point="run",
+            roles=(ADMIN_ROLE,),
+            outputs=(
+                "list_values.csv",
+                "list_values_changes.csv",
+                "list_values_state.json",
+                "list_values_journal.jsonl",
+            ),
+            options={"list_workers": "workers", "full_refresh": "full_refresh", "resume": "resume"},
+            description="Values of every custom list",
+        ),
+        ScraperSpec(
+            name="record-catalogs",
+            module="record_catalogs_scraper",
+            entry_point="run",
+            roles=(CATALOG_ROLE,),
+            outputs=("record_catalogs_fields_v2.csv", "record_catalogs_joins_v2.csv"),
+            options={},
+            description="Record Catalog fields and joins",
+        ),
+    )
+}
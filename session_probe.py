@@ -0,0 +1,145 @@
+import logging
+import threading
+import time
+import weakref
+
+import requests
+from selenium.common.exceptions import WebDriverException
+
+from auth_utils import is_login_url
+from config import NETSUITE_BASE_URL
+
+logger = logging.getLogger(__name__)
+
+# Fetched without following redirects or reading the body: an authenticated
+# session gets 200, an expired one a redirect to the login page.
+PROBE_URL = f"{NETSUITE_BASE_URL}/app/center/card.nl?whence="
+PROBE_TIMEOUT = 5
+# How long a positive answer is trusted before probing again.
+PROBE_TTL = 60
+
+
+def browser_cookies(driver):
+    """Return every cookie in the browser via CDP, or ``None`` when CDP is unavailable.
+
+    Unlike ``driver.get_cookies()`` this does not depend on the page that is
+    currently open, so it works straight after startup on ``about:blank``.
+    Cookies use CDP's keys (``expires`` is ``-1`` for session cookies).
+    """
+
+    try:
+        return driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+    except (AttributeError, KeyError, WebDriverException):
+        return None
+
+
+def live_netsuite_cookies(cookies, now=None):
+    """Return the NetSuite cookies in ``cookies`` that have not expired."""
+
+    now = time.time() if now is None else now
+    live = []
+    for cookie in cookies:
+        if "netsuite" not in cookie.get("domain", "").lower():
+            continue
+        expires = cookie.get("expires", cookie.get("expiry", -1))
+        if expires is None or expires <= 0 or expires > now:
+            live.append(cookie)
+    return live
+
+
+def probe_over_http(cookies, url=PROBE_URL, user_agent=None, timeout=PROBE_TIMEOUT):
+    """Ask NetSuite whether ``cookies`` carry a live session.
+
+    Returns True or False, or ``None`` when the answer is inconclusive
+    (network error or an unexpected status).
+    """
+
+    jar = requests.cookies.RequestsCookieJar()
+    for cookie in cookies:
+        jar.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/"),
+        )
+    headers = {"User-Agent": user_agent} if user_agent else None
+    try:
+        response = requests.get(
+            url, cookies=jar, headers=headers, allow_redirects=False, stream=True, timeout=timeout
+        )
+    except requests.RequestException as e:
+        logger.debug(f"Session probe request failed: {e}")
+        return None
+
+    with response:
+        if response.is_redirect:
+            return False if is_login_url(response.headers.get("Location")) else None
+        if response.status_code == 200:
+            return not is_login_url(response.url)
+        if response.status_code in (401, 403):
+            return False
+        return None
+
+
+class SessionProbe:
+    """Cheap check of whether a driver's NetSuite session is still alive.
+
+    Looks at the browser's cookies first (no live NetSuite cookie means no
+    session), then sends one HTTP request with them to ``url`` without
+    rendering anything. Positive answers are cached per driver for ``ttl``
+    seconds so back-to-back scrapers do not probe again.
+    """
+
+    def __init__(self, url=PROBE_URL, ttl=PROBE_TTL, timeout=PROBE_TIMEOUT):
+        self.url = url
+        self.ttl = ttl
+        self.timeout = timeout
+        self._alive_at = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def remember(self, driver):
+        """Record that ``driver`` was just seen logged in."""
+
+        with self._lock:
+            self._alive_at[driver] = time.monotonic()
+
+    def forget(self, driver):
+        with self._lock:
+            self._alive_at.pop(driver, None)
+
+    def check(self, driver):
+        """Return True/False for the session on ``driver``, or ``None`` if unknown."""
+
+        with self._lock:
+            alive_at = self._alive_at.get(driver)
+        if alive_at is not None and time.monotonic() - alive_at < self.ttl:
+            return True
+
+        cookies = browser_cookies(driver)
+        if cookies is None:
+            try:
+                cookies = driver.get_cookies()
+            except WebDriverException:
+                return None
+            if not cookies:
+                # get_cookies() only sees the open page's domain.
+                return None
+        else:
+            cookies = live_netsuite_cookies(cookies)
+            if not cookies:
+                self.forget(driver)
+                return False
+
+        try:
+            user_agent = driver.execute_script("return navigator.userAgent;")
+        except WebDriverException:
+            user_agent = None
+        alive = probe_over_http(cookies, self.url, user_agent, self.timeout)
+        if alive:
+            self.remember(driver)
+        elif alive is False:
+            self.forget(driver)
+        return alive
+
+
+SESSION_PROBE = SessionProbe()
@@ -0,0 +1,174 @@
+"""Phase timing spans for scraper runs.
+
+Time a block with ``span`` or a whole function with ``timed``::
+
+    with span("scrape_record", record=record_name):
+        ...
+
+    @timed(attrs=("record_name",))
+    def scrape_fields_grid(driver, record_name, record_id): ...
+
+Spans nest per thread and are kept in memory. ``RECORDER.save()`` (called by
+``main.py`` at exit) appends them to ``run_spans.jsonl``, one JSON object per
+span tagged with the run ID, and writes a per-phase summary (plus the
+``waits`` summary, when any ran) to ``run_summary.json``, so runs can be
+compared after each NetSuite release.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+
+from webdriver_profiler import percentile
+
+logger = logging.getLogger(__name__)
+
+SPANS_FILE = "run_spans.jsonl"
+SUMMARY_FILE = "run_summary.json"
+
+
+class SpanRecorder:
+    """Collect finished spans and summarise them by phase name."""
+
+    def __init__(self):
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started = time.time()
+        self.spans = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """Time the ``with`` block as phase ``name``; ``attrs`` are stored with it."""
+
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        stack.append(name)
+        started, start = time.time(), time.perf_counter()
+        ok = True
+        try:
+            yield
+        except BaseException:
+            ok = False
+            raise
+        finally:
+            stack.pop()
+            record = {
+                "run": self.run_id,
+                "name": name,
+                "parent": parent,
+                "start": round(started, 3),
+                "seconds": round(time.perf_counter() - start, 4),
+                "ok": ok,
+                "thread": threading.current_thread().name,
+            }
+            if attrs:
+                record["attrs"] = attrs
+            with self._lock:
+                self.spans.append(record)
+
+    def timed(self, name=None, attrs=()):
+        """Decorator: run the function inside a span.
+
+        ``name`` defaults to the function name. Arguments named in ``attrs``
+        are stored on every span, e.g. ``attrs=("record_name",)``.
+        """
+
+        def decorator(func):
+            span_name = name or func.__name__
+            signature = inspect.signature(func) if attrs else None
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                values = {}
+                if signature is not None:
+                    bound = signature.bind_partial(*args, **kwargs).arguments
+                    values = {key: bound[key] for key in attrs if key in bound}
+                with self.span(span_name, **values):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def summary(self, spans=None):
+        """Return ``{phase: {count, failed, total_s, mean_s, p50_s, p95_s, max_s}}``."""
+
+        if spans is None:
+            with self._lock:
+                spans = list(self.spans)
+        phases = defaultdict(list)
+        failed = defaultdict(int)
+        for record in spans:
+            phases[record["name"]].append(record["seconds"])
+            failed[record["name"]] += not record["ok"]
+        return {
+            name: {
+                "count": len(seconds),
+                "failed": failed[name],
+                "total_s": round(sum(seconds), 3),
+                "mean_s": round(sum(seconds) / len(seconds), 4),
+                "p50_s": round(percentile(seconds, 50), 4),
+                "p95_s": round(percentile(seconds, 95), 4),
+                "max_s": round(max(seconds), 4),
+            }
+            for name, seconds in sorted(phases.items(), key=lambda item: -sum(item[1]))
+        }
+
+    def save(self, spans_path=SPANS_FILE, summary_path=SUMMARY_FILE):
+        """Append this run's spans to ``spans_path`` and write the summary."""
+
+        with self._lock:
+            spans = list(self.spans)
+        self._write(spans, spans_path, summary_path)
+
+    def flush(self, spans_path=SPANS_FILE, summary_path=SUMMARY_FILE):
+        """Like :meth:`save`, but drop the saved spans from memory.
+
+        For long-running processes (the scrape daemon flushes after every
+        job); the summary then covers the spans since the previous flush.
+        """
+
+        with self._lock:
+            spans, self.spans = self.spans, []
+        self._write(spans, spans_path, summary_path)
+
+    def _write(self, spans, spans_path, summary_path):
+        if not spans:
+            return
+        with open(spans_path, "a", encoding="utf-8") as fh:
+            for record in spans:
+                fh.write(json.dumps(record, default=str) + "\n")
+        report = {
+            "run": self.run_id,
+            "started": round(self.started, 3),
+            "seconds": round(time.time() - self.started, 3),
+            "phases": self.summary(spans),
+        }
+        # waits pulls in selenium, so it is only consulted if a scraper loaded it.
+        waits = sys.modules.get("waits")
+        if waits is not None:
+            report["waits"] = {
+                name: {"count": count, "total_s": round(total, 3)}
+                for name, (count, total) in waits.wait_summary().items()
+            }
+        with open(summary_path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        logger.info(f"⏱️ {len(spans)} timing spans saved to {spans_path}, summary in {summary_path}")
+
+
+RECORDER = SpanRecorder()
+span = RECORDER.span
+timed = RECORDER.timed
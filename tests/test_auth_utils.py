@@ -44,15 +44,15 @@ def test_switch_to_admin_role_headless(monkeypatch):
     monkeypatch.setattr(auth_utils, "HEADLESS_MODE", True)
     monkeypatch.setattr(auth_utils, "WebDriverWait", DummyWait)
     monkeypatch.setattr("builtins.input", lambda _: "123456")
-    sleep_mock = Mock()
-    monkeypatch.setattr(auth_utils.time, "sleep", sleep_mock)
+    url_wait = Mock(return_value=True)
+    monkeypatch.setattr(auth_utils, "wait_for_url_without", url_wait)
 
     auth_utils.switch_to_admin_role(driver, "role_url")
 
     driver.get.assert_called_once_with("role_url")
     two_input.send_keys.assert_called_once_with("123456")
-    driver.execute_script.assert_called_once_with("arguments[0].click();", submit_button)
-    sleep_mock.assert_called_once_with(5)
+    driver.execute_script.assert_any_call("arguments[0].click();", submit_button)
+    url_wait.assert_called_once_with(driver, "loginchallenge/entry.nl")
     driver.quit.assert_not_called()
 
 
@@ -67,11 +67,88 @@ def test_switch_to_admin_role_non_headless(monkeypatch):
 
     monkeypatch.setattr(auth_utils, "HEADLESS_MODE", False)
     monkeypatch.setattr(auth_utils, "WebDriverWait", DummyWait)
-    sleep_mock = Mock()
-    monkeypatch.setattr(auth_utils.time, "sleep", sleep_mock)
+    ready_wait = Mock(return_value=True)
+    monkeypatch.setattr(auth_utils, "wait_for_document_ready", ready_wait)
 
     auth_utils.switch_to_admin_role(driver, "role_url")
 
     driver.get.assert_called_once_with("role_url")
-    sleep_mock.assert_called_once_with(30)
+    ready_wait.assert_called_once_with(driver)
     driver.find_element.assert_not_called()
+
+
+def test_switch_to_admin_role_skips_when_role_already_active(monkeypatch):
+    driver = Mock()
+    driver.current_url = "https://example.com/app/center/card.nl?whence="
+
+    monkeypatch.setattr(auth_utils, "WebDriverWait", DummyWait)
+    role_url = "https://example.com/app/login/secure/changerole.nl?id=123~9203~1114~N"
+
+    auth_utils.switch_to_admin_role(driver, role_url)
+    auth_utils.switch_to_admin_role(driver, role_url)
+
+    driver.get.assert_called_once_with(role_url)
+    assert auth_utils.current_role(driver) == "1114"
+
+    auth_utils.switch_to_admin_role(
+        driver, "https://example.com/app/login/secure/changerole.nl?id=123~9203~1073~N"
+    )
+    assert driver.get.call_count == 2
+    assert auth_utils.current_role(driver) == "1073"
+
+
+def test_role_id_from_url():
+    url = "https://example.com/app/login/secure/changerole.nl?id=4891605~9203~1059~N"
+    assert auth_utils.role_id_from_url(url) == "1059"
+
+
+def test_get_2fa_code_uses_totp_secret(monkeypatch):
+    monkeypatch.setenv(auth_utils.TOTP_SECRET_ENV, "GEZDGNBVGY3TQOJQGEZDGNBVGY3TQOJQ")
+    monkeypatch.setattr(auth_utils.totp, "seconds_remaining", lambda: 30)
+    monkeypatch.setattr(auth_utils.totp.time, "time", lambda: 59)
+    monkeypatch.setattr("builtins.input", Mock(side_effect=AssertionError("prompted")))
+
+    assert auth_utils.get_2fa_code() == "287082"
+
+
+def test_get_2fa_code_prompts_without_secret(monkeypatch):
+    monkeypatch.delenv(auth_utils.TOTP_SECRET_ENV, raising=False)
+    monkeypatch.setattr("builtins.input", lambda _: "654321")
+
+    assert auth_utils.get_2fa_code() == "654321"
+
+
+def test_switch_to_admin_role_fills_totp_code_without_headless(monkeypatch):
+    driver = Mock()
+
+    def get(url):
+        driver.current_url = "https://example.com/loginchallenge/entry.nl"
+
+    driver.get.side_effect = get
+    two_input = Mock()
+    driver.find_element.side_effect = (
+        lambda by, value: two_input if value == "uif56_input" else Mock()
+    )
+
+    monkeypatch.setattr(auth_utils, "HEADLESS_MODE", False)
+    monkeypatch.setattr(auth_utils, "WebDriverWait", DummyWait)
+    monkeypatch.setattr(auth_utils, "wait_for_url_without", Mock(return_value=True))
+    monkeypatch.setenv(auth_utils.TOTP_SECRET_ENV, "GEZDGNBVGY3TQOJQGEZDGNBVGY3TQOJQ")
+    monkeypatch.setattr(auth_utils, "get_2fa_code", lambda: "111222")
+
+    auth_utils.switch_to_admin_role(driver, "role_url_totp")
+
+    two_input.send_keys.assert_called_once_with("111222")
+
+
+def test_session_role_reads_the_page_and_records_it():
+    driver = Mock()
+    driver.execute_script.return_value = "3"
+
+    assert auth_utils.session_role(driver) == "3"
+    assert auth_utils.current_role(driver) == "3"
+
+    unknown = Mock()
+    unknown.execute_script.return_value = None
+    assert auth_utils.session_role(unknown) is None
+    assert auth_utils.current_role(unknown) is None
@@ -0,0 +1,92 @@
+import os
+import sys
+import types
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+# Provide dummy config for the auth_utils import
+sys.modules['config'] = types.SimpleNamespace(HEADLESS_MODE=True)
+
+import browser_fetch
+from selenium.common.exceptions import TimeoutException
+
+
+class FetchDriver:
+    """Pretends to run the fetch script, answering from ``pages``."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.batches = []
+        self.script_timeout = None
+
+    def set_script_timeout(self, timeout):
+        self.script_timeout = timeout
+
+    def execute_async_script(self, script, urls, concurrency, selectors):
+        self.batches.append(list(urls))
+        results = []
+        for url in urls:
+            status, final_url, html = self.pages[url]
+            result = {"url": url, "status": status, "final_url": final_url}
+            if selectors:
+                result["fields"] = {name: [html] for name in selectors}
+            else:
+                result["html"] = html
+            results.append(result)
+        return results
+
+
+PAGES = {
+    f"https://example.com/list/{i}": (200, f"https://example.com/list/{i}", f"<p>{i}</p>")
+    for i in range(5)
+}
+
+
+def test_iter_fetch_sends_one_round_trip_per_batch():
+    driver = FetchDriver(PAGES)
+
+    results = list(browser_fetch.iter_fetch(driver, list(PAGES), batch_size=2))
+
+    assert [r["html"] for r in results] == [f"<p>{i}</p>" for i in range(5)]
+    assert [len(b) for b in driver.batches] == [2, 2, 1]
+    assert driver.script_timeout == browser_fetch.SCRIPT_TIMEOUT
+
+
+def test_fetch_batch_flags_login_redirects_and_passes_selectors():
+    driver = FetchDriver({
+        "https://example.com/a": (200, "https://example.com/app/login/secure/enterpriselogin.nl", ""),
+    })
+
+    result = browser_fetch.fetch_batch(driver, ["https://example.com/a"], selectors={"value": "td"})[0]
+
+    assert result["login_required"] is True
+    assert result["fields"] == {"value": [""]}
+    assert browser_fetch.fetch_batch(driver, []) == []
+
+
+def test_fetch_html_returns_none_for_failed_pages():
+    driver = FetchDriver({
+        "https://example.com/ok": (200, "https://example.com/ok", "<p>ok</p>"),
+        "https://example.com/missing": (404, "https://example.com/missing", "nope"),
+    })
+
+    assert browser_fetch.fetch_html(driver, "https://example.com/ok") == "<p>ok</p>"
+    assert browser_fetch.fetch_html(driver, "https://example.com/missing") is None
+
+
+def test_failed_batch_reports_errors_and_later_batches_still_run():
+    class TimingOutDriver(FetchDriver):
+        def execute_async_script(self, script, urls, concurrency, selectors):
+            if not self.batches:
+                self.batches.append(list(urls))
+                raise TimeoutException("script timeout")
+            return super().execute_async_script(script, urls, concurrency, selectors)
+
+    driver = TimingOutDriver(PAGES)
+
+    results = list(browser_fetch.iter_fetch(driver, list(PAGES), batch_size=2))
+
+    assert [r["status"] for r in results] == [0, 0, 200, 200, 200]
+    assert all(r["error"] for r in results[:2])
+    assert [len(b) for b in driver.batches] == [2, 2, 1]
@@ -0,0 +1,55 @@
+import os
+import sys
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import chrome_supervisor
+
+
+class FakeProcess:
+    def __init__(self, command):
+        self.command = command
+        self.pid = 1234
+
+    def wait(self):
+        return 0
+
+    def poll(self):
+        return 0
+
+
+def test_chrome_command_enables_remote_debugging_on_profile():
+    command = chrome_supervisor.chrome_command("chrome", 9333, "/tmp/profile", headless=True)
+
+    assert command[0] == "chrome"
+    assert "--remote-debugging-port=9333" in command
+    assert "--user-data-dir=/tmp/profile" in command
+    assert "--headless=new" in command
+
+
+def test_debugger_version_returns_none_when_nothing_listens():
+    assert chrome_supervisor.debugger_version(1) is None
+
+
+def test_supervise_restarts_chrome_when_it_exits(monkeypatch):
+    started = []
+    monkeypatch.setattr(chrome_supervisor, "wait_until_ready", lambda port: True)
+    monkeypatch.setattr(chrome_supervisor, "RESTART_DELAY", 0)
+
+    def popen(command):
+        started.append(command)
+        return FakeProcess(command)
+
+    restarts = chrome_supervisor.supervise(["chrome"], 9222, max_restarts=2, popen=popen)
+
+    assert restarts == 2
+    assert len(started) == 3
+
+
+def test_find_chrome_prefers_environment_override(monkeypatch, tmp_path):
+    binary = tmp_path / "chrome"
+    binary.write_text("")
+    monkeypatch.setenv("CHROME_BINARY", str(binary))
+
+    assert chrome_supervisor.find_chrome() == str(binary)
@@ -0,0 +1,57 @@
+import os
+import sys
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import crawl_store
+
+
+def test_store_uses_wal_and_deduplicates(tmp_path):
+    store = crawl_store.CrawlStore(str(tmp_path / "frontier.sqlite3"))
+
+    assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert store.add("https://example.com/a", 0) is True
+    assert store.add("https://example.com/a", 3) is False
+    assert "https://example.com/a" in store
+    assert len(store) == 1
+    store.close()
+
+
+def test_claim_marks_pages_in_progress_and_records_status(tmp_path):
+    store = crawl_store.CrawlStore(str(tmp_path / "frontier.sqlite3"))
+    for i in range(3):
+        store.add(f"https://example.com/{i}", i)
+
+    assert store.claim(2) == [("https://example.com/0", 0), ("https://example.com/1", 1)]
+    store.mark_done("https://example.com/0")
+    store.mark_error("https://example.com/1", ValueError("boom"))
+
+    assert store.status_counts() == {"done": 1, "error": 1, "queued": 1}
+    error, fetched_at = store.conn.execute(
+        "SELECT error, fetched_at FROM pages WHERE url = ?", ("https://example.com/1",)
+    ).fetchone()
+    assert error == "boom"
+    assert fetched_at is not None
+    store.close()
+
+
+def test_resume_requeues_in_flight_pages_and_fresh_start_clears(tmp_path):
+    path = str(tmp_path / "frontier.sqlite3")
+    store = crawl_store.CrawlStore(path)
+    store.add("https://example.com/a", 0)
+    store.add("https://example.com/b", 1)
+    store.claim(2)
+    store.add_edges("https://example.com/a", ["https://example.com/b"])
+    store.mark_done("https://example.com/a")
+    store.close()
+
+    resumed = crawl_store.CrawlStore(path, resume=True)
+    assert resumed.claim(5) == [("https://example.com/b", 1)]
+    assert list(resumed.edges()) == [("https://example.com/a", "https://example.com/b")]
+    resumed.close()
+
+    fresh = crawl_store.CrawlStore(path)
+    assert len(fresh) == 0
+    assert list(fresh.edges()) == []
+    fresh.close()
@@ -1,6 +1,9 @@
 import os
 import sys
+import threading
 import types
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
 import requests
 
 # Ensure repository root on path
@@ -14,6 +17,7 @@ sys.modules['config'] = types.SimpleNamespace(
     SECURITY_ANSWER='',
     ADMIN_ITEM_URL='',
     HEADLESS_MODE=True,
+    NETSUITE_BASE_URL='https://example.com',
 )
 
 import crawler
@@ -67,3 +71,353 @@ def test_extract_links_unique_absolute_urls(monkeypatch):
     links = crawler.extract_links(None, "https://example.com")
 
     assert links == {"https://example.com/page1", "https://example.com/page2"}
+
+
+class Response:
+    def __init__(self, text):
+        self.text = text
+
+
+class MockSession:
+    def __init__(self, response):
+        self.response = response
+        self.urls = []
+
+    def get(self, url):
+        self.urls.append(url)
+        return self.response
+
+
+def test_extract_links_uses_bridged_session():
+    """Authenticated pages come from the bridged session, not the browser."""
+    html = '<html><body><a href="/app/center/card.nl">Home</a></body></html>'
+    session = MockSession(Response(html))
+    driver = MockDriver("")
+
+    links = crawler.extract_links(driver, "https://example.com", session)
+
+    assert session.urls == ["https://example.com"]
+    assert driver.get_called_with is None
+    assert links == {"https://example.com/app/center/card.nl"}
+
+
+def test_extract_links_skips_malformed_hrefs_only():
+    html = (
+        '<a href="http://[::1/x">Bad IPv6</a>'
+        '<a href="//[bad">Bad host</a>'
+        '<a href="/page1">Page1</a>'
+    )
+
+    links = crawler.extract_links(MockDriver(""), "https://example.com", MockSession(Response(html)))
+
+    assert links == {"https://example.com/page1"}
+
+
+def test_extract_links_browser_fallback_for_login_or_script_pages(monkeypatch):
+    """A login redirect (None) or a script-only shell falls back to Selenium."""
+    monkeypatch.setattr(crawler.time, "sleep", lambda _: None)
+    html = '<html><body><a href="/rendered">Rendered</a></body></html>'
+
+    for response in (None, Response("<html><script>render()</script></html>")):
+        driver = MockDriver(html)
+        links = crawler.extract_links(driver, "https://example.com", MockSession(response))
+
+        assert driver.get_called_with == "https://example.com"
+        assert links == {"https://example.com/rendered"}
+
+
+class InPageFetchDriver(MockDriver):
+    def set_script_timeout(self, timeout):
+        pass
+
+    def execute_async_script(self, script, urls, concurrency, selectors):
+        return [{"url": urls[0], "status": 200, "final_url": urls[0], "html": self.page_source}]
+
+
+def test_extract_links_fetches_in_page_before_navigating():
+    """A login redirect on the HTTP path is retried with fetch() inside the browser."""
+    html = '<html><body><a href="/in-page">In page</a></body></html>'
+    driver = InPageFetchDriver(html)
+
+    links = crawler.extract_links(driver, "https://example.com", MockSession(None))
+
+    assert driver.get_called_with is None
+    assert links == {"https://example.com/in-page"}
+
+
+FIXTURE_SITE = os.path.join(os.path.dirname(__file__), "fixtures", "crawl_site")
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=FIXTURE_SITE, **kwargs)
+
+    def log_message(self, *args):
+        pass
+
+
+class CrawlDriver:
+    """Stand-in for a logged-in browser sitting on the fixture dashboard."""
+
+    def __init__(self, start_url):
+        self.current_url = start_url
+        self.page_source = ""
+        self.visited_in_browser = []
+
+    def get_cookies(self):
+        return [{"name": "JSESSIONID", "value": "fixture"}]
+
+    def execute_script(self, script):
+        return "Mozilla/5.0 (Test)"
+
+    def get(self, url):
+        self.visited_in_browser.append(url)
+
+
+def serve_fixture_site():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def test_concurrent_crawl_matches_sequential_crawl(monkeypatch, tmp_path):
+    monkeypatch.setattr(crawler.time, "sleep", lambda _: None)
+    server, base = serve_fixture_site()
+    try:
+        expected = {
+            f"{base}/index.html",
+            f"{base}/app/center/card.html",
+            f"{base}/app/common/custom/custlists.html",
+            f"{base}/app/common/custom/custlist_1.html",
+            f"{base}/app/common/custom/custlist_2.html",
+            f"{base}/app/setup/rolelist.html",
+            f"{base}/app/setup/missing.html",
+        }
+
+        sequential = crawler.crawl_netsuite(
+            CrawlDriver(f"{base}/index.html"),
+            workers=1,
+            base_url=base,
+            db_path=str(tmp_path / "sequential.sqlite3"),
+            cache_path=None,
+        )
+        driver = CrawlDriver(f"{base}/index.html")
+        graph = crawler.LinkGraph()
+        concurrent = crawler.crawl_netsuite(
+            driver,
+            workers=4,
+            base_url=base,
+            db_path=str(tmp_path / "concurrent.sqlite3"),
+            cache_path=None,
+            graph=graph,
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert sequential == expected
+    assert concurrent == expected
+    # Only the 404 page needs the browser; everything else stays on HTTP.
+    assert driver.visited_in_browser == [f"{base}/app/setup/missing.html"]
+    assert set(graph.urls) == expected
+    edges = {(graph.urls[s], graph.urls[t]) for s, t in graph.edges()}
+    assert (f"{base}/app/center/card.html", f"{base}/app/setup/rolelist.html") in edges
+    assert len(edges) == len(graph) == 11
+
+
+def test_resumed_crawl_only_fetches_unfinished_pages(monkeypatch, tmp_path):
+    monkeypatch.setattr(crawler.time, "sleep", lambda _: None)
+    db_path = str(tmp_path / "frontier.sqlite3")
+    server, base = serve_fixture_site()
+    fetched = []
+    real_extract_links = crawler.extract_links
+
+    def recording_extract_links(driver, url, *args):
+        fetched.append(url)
+        return real_extract_links(driver, url, *args)
+
+    monkeypatch.setattr(crawler, "extract_links", recording_extract_links)
+    try:
+        # Simulate a run that died after the dashboard with the lists page in flight.
+        store = crawler.CrawlStore(db_path)
+        store.add(f"{base}/index.html", 0)
+        store.claim(1)
+        first_links = [f"{base}{path}" for path in ("/app/center/card.html", "/app/common/custom/custlists.html")]
+        store.add_edges(f"{base}/index.html", first_links)
+        store.mark_done(f"{base}/index.html")
+        for url in first_links:
+            store.add(url, 1)
+        store.claim(1)
+        store.close()
+
+        graph = crawler.LinkGraph()
+        visited = crawler.crawl_netsuite(
+            CrawlDriver(f"{base}/index.html"),
+            base_url=base,
+            db_path=db_path,
+            resume=True,
+            cache_path=None,
+            graph=graph,
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert f"{base}/index.html" not in fetched
+    assert f"{base}/app/center/card.html" in fetched
+    assert f"{base}/app/common/custom/custlists.html" in fetched
+    assert f"{base}/app/common/custom/custlist_2.html" in visited
+    assert len(fetched) == len(visited) - 1
+    # Links found before the interruption are still exported.
+    edges = {(graph.urls[s], graph.urls[t]) for s, t in graph.edges()}
+    assert (f"{base}/index.html", f"{base}/app/center/card.html") in edges
+    assert set(graph.urls) == visited
+
+
+def test_repeat_crawl_reuses_cached_links_for_unchanged_pages(monkeypatch, tmp_path):
+    monkeypatch.setattr(crawler.time, "sleep", lambda _: None)
+    server, base = serve_fixture_site()
+    parsed = []
+    real_iter_hrefs = crawler.iter_hrefs
+
+    def recording_iter_hrefs(html):
+        parsed.append(html)
+        return real_iter_hrefs(html)
+
+    monkeypatch.setattr(crawler, "iter_hrefs", recording_iter_hrefs)
+
+    def crawl():
+        return crawler.crawl_netsuite(
+            CrawlDriver(f"{base}/index.html"),
+            base_url=base,
+            db_path=str(tmp_path / "frontier.sqlite3"),
+            cache_path=str(tmp_path / "cache.sqlite3"),
+        )
+
+    try:
+        first = crawl()
+        first_parsed = len(parsed)
+        parsed.clear()
+        second = crawl()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert second == first
+    assert first_parsed == len(first)
+    # http.server answers If-Modified-Since with 304, so only the 404 page
+    # (served by the browser fallback) is parsed again.
+    assert parsed == [""]
+
+
+def test_is_netsuite_logged_in_trusts_the_session_probe(monkeypatch):
+    monkeypatch.setattr(crawler.SESSION_PROBE, "check", lambda driver: True)
+    driver = MockDriver("")
+
+    assert crawler.is_netsuite_logged_in(driver) is True
+    assert driver.get_called_with is None
+
+
+def test_failed_login_returns_false_and_is_not_cached(monkeypatch):
+    class Element:
+        def send_keys(self, text):
+            pass
+
+        def click(self):
+            pass
+
+    class LoginDriver:
+        current_url = "https://system.netsuite.com/pages/customerlogin.jsp"
+        quit_called = False
+
+        def get(self, url):
+            pass
+
+        def find_element(self, by, value):
+            return Element()
+
+        def quit(self):
+            self.quit_called = True
+
+    remembered = []
+    monkeypatch.setattr(crawler, "is_netsuite_logged_in", lambda driver: False)
+    monkeypatch.setattr(crawler, "wait_for_url_change", lambda driver, url: False)
+    monkeypatch.setattr(crawler, "wait_for_document_ready", lambda driver: True)
+    monkeypatch.setattr(crawler.SESSION_PROBE, "remember", remembered.append)
+    driver = LoginDriver()
+
+    assert crawler.login_netsuite(driver) is False
+    assert remembered == []
+    assert not driver.quit_called
+
+
+def test_run_keys_the_page_cache_by_the_session_role(monkeypatch):
+    seen = {}
+
+    def fake_crawl(driver, **kwargs):
+        seen.update(kwargs)
+        return set()
+
+    monkeypatch.setattr(crawler, "crawl_netsuite", fake_crawl)
+    monkeypatch.setattr(crawler.LinkGraph, "save_csv", lambda self: None)
+    monkeypatch.setattr(crawler.LinkGraph, "save_jsonl", lambda self: None)
+
+    class RoleDriver:
+        current_url = "https://example.com/app/center/card.nl"
+
+        def __init__(self, role):
+            self.role = role
+
+        def execute_script(self, script):
+            return self.role
+
+    crawler.run(RoleDriver("3"))
+    assert seen["role"] == "3" and seen["cache_path"] == crawler.PAGE_CACHE_FILE
+
+    crawler.run(RoleDriver(None))
+    assert seen["cache_path"] is None
+
+
+def test_relogin_after_expiry_forgets_the_switched_role(monkeypatch):
+    import auth_utils
+
+    dashboard = "https://example.com/app/center/card.nl?whence="
+
+    class Element:
+        def __init__(self, driver):
+            self.driver = driver
+
+        def send_keys(self, text):
+            pass
+
+        def click(self):
+            self.driver.current_url = dashboard
+
+    class SessionDriver:
+        current_url = ""
+
+        def __init__(self):
+            self.visited = []
+
+        def get(self, url):
+            self.visited.append(url)
+            self.current_url = dashboard if "changerole.nl" in url else url
+
+        def find_element(self, by, value):
+            return Element(self)
+
+        def execute_script(self, script, *args):
+            return "complete"
+
+    alive = iter([True, False])
+    monkeypatch.setattr(crawler.SESSION_PROBE, "check", lambda driver: next(alive))
+    role_url = "https://example.com/app/login/secure/changerole.nl?id=1~2~1114~N"
+    driver = SessionDriver()
+
+    assert crawler.login_netsuite(driver) is True
+    auth_utils.switch_to_admin_role(driver, role_url)
+    # The session expires; logging in again lands in the default role.
+    assert crawler.login_netsuite(driver) is True
+    auth_utils.switch_to_admin_role(driver, role_url)
+
+    assert [url for url in driver.visited if "changerole.nl" in url] == [role_url, role_url]
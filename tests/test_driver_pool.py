@@ -0,0 +1,103 @@
+import os
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+# Provide dummy config for driver_pool import
+sys.modules['config'] = types.SimpleNamespace(
+    HEADLESS_MODE=True, NETSUITE_BASE_URL='https://example.com'
+)
+
+import driver_pool
+
+COOKIES = [
+    {"name": "JSESSIONID", "value": "abc", "domain": ".example.com", "path": "/",
+     "secure": True, "httpOnly": True, "expiry": 1900000000},
+]
+
+
+class FakeDriver:
+    def __init__(self, profile_dir):
+        self.profile_dir = profile_dir
+        self.cdp_calls = []
+        self.quit_called = False
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_calls.append((cmd, params))
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_pool_injects_session_on_throwaway_profiles():
+    pool = driver_pool.DriverPool(COOKIES, size=2, driver_factory=FakeDriver)
+    drivers = list(pool._drivers)
+    profiles = [d.profile_dir for d in drivers]
+
+    assert len(set(profiles)) == 2
+    assert all(os.path.isdir(p) for p in profiles)
+    assert drivers[0].cdp_calls == [("Network.setCookies", {"cookies": [{
+        "name": "JSESSIONID", "value": "abc", "domain": ".example.com", "path": "/",
+        "secure": True, "httpOnly": True, "expires": 1900000000,
+    }]})]
+
+    pool.close()
+
+    assert all(d.quit_called for d in drivers)
+    assert not any(os.path.exists(p) for p in profiles)
+
+
+def test_driver_context_manager_returns_driver_to_pool():
+    with driver_pool.DriverPool(COOKIES, size=1, driver_factory=FakeDriver) as pool:
+        with pool.driver() as first:
+            pass
+        with pool.driver() as second:
+            assert second is first
+
+
+def test_map_spreads_items_across_drivers_in_order():
+    lock = threading.Lock()
+    in_use = set()
+    peak = []
+
+    def work(driver, item):
+        with lock:
+            assert driver not in in_use
+            in_use.add(driver)
+            peak.append(len(in_use))
+        time.sleep(0.01)
+        with lock:
+            in_use.remove(driver)
+        return item * 2
+
+    with driver_pool.DriverPool(COOKIES, size=3, driver_factory=FakeDriver) as pool:
+        assert pool.map(work, range(10)) == [i * 2 for i in range(10)]
+
+    assert max(peak) <= 3
+
+
+def test_failed_login_replaces_the_driver_then_gives_up():
+    created = []
+
+    def factory(profile_dir):
+        created.append(FakeDriver(profile_dir))
+        return created[-1]
+
+    attempts = iter([False, True])
+    with driver_pool.DriverPool(
+        COOKIES, size=1, driver_factory=factory, fresh_session=True, login=lambda d: next(attempts)
+    ) as pool:
+        assert pool.drivers == [created[1]]
+        assert created[0].quit_called and not created[1].quit_called
+
+    created.clear()
+    with pytest.raises(RuntimeError):
+        driver_pool.DriverPool(COOKIES, size=1, driver_factory=factory, fresh_session=True, login=lambda d: False)
+    assert len(created) == driver_pool.LOGIN_ATTEMPTS
+    assert all(d.quit_called for d in created)
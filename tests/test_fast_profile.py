@@ -0,0 +1,83 @@
+import os
+import sys
+import types
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+# Provide dummy config for fast_profile
+sys.modules['config'] = types.SimpleNamespace(
+    NETSUITE_URL='',
+    NETSUITE_EMAIL='',
+    NETSUITE_PASSWORD='',
+    SECURITY_ANSWER='',
+    ADMIN_ITEM_URL='',
+    HEADLESS_MODE=True,
+    NETSUITE_BASE_URL='https://example.com',
+)
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+import fast_profile
+
+
+class CdpDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+        return {}
+
+    def blocked(self):
+        return [p["urls"] for cmd, p in self.commands if cmd == "Network.setBlockedURLs"][-1]
+
+
+def test_fast_options_use_eager_page_loads():
+    options = fast_profile.apply_fast_options(webdriver.ChromeOptions())
+
+    assert options.to_capabilities()["pageLoadStrategy"] == "eager"
+
+
+def test_enable_blocks_images_fonts_styles_and_beacons():
+    driver = CdpDriver()
+
+    assert fast_profile.enable_fast_profile(driver) is True
+
+    blocked = driver.blocked()
+    assert {"*.png", "*.woff2", "*.css", "*google-analytics.com*"} <= set(blocked)
+    assert not any(p.endswith(".js") for p in blocked)
+    assert fast_profile.is_fast(driver)
+
+
+def test_full_resources_lifts_render_blocks_until_outermost_block_exits():
+    driver = CdpDriver()
+    fast_profile.enable_fast_profile(driver)
+
+    with fast_profile.full_resources(driver):
+        assert driver.blocked() == list(fast_profile.ALWAYS_BLOCKED_PATTERNS)
+        with fast_profile.full_resources(driver):
+            pass
+        assert driver.blocked() == list(fast_profile.ALWAYS_BLOCKED_PATTERNS)
+
+    assert driver.blocked() == list(fast_profile.BLOCKED_URL_PATTERNS)
+
+
+def test_full_resources_is_a_no_op_without_the_fast_profile():
+    driver = CdpDriver()
+
+    with fast_profile.full_resources(driver):
+        pass
+
+    assert driver.commands == []
+
+
+def test_enable_reports_missing_cdp():
+    class NoCdp:
+        def execute_cdp_cmd(self, cmd, params):
+            raise WebDriverException("not chrome")
+
+    driver = NoCdp()
+    assert fast_profile.enable_fast_profile(driver) is False
+    assert not fast_profile.is_fast(driver)
@@ -0,0 +1,83 @@
+import os
+import sys
+import types
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+# Provide dummy config for the auth_utils import
+sys.modules['config'] = types.SimpleNamespace(HEADLESS_MODE=True)
+
+import http_session
+
+
+class DummyDriver:
+    def __init__(self, cookies):
+        self.cookies = cookies
+        self.cookie_reads = 0
+
+    def get_cookies(self):
+        self.cookie_reads += 1
+        return self.cookies
+
+    def execute_script(self, script):
+        return "Mozilla/5.0 (Test)"
+
+
+class DummyResponse:
+    def __init__(self, url, text=""):
+        self.url = url
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+def test_bridge_copies_cookies_and_user_agent():
+    driver = DummyDriver([
+        {"name": "JSESSIONID", "value": "abc", "domain": "example.com", "path": "/"},
+    ])
+
+    bridge = http_session.SessionBridge(driver)
+
+    assert bridge.session.cookies.get("JSESSIONID") == "abc"
+    assert bridge.session.headers["User-Agent"] == "Mozilla/5.0 (Test)"
+
+
+def test_bridge_refreshes_cookies_after_login_redirect(monkeypatch):
+    driver = DummyDriver([{"name": "JSESSIONID", "value": "old"}])
+    bridge = http_session.SessionBridge(driver)
+    responses = iter([
+        DummyResponse("https://example.com/app/login/secure/enterpriselogin.nl"),
+        DummyResponse("https://example.com/app/center/card.nl", "ok"),
+    ])
+    monkeypatch.setattr(bridge.session, "get", lambda url, headers, timeout: next(responses))
+
+    response = bridge.get("https://example.com/app/center/card.nl")
+
+    assert response.text == "ok"
+    assert driver.cookie_reads == 2
+
+
+def test_bridge_returns_none_when_still_logged_out(monkeypatch):
+    bridge = http_session.SessionBridge(DummyDriver([]))
+    monkeypatch.setattr(
+        bridge.session,
+        "get",
+        lambda url, headers, timeout: DummyResponse("https://example.com/pages/customerlogin.nl"),
+    )
+
+    assert bridge.get("https://example.com/app/center/card.nl") is None
+
+
+def test_refresh_swaps_in_a_new_cookie_jar():
+    driver = DummyDriver([{"name": "JSESSIONID", "value": "old"}])
+    bridge = http_session.SessionBridge(driver)
+    in_flight = bridge.session.cookies
+
+    driver.cookies = [{"name": "JSESSIONID", "value": "new"}]
+    bridge.sync_from_driver()
+
+    # A request already holding the old jar never sees it half emptied.
+    assert in_flight.get("JSESSIONID") == "old"
+    assert bridge.session.cookies.get("JSESSIONID") == "new"
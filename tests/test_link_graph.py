@@ -0,0 +1,51 @@
+import csv
+import json
+import os
+import sys
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import link_graph
+
+
+def build_graph():
+    graph = link_graph.LinkGraph(chunk_size=2)
+    graph.add_edges("https://example.com/", ["https://example.com/a", "https://example.com/b"])
+    graph.add_edges("https://example.com/a", ["https://example.com/", "https://example.com/b"])
+    return graph
+
+
+def test_urls_are_interned_and_edges_chunked():
+    graph = build_graph()
+
+    assert graph.urls == ["https://example.com/", "https://example.com/a", "https://example.com/b"]
+    assert list(graph.edges()) == [(0, 1), (0, 2), (1, 0), (1, 2)]
+    assert len(graph) == 4
+    assert len(graph._chunks) == 2
+    assert all(chunk.typecode == "I" for chunk in graph._chunks)
+
+
+def test_save_csv_and_jsonl(tmp_path):
+    graph = build_graph()
+    edges_file = tmp_path / "edges.csv"
+    nodes_file = tmp_path / "nodes.csv"
+    jsonl_file = tmp_path / "edges.jsonl"
+
+    graph.save_csv(str(edges_file), str(nodes_file))
+    graph.save_jsonl(str(jsonl_file))
+
+    with open(nodes_file, newline="", encoding="utf-8") as f:
+        assert list(csv.reader(f))[1] == ["0", "https://example.com/"]
+    with open(edges_file, newline="", encoding="utf-8") as f:
+        assert list(csv.reader(f)) == [
+            ["Source ID", "Target ID"], ["0", "1"], ["0", "2"], ["1", "0"], ["1", "2"]
+        ]
+    with open(jsonl_file, encoding="utf-8") as f:
+        first = json.loads(f.readline())
+    assert first == {
+        "source": 0,
+        "target": 1,
+        "source_url": "https://example.com/",
+        "target_url": "https://example.com/a",
+    }
@@ -0,0 +1,36 @@
+import glob
+import os
+import sys
+
+from bs4 import BeautifulSoup
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import link_parser
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "netsuite_pages")
+
+
+def test_iter_hrefs_matches_beautifulsoup_on_saved_pages():
+    pages = sorted(glob.glob(os.path.join(FIXTURES, "*.html")))
+    assert pages
+    for path in pages:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        soup = BeautifulSoup(html, "html.parser")
+        expected = [a["href"] for a in soup.find_all("a", href=True)]
+
+        assert list(link_parser.iter_hrefs(html)) == expected
+
+
+def test_iter_hrefs_handles_tags_split_across_chunks():
+    html = '<p><a class="x" href="/a?id=1&amp;e=T">A</a><A HREF="/b">B</A><a name="top"></a></p>'
+
+    assert list(link_parser.iter_hrefs(html, chunk_size=7)) == ["/a?id=1&e=T", "/b"]
+
+
+def test_iter_hrefs_ignores_markup_inside_scripts():
+    html = "<script>var s = \"<a href='/fake'>\";</script><a href='/real'>real</a>"
+
+    assert list(link_parser.iter_hrefs(html)) == ["/real"]
@@ -1,5 +1,10 @@
+import csv
+import json
+
+import pytest
+
 import list_values_scraper
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import JavascriptException, NoSuchElementException
 
 
 class DummyCell:
@@ -36,3 +41,440 @@ def test_extract_value_with_label():
 def test_extract_value_fallback_second_cell():
     row = DummyRow(fallback='Other')
     assert list_values_scraper._extract_value_from_row(row) == "Other"
+
+
+class ScriptDriver:
+    def __init__(self, payload=None, error=None, rows=()):
+        self.payload = payload
+        self.error = error
+        self.rows = list(rows)
+        self.scripts = 0
+
+    def execute_script(self, script):
+        self.scripts += 1
+        if self.error:
+            raise self.error
+        return self.payload
+
+    def find_elements(self, by, selector):
+        assert selector == list_values_scraper.VALUE_ROWS
+        return self.rows
+
+
+def test_extract_list_values_reads_all_rows_in_one_call():
+    payload = json.dumps([
+        {"row_id": "customvalue_row_1", "value": "Logged"},
+        {"row_id": "customvalue_row_2", "value": "Escalated"},
+    ])
+    driver = ScriptDriver(payload)
+
+    rows = list_values_scraper.extract_list_values(driver)
+
+    assert driver.scripts == 1
+    assert [r["value"] for r in rows] == ["Logged", "Escalated"]
+    assert rows[0]["row_id"] == "customvalue_row_1"
+
+
+def test_extract_list_values_reports_missing_table_or_script_errors():
+    assert list_values_scraper.extract_list_values(ScriptDriver(None)) is None
+    assert list_values_scraper.extract_list_values(
+        ScriptDriver(error=JavascriptException("blocked"))
+    ) is None
+
+
+def test_row_by_row_fallback_keeps_selector_order():
+    driver = ScriptDriver(rows=[
+        DummyRow(elements={'td[data-label="Value"]': 'Escalated'}),
+        DummyRow(fallback=''),
+        DummyRow(fallback='Other'),
+    ])
+
+    assert list_values_scraper._read_values_row_by_row(driver) == ["Escalated", "Other"]
+
+
+LIST_PAGE = """
+<html><body>
+<table id="customvalue_splits">
+<tr class="uir-machine-headerrow"><td>Grip</td><td>Value</td></tr>
+<tr id="customvalue_row_1"><td></td><td data-label="Value">  Logged
+  in </td></tr>
+<tr id="customvalue_row_2"><td></td><td>Escalated</td></tr>
+<tr id="customvalue_row_3"><td></td><td></td></tr>
+</table>
+</body></html>
+"""
+
+
+def test_parse_list_values_uses_the_same_fallbacks_offline():
+    assert list_values_scraper.parse_list_values(LIST_PAGE) == ["Logged in", "Escalated"]
+    assert list_values_scraper.parse_list_values("<html><body>Values</body></html>") is None
+
+
+class ListLink:
+    def __init__(self, name, href):
+        self.text = name
+        self.href = href
+
+    def get_attribute(self, attr):
+        return self.href
+
+
+class ListRow:
+    def __init__(self, name, href, description=""):
+        self.link = ListLink(name, href)
+        self.text = f"Edit | View {name} {description}"
+
+    def find_element(self, by, selector):
+        return self.link
+
+
+class PaginationElement:
+    """``#segment_fs``, its next button and ``#segment`` of a ``ListsDriver``."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def find_element(self, by, selector):
+        return self
+
+    def get_attribute(self, attr):
+        driver = self.driver
+        if attr == "class":
+            return "navig-next" + (" disabled" if driver.page + 1 == driver.total() else "")
+        if attr == "value":
+            return f"{driver.page + 1}\x02{driver.total()}"
+        return None
+
+
+class ListsDriver:
+    """Lists table split into ``index_pages`` pages of rows (default: one page of ``rows``)."""
+
+    def __init__(self, rows, pages, index_pages=None, harvest=True, stuck=False, row_lag=0):
+        self.rows = rows
+        self.stuck = stuck
+        # Segment polls after goToPage during which the old page's rows still show.
+        self.row_lag = row_lag
+        self.lagging = 0
+        self.shown = 0
+        self.pages = pages
+        self.index_pages = index_pages
+        self.harvest = harvest
+        self.page = 0
+        self.batches = 0
+        self.harvests = 0
+
+    def current_rows(self):
+        return self.index_pages[self.shown] if self.index_pages else self.rows
+
+    def find_elements(self, by, selector):
+        return self.current_rows()
+
+    def total(self):
+        return len(self.index_pages or [self.rows])
+
+    def find_element(self, by, selector):
+        if self.total() == 1:
+            raise NoSuchElementException(selector)
+        return PaginationElement(self)
+
+    def execute_script(self, script, *args):
+        total = self.total()
+        segment = f"{self.page + 1}\x02{total}"
+        if script == list_values_scraper.HARVEST_LISTS_SCRIPT:
+            if not self.harvest:
+                raise JavascriptException("harvest blocked")
+            self.harvests += 1
+            rows = [{"name": r.link.text, "href": r.link.href, "text": r.text} for r in self.current_rows()]
+            return json.dumps(
+                {"rows": rows, "has_next": self.page + 1 < total, "segment": segment, "label": None}
+            )
+        if script == list_values_scraper.SEGMENT_STATE_SCRIPT:
+            if self.lagging:
+                self.lagging -= 1
+            else:
+                self.shown = self.page
+            rows = self.current_rows()
+            return [segment, rows[0].link.href if rows else None]
+        if "pointerenter" in script:
+            return None
+        if "goToPage" in script:
+            if not self.stuck:
+                self.page = args[0] - 1
+                self.lagging = self.row_lag
+                if not self.row_lag:
+                    self.shown = self.page
+            return None
+        raise AssertionError(script)
+
+    def set_script_timeout(self, timeout):
+        pass
+
+    def execute_async_script(self, script, urls, concurrency, selectors):
+        self.batches += 1
+        return [dict(self.pages[url], url=url, final_url=url) for url in urls]
+
+
+def list_entries(rows):
+    return [
+        list_values_scraper.ListEntry(
+            list_values_scraper.list_id_from_href(r.link.href), r.link.text, r.link.href, "fp"
+        )
+        for r in rows
+    ]
+
+
+def test_parallel_scrape_falls_back_to_browser_in_table_order(monkeypatch):
+    opened = []
+
+    def in_browser(driver, href):
+        opened.append(href)
+        return [f"browser {href}"]
+
+    monkeypatch.setattr(list_values_scraper, "scrape_list_in_browser", in_browser)
+    rows = [ListRow(f"List {i}", f"https://example.com/custlist.nl?id={i}") for i in range(1, 5)]
+    pages = {
+        rows[0].link.href: {"status": 200, "html": LIST_PAGE},
+        rows[1].link.href: {"status": 500, "html": ""},
+        rows[2].link.href: {"status": 200, "html": "<html>no table</html>"},
+        rows[3].link.href: {"status": 200, "html": LIST_PAGE.replace("Escalated", "Closed")},
+    }
+    driver = ListsDriver(rows, pages)
+
+    results = {
+        entry.name: values
+        for entry, values in list_values_scraper.iter_list_values(driver, list_entries(rows), workers=4)
+    }
+
+    assert driver.batches == 1
+    assert set(results) == {"List 1", "List 2", "List 3", "List 4"}
+    assert results["List 1"] == ["Logged in", "Escalated"]
+    assert results["List 4"] == ["Logged in", "Closed"]
+    assert opened == [rows[1].link.href, rows[2].link.href]
+    assert results["List 2"] == [f"browser {rows[1].link.href}"]
+
+
+def test_single_worker_visits_lists_in_the_browser(monkeypatch):
+    monkeypatch.setattr(list_values_scraper, "scrape_list_in_browser", lambda d, href: [href])
+    rows = [ListRow("Only", "https://example.com/a")]
+    driver = ListsDriver(rows, {})
+
+    scraped = list(list_values_scraper.iter_list_values(driver, list_entries(rows), workers=1))
+
+    assert [(entry.name, values) for entry, values in scraped] == [("Only", ["https://example.com/a"])]
+    assert driver.batches == 0
+
+
+def read_values(path):
+    values = {}
+    with open(path, encoding="utf-8") as f:
+        for name, value in list(csv.reader(f))[1:]:
+            values.setdefault(name, []).append(value)
+    return values
+
+
+def test_refresh_scrapes_only_new_or_changed_lists(monkeypatch, tmp_path):
+    state_path, changes_path = str(tmp_path / "state.json"), str(tmp_path / "changes.csv")
+    scraped = []
+    current_values = {}
+
+    def in_browser(driver, href):
+        scraped.append(href)
+        return current_values[href]
+
+    monkeypatch.setattr(list_values_scraper, "scrape_list_in_browser", in_browser)
+    hrefs = [f"https://example.com/custlist.nl?id={i}" for i in (1, 2, 3)]
+    current_values.update({hrefs[0]: ["A"], hrefs[1]: ["B"], hrefs[2]: ["C"]})
+
+    output_path = str(tmp_path / "values.csv")
+
+    def refresh(rows):
+        list_values_scraper.refresh_list_values(
+            ListsDriver(rows, {}),
+            workers=1,
+            state_path=state_path,
+            changes_path=changes_path,
+            output_path=output_path,
+            journal_path=str(tmp_path / "journal.jsonl"),
+        )
+        return read_values(output_path)
+
+    first = refresh([ListRow(f"List {i}", hrefs[i - 1]) for i in (1, 2, 3)])
+    assert first == {"List 1": ["A"], "List 2": ["B"], "List 3": ["C"]}
+    assert len(scraped) == 3
+    assert not (tmp_path / "journal.jsonl").exists()
+
+    # List 2's row changed, list 3 was deleted, list 1 is untouched.
+    scraped.clear()
+    current_values[hrefs[1]] = ["B", "B2"]
+    second = refresh([ListRow("List 1", hrefs[0]), ListRow("List 2", hrefs[1], "edited")])
+
+    assert scraped == [hrefs[1]]
+    assert second == {"List 1": ["A"], "List 2": ["B", "B2"]}
+    with open(changes_path, encoding="utf-8") as f:
+        report = f.read().splitlines()
+    assert report[1:] == ["2,List 2,changed,1,2", "3,List 3,removed,1,"]
+    with list_values_scraper.load_state(state_path) as state:
+        assert set(state) == {"1", "2"} and state["2"]["count"] == 2
+        # Only summaries stay in memory; values are read back per list.
+        assert "values" not in state["2"]
+        assert state.record("2")["values"] == ["B", "B2"]
+
+
+def test_state_from_a_single_json_object_is_still_read(tmp_path):
+    state_path = tmp_path / "state.json"
+    record = {"name": "List 1", "fingerprint": "fp", "count": 1, "hash": "h", "values": ["A"], "scraped_at": 0}
+    state_path.write_text(json.dumps({"version": 1, "lists": {"1": record}}), encoding="utf-8")
+
+    with list_values_scraper.load_state(str(state_path)) as state:
+        assert state["1"]["fingerprint"] == "fp" and "values" not in state["1"]
+        assert state.record("1")["values"] == ["A"]
+
+
+def test_plan_refresh_rescrapes_stale_entries():
+    entry = list_values_scraper.ListEntry("7", "List 7", "https://example.com/a", "fp")
+    state = {"7": {"fingerprint": "fp", "scraped_at": 0}}
+    day = 86400
+
+    assert list_values_scraper.plan_refresh([entry], state, now=day, max_age_days=7) == []
+    assert list_values_scraper.plan_refresh([entry], state, now=8 * day, max_age_days=7) == [entry]
+
+
+def test_list_index_is_harvested_once_per_page():
+    pages = [
+        [ListRow(f"List {p}{i}", f"https://example.com/custlist.nl?id={p}{i}") for i in range(3)]
+        for p in (1, 2, 3)
+    ]
+    driver = ListsDriver(None, {}, index_pages=pages)
+
+    entries = list_values_scraper.collect_list_entries(driver)
+
+    assert [e.list_id for e in entries] == ["10", "11", "12", "20", "21", "22", "30", "31", "32"]
+    assert driver.harvests == 3
+    assert driver.page == 2
+
+
+def test_list_index_falls_back_to_row_by_row_reads():
+    rows = [ListRow("A", "https://example.com/custlist.nl?id=1"), ListRow("B", "https://example.com/custlist.nl?id=2")]
+    driver = ListsDriver(rows, {}, harvest=False)
+
+    entries = list_values_scraper.collect_list_entries(driver)
+
+    assert [e.name for e in entries] == ["A", "B"]
+    assert entries[0].fingerprint == list_values_scraper._fingerprint(rows[0].text)
+
+
+def test_interrupted_refresh_resumes_from_the_journal(monkeypatch, tmp_path):
+    paths = {
+        "state_path": str(tmp_path / "state.json"),
+        "changes_path": str(tmp_path / "changes.csv"),
+        "output_path": str(tmp_path / "values.csv"),
+        "journal_path": str(tmp_path / "journal.jsonl"),
+    }
+    rows = [ListRow(f"List {i}", f"https://example.com/custlist.nl?id={i}") for i in (1, 2, 3)]
+    scraped = []
+
+    def crash_on_third(driver, href):
+        if href.endswith("3"):
+            raise RuntimeError("browser died")
+        scraped.append(href)
+        return [href[-1]]
+
+    monkeypatch.setattr(list_values_scraper, "scrape_list_in_browser", crash_on_third)
+    try:
+        list_values_scraper.refresh_list_values(ListsDriver(rows, {}), workers=1, **paths)
+    except RuntimeError:
+        pass
+    assert not (tmp_path / "values.csv").exists()
+    # A torn last line from the crash is dropped.
+    with open(paths["journal_path"], "a", encoding="utf-8") as f:
+        f.write('{"list_id": "3", "na')
+
+    scraped.clear()
+    monkeypatch.setattr(list_values_scraper, "scrape_list_in_browser", lambda d, href: scraped.append(href) or ["3"])
+    list_values_scraper.refresh_list_values(ListsDriver(rows, {}), workers=1, resume=True, **paths)
+
+    assert scraped == [rows[2].link.href]
+    assert read_values(paths["output_path"]) == {"List 1": ["1"], "List 2": ["2"], "List 3": ["3"]}
+    with list_values_scraper.load_state(paths["state_path"]) as state:
+        assert set(state) == {"1", "2", "3"}
+    assert not (tmp_path / "journal.jsonl").exists()
+
+
+def list_index_pages(count=3):
+    return [
+        [ListRow(f"List {p}{i}", f"https://example.com/custlist.nl?id={p}{i}") for i in range(3)]
+        for p in range(1, count + 1)
+    ]
+
+
+def test_row_by_row_fallback_still_paginates():
+    driver = ListsDriver(None, {}, index_pages=list_index_pages(), harvest=False)
+
+    entries = list_values_scraper.collect_list_entries(driver)
+
+    assert len(entries) == 9 and driver.page == 2
+
+
+def test_pagination_waits_for_the_rows_not_just_the_segment():
+    driver = ListsDriver(None, {}, index_pages=list_index_pages(), row_lag=2)
+
+    entries = list_values_scraper.collect_list_entries(driver)
+
+    assert [entry.name for entry in entries] == [f"List {p}{i}" for p in range(1, 4) for i in range(3)]
+
+
+def test_refresh_refuses_a_partial_list_index(monkeypatch, tmp_path):
+    go_to_next = list_values_scraper.go_to_next_list_page
+    monkeypatch.setattr(
+        list_values_scraper, "go_to_next_list_page", lambda d, *args: go_to_next(d, *args, timeout=0.1)
+    )
+    state_path, output_path = tmp_path / "state.json", tmp_path / "values.csv"
+    state_path.write_text('{"version": 1, "lists": {}}', encoding="utf-8")
+    output_path.write_text("previous", encoding="utf-8")
+
+    with pytest.raises(list_values_scraper.IncompleteListIndexError):
+        list_values_scraper.refresh_list_values(
+            ListsDriver(None, {}, index_pages=list_index_pages(), stuck=True),
+            workers=1,
+            state_path=str(state_path),
+            changes_path=str(tmp_path / "changes.csv"),
+            output_path=str(output_path),
+            journal_path=str(tmp_path / "journal.jsonl"),
+        )
+
+    assert output_path.read_text(encoding="utf-8") == "previous"
+    assert not (tmp_path / "changes.csv").exists()
+
+
+def test_journal_is_closed_on_failure_and_a_plain_rerun_warns(monkeypatch, tmp_path, caplog):
+    journal_path = str(tmp_path / "journal.jsonl")
+    opened = []
+    real_init = list_values_scraper.ListJournal.__init__
+
+    def tracking_init(self, *args, **kwargs):
+        real_init(self, *args, **kwargs)
+        opened.append(self)
+
+    monkeypatch.setattr(list_values_scraper.ListJournal, "__init__", tracking_init)
+
+    def fail_on_second(driver, href):
+        if href.endswith("2"):
+            raise RuntimeError("browser died")
+        return ["v"]
+
+    monkeypatch.setattr(list_values_scraper, "scrape_list_in_browser", fail_on_second)
+    rows = [ListRow(f"List {i}", f"https://example.com/custlist.nl?id={i}") for i in (1, 2)]
+    with pytest.raises(RuntimeError):
+        list_values_scraper.refresh_list_values(
+            ListsDriver(rows, {}),
+            workers=1,
+            state_path=str(tmp_path / "state.json"),
+            changes_path=str(tmp_path / "changes.csv"),
+            output_path=str(tmp_path / "values.csv"),
+            journal_path=journal_path,
+        )
+    assert opened[0].file.closed
+
+    with caplog.at_level("WARNING"):
+        list_values_scraper.ListJournal(journal_path).close()
+    assert "--resume" in caplog.text
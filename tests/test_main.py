@@ -0,0 +1,186 @@
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+from selenium import webdriver
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+# Provide dummy config for main and the scraper modules it imports
+CONFIG = sys.modules['config'] = types.SimpleNamespace(
+    NETSUITE_URL='',
+    NETSUITE_EMAIL='',
+    NETSUITE_PASSWORD='',
+    SECURITY_ANSWER='',
+    ADMIN_ITEM_URL='',
+    HEADLESS_MODE=True,
+    NETSUITE_BASE_URL='https://example.com',
+    PERSIST_BROWSER_PROFILE=False,
+    CHROME_PROFILE_DIR='',
+)
+
+import driver_pool
+import main
+import workflow_scraper
+
+
+@pytest.fixture(autouse=True)
+def dummy_config(monkeypatch):
+    # main imports config lazily, after other test modules may have replaced it.
+    monkeypatch.setitem(sys.modules, "config", CONFIG)
+
+
+class FakePool:
+    instances = []
+
+    def __init__(self, cookies, size, driver_factory, fresh_session, login):
+        self.cookies = cookies
+        self.size = size
+        self.fresh_session = fresh_session
+        FakePool.instances.append(self)
+
+    def map(self, func, items):
+        return [func(f"driver-{i}", item) for i, item in enumerate(items)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+class MainDriver:
+    def get_cookies(self):
+        return [{"name": "JSESSIONID", "value": "abc"}]
+
+
+def test_run_parallel_gives_each_scraper_its_own_session(monkeypatch, capsys):
+    monkeypatch.setattr(driver_pool, "DriverPool", FakePool)
+    seen = {}
+    scrapers = {
+        "user-roles": lambda d: seen.setdefault("user-roles", d),
+        "list-values": lambda d: seen.setdefault("list-values", d),
+    }
+
+    assert main.run_parallel(MainDriver(), ["user-roles", "list-values"], scrapers) is True
+
+    pool = FakePool.instances[-1]
+    assert pool.size == 2
+    assert pool.fresh_session is True
+    assert seen == {"user-roles": "driver-0", "list-values": "driver-1"}
+    out = capsys.readouterr().out
+    assert "user-roles" in out and "list-values" in out
+
+
+def test_run_parallel_reports_failure(monkeypatch):
+    monkeypatch.setattr(driver_pool, "DriverPool", FakePool)
+
+    def broken(driver):
+        raise RuntimeError("boom")
+
+    scrapers = {"crawler": lambda d: None, "workflows": broken}
+
+    assert main.run_parallel(MainDriver(), ["crawler", "workflows"], scrapers) is False
+
+
+def test_run_timed_records_outcome():
+    name, succeeded, seconds = main.run_timed("crawler", lambda d: None, object())
+
+    assert (name, succeeded) == ("crawler", True)
+    assert seconds >= 0
+
+
+def test_order_by_role_groups_scrapers_sharing_a_role(monkeypatch):
+    monkeypatch.setattr(workflow_scraper, "HARDCODED", [])
+    order = main.order_by_role(["user-roles", "record-catalogs", "list-values", "workflows"])
+
+    # catalog → HRA → admin (workflows ends in admin, so the admin scrapers follow it)
+    assert order == ["record-catalogs", "workflows", "user-roles", "list-values"]
+
+
+def test_order_by_role_keeps_request_order_when_roles_do_not_matter(monkeypatch):
+    monkeypatch.setattr(workflow_scraper, "HARDCODED", [])
+
+    assert main.order_by_role(["crawler", "list-values"]) == ["crawler", "list-values"]
+    assert main.order_by_role(["list-values", "workflows"], records=["Feedback"]) == [
+        "list-values",
+        "workflows",
+    ]
+    assert main.order_by_role([]) == []
+
+
+def test_order_by_role_drops_repeated_names(monkeypatch):
+    monkeypatch.setattr(workflow_scraper, "HARDCODED", [])
+    names = ["list-values", "crawler", "user-roles"] * 6
+
+    assert main.order_by_role(names) == ["list-values", "crawler", "user-roles"]
+
+
+def test_create_driver_attaches_to_running_chrome(monkeypatch):
+    captured = {}
+    monkeypatch.setattr(webdriver, "Chrome", lambda options: captured.setdefault("options", options))
+
+    options = main.create_driver("127.0.0.1:9222")
+
+    assert options.experimental_options["debuggerAddress"] == "127.0.0.1:9222"
+    assert "--headless=new" not in options.arguments
+
+
+def test_release_driver_leaves_attached_chrome_running():
+    class Service:
+        stopped = False
+
+        def stop(self):
+            self.stopped = True
+
+    class Driver:
+        quit_called = False
+
+        def __init__(self):
+            self.service = Service()
+
+        def quit(self):
+            self.quit_called = True
+
+    attached, launched = Driver(), Driver()
+    main.release_driver(attached, attached=True)
+    main.release_driver(launched)
+
+    assert attached.service.stopped and not attached.quit_called
+    assert launched.quit_called
+
+
+def test_build_scrapers_passes_supported_options_and_imports_lazily(monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "run_scraper", lambda spec, driver, **kwargs: calls.append((spec.name, kwargs)))
+    args = types.SimpleNamespace(crawl_workers=8, resume=True)
+
+    scrapers = main.build_scrapers(args, ["Feedback"])
+    scrapers["crawler"]("driver")
+    scrapers["workflows"]("driver")
+    scrapers["list-values"]("driver")
+
+    assert calls == [
+        ("crawler", {"workers": 8, "resume": True}),
+        ("workflows", {"records": ["Feedback"]}),
+        ("list-values", {"resume": True}),
+    ]
+
+
+def test_importing_main_skips_selenium_config_and_scrapers():
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = {line.split("|")[-1].strip() for line in result.stderr.splitlines() if "|" in line}
+
+    assert "main" in imported
+    for heavy in ("selenium", "config", "crawler", "record_catalogs_scraper", "bs4", "requests"):
+        assert heavy not in imported
@@ -0,0 +1,61 @@
+import os
+import sys
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import page_cache
+
+
+class DummyResponse:
+    def __init__(self, content, status_code=200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_put_and_conditional_headers(tmp_path):
+    cache = page_cache.PageCache(str(tmp_path / "cache.sqlite3"), role="1114")
+    response = DummyResponse(
+        b"<a href='/x'>x</a>",
+        headers={"ETag": '"abc"', "Last-Modified": "Tue, 01 Oct 2024 10:00:00 GMT"},
+    )
+    cache.put("https://example.com/page", response, {"https://example.com/x"})
+
+    page = cache.get("https://example.com/page")
+
+    assert page.links == ["https://example.com/x"]
+    assert cache.conditional_headers(page) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Tue, 01 Oct 2024 10:00:00 GMT",
+    }
+    assert cache.conditional_headers(None) == {}
+    cache.close()
+
+
+def test_entries_are_scoped_by_role(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    admin = page_cache.PageCache(path, role="1114")
+    admin.put("https://example.com/page", DummyResponse(b"body"), set())
+    admin.close()
+
+    other = page_cache.PageCache(path, role="1059")
+    assert other.get("https://example.com/page") is None
+    other.close()
+
+
+def test_reuse_on_304_or_unchanged_hash(tmp_path):
+    cache = page_cache.PageCache(str(tmp_path / "cache.sqlite3"))
+    cache.put("https://example.com/page", DummyResponse(b"same"), {"https://example.com/x"})
+    page = cache.get("https://example.com/page")
+
+    assert cache.reuse("https://example.com/page", page, DummyResponse(b"", 304)) == {
+        "https://example.com/x"
+    }
+    assert cache.reuse("https://example.com/page", page, DummyResponse(b"same")) == {
+        "https://example.com/x"
+    }
+    assert cache.reuse("https://example.com/page", page, DummyResponse(b"changed")) is None
+    assert cache.reuse("https://example.com/new", None, DummyResponse(b"new")) is None
+    assert (cache.hits, cache.misses) == (2, 2)
+    cache.close()
@@ -0,0 +1,199 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import types
+import urllib.request
+
+import pytest
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+# Provide dummy config for main and the scraper modules it imports
+sys.modules['config'] = types.SimpleNamespace(
+    NETSUITE_URL='',
+    NETSUITE_EMAIL='',
+    NETSUITE_PASSWORD='',
+    SECURITY_ANSWER='',
+    ADMIN_ITEM_URL='',
+    HEADLESS_MODE=True,
+    NETSUITE_BASE_URL='https://example.com',
+    PERSIST_BROWSER_PROFILE=False,
+    CHROME_PROFILE_DIR='',
+)
+
+import main
+import scrape_daemon
+
+logging.getLogger().setLevel(logging.INFO)
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp_path(tmp_path, monkeypatch):
+    # Workers flush timing spans to the working directory after each job.
+    monkeypatch.chdir(tmp_path)
+
+
+def fake_scrapers(calls):
+    def scraper(name):
+        def run(driver):
+            logging.getLogger("fake").info(f"scraping {name}")
+            calls.append((name, driver))
+            if name == "workflows":
+                raise RuntimeError("boom")
+
+        return run
+
+    return lambda args, records: {name: scraper(name) for name in main.SCRAPER_ROLES}
+
+
+def test_daemon_runs_jobs_on_warm_driver_and_records_events(monkeypatch):
+    calls, logins = [], []
+    monkeypatch.setattr(main, "build_scrapers", fake_scrapers(calls))
+    daemon = scrape_daemon.ScrapeDaemon(["warm-driver"], login=lambda d: logins.append(d) or True)
+    daemon.start()
+    try:
+        job = daemon.submit("list-values,user-roles")
+        events = list(job.iter_events())
+    finally:
+        daemon.stop()
+
+    assert job.status == "succeeded"
+    assert logins == ["warm-driver"]
+    assert {name for name, _ in calls} == {"list-values", "user-roles"}
+    kinds = [event["event"] for event in events]
+    assert kinds[0] == "queued" and kinds[1] == "started" and kinds[-1] == "finished"
+    assert any(e["event"] == "log" and e["message"] == "scraping user-roles" for e in events)
+
+
+def test_daemon_rejects_unknown_scrapers():
+    daemon = scrape_daemon.ScrapeDaemon([])
+
+    try:
+        daemon.submit(["nope"])
+    except ValueError as e:
+        assert "nope" in str(e)
+    else:
+        raise AssertionError("unknown scraper accepted")
+
+
+def test_http_api_streams_job_events(monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "build_scrapers", fake_scrapers(calls))
+    daemon = scrape_daemon.ScrapeDaemon(["warm-driver"])
+    server = scrape_daemon.make_server(daemon, port=0)
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    daemon.start()
+    try:
+        events = list(scrape_daemon.submit_job(["workflows"], records=["Feedback"], port=port))
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/jobs/1") as response:
+            state = json.load(response)
+    finally:
+        server.shutdown()
+        server.server_close()
+        daemon.stop()
+
+    assert events[-1] == {**events[-1], "event": "finished", "status": "failed"}
+    assert state["status"] == "failed" and state["records"] == ["Feedback"]
+    assert calls == [("workflows", "warm-driver")]
+
+
+def test_logs_from_pool_threads_reach_the_job_and_old_jobs_are_evicted(monkeypatch):
+    import driver_pool
+    from concurrent.futures import ThreadPoolExecutor
+
+    def threaded_scrapers(args, records):
+        def run(driver):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                driver_pool._map_in_context(
+                    executor, lambda i: logging.getLogger("fake").info(f"child {i}"), range(2)
+                )
+
+        return {name: run for name in main.SCRAPER_ROLES}
+
+    monkeypatch.setattr(main, "build_scrapers", threaded_scrapers)
+    monkeypatch.setattr(scrape_daemon, "FINISHED_JOBS_KEPT", 2)
+    daemon = scrape_daemon.ScrapeDaemon(["warm-driver"])
+    daemon.start()
+    try:
+        jobs = [daemon.submit("list-values") for _ in range(4)]
+        events = [list(job.iter_events()) for job in jobs]
+    finally:
+        daemon.stop()
+
+    messages = {e["message"] for e in events[-1] if e["event"] == "log"}
+    assert {"child 0", "child 1"} <= messages
+    assert list(daemon.jobs) == [jobs[2].id, jobs[3].id]
+
+
+def test_job_keeps_only_the_latest_events(monkeypatch):
+    monkeypatch.setattr(scrape_daemon, "MAX_JOB_EVENTS", 3)
+    job = scrape_daemon.Job(1, ["list-values"])
+    for i in range(10):
+        job.emit("log", message=str(i))
+    job.finish(True)
+
+    events = list(job.iter_events())
+
+    assert [e.get("message") for e in events] == ["8", "9", None]
+    assert events[-1]["event"] == "finished"
+
+
+def test_submit_drops_repeated_scrapers_and_rejects_odd_payloads():
+    daemon = scrape_daemon.ScrapeDaemon([])
+
+    assert daemon.submit(["list-values", "list-values", "crawler"]).scrapers == ["list-values", "crawler"]
+    with pytest.raises(ValueError):
+        daemon.submit([{"name": "crawler"}])
+
+
+def test_two_workers_never_run_the_same_scraper_at_once(monkeypatch):
+    running, overlaps = [], []
+    lock = threading.Lock()
+
+    def slow_scrapers(args, records):
+        def run(driver):
+            with lock:
+                running.append(driver)
+                if len(running) > 1:
+                    overlaps.append(list(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(driver)
+
+        return {name: run for name in main.SCRAPER_ROLES}
+
+    monkeypatch.setattr(main, "build_scrapers", slow_scrapers)
+    daemon = scrape_daemon.ScrapeDaemon(["driver-a", "driver-b"])
+    daemon.start()
+    try:
+        jobs = [daemon.submit("list-values") for _ in range(2)]
+        for job in jobs:
+            list(job.iter_events())
+    finally:
+        daemon.stop()
+
+    assert all(job.status == "succeeded" for job in jobs)
+    assert overlaps == []
+
+
+def test_spans_are_flushed_to_disk_after_each_job(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(main, "build_scrapers", fake_scrapers(calls))
+    daemon = scrape_daemon.ScrapeDaemon(["warm-driver"])
+    daemon.start()
+    try:
+        list(daemon.submit("list-values").iter_events())
+        deadline = time.time() + 2
+        while scrape_daemon.RECORDER.spans and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        daemon.stop()
+
+    assert scrape_daemon.RECORDER.spans == []
+    names = [json.loads(line)["name"] for line in (tmp_path / "run_spans.jsonl").read_text().splitlines()]
+    assert "scraper.list-values" in names
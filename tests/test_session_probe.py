@@ -0,0 +1,125 @@
+import os
+import sys
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+# Provide dummy config module required by session_probe
+sys.modules['config'] = types.SimpleNamespace(
+    NETSUITE_URL='',
+    NETSUITE_EMAIL='',
+    NETSUITE_PASSWORD='',
+    SECURITY_ANSWER='',
+    ADMIN_ITEM_URL='',
+    HEADLESS_MODE=True,
+    NETSUITE_BASE_URL='https://example.com',
+)
+
+import session_probe
+
+
+class DashboardHandler(BaseHTTPRequestHandler):
+    """Answers like NetSuite: 200 for the live session, a login redirect otherwise."""
+
+    requests_seen = 0
+
+    def do_GET(self):
+        DashboardHandler.requests_seen += 1
+        if "JSESSIONID=live" in (self.headers.get("Cookie") or ""):
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b"<html>dashboard</html>")
+        else:
+            self.send_response(302)
+            self.send_header("Location", "/app/login/secure/enterpriselogin.nl")
+            self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class CdpDriver:
+    def __init__(self, cookies):
+        self.cookies = cookies
+
+    def execute_cdp_cmd(self, cmd, params):
+        assert cmd == "Network.getAllCookies"
+        return {"cookies": self.cookies}
+
+    def execute_script(self, script):
+        return "Mozilla/5.0 (Test)"
+
+    def get(self, url):
+        raise AssertionError("the probe must not navigate")
+
+
+def cookie(value, expires=-1):
+    return {"name": "JSESSIONID", "value": value, "domain": "127.0.0.1", "path": "/", "expires": expires}
+
+
+def serve_dashboard():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DashboardHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/app/center/card.nl?whence="
+
+
+def test_live_netsuite_cookies_drops_expired_and_foreign_cookies():
+    now = 1_000
+    cookies = [
+        {"name": "JSESSIONID", "domain": ".app.netsuite.com", "expires": -1},
+        {"name": "old", "domain": "system.netsuite.com", "expires": 999},
+        {"name": "remember", "domain": "system.netsuite.com", "expiry": 5_000},
+        {"name": "other", "domain": "example.com", "expires": -1},
+    ]
+
+    live = session_probe.live_netsuite_cookies(cookies, now=now)
+
+    assert [c["name"] for c in live] == ["JSESSIONID", "remember"]
+
+
+def test_probe_over_http_tells_live_from_expired_sessions():
+    server, url = serve_dashboard()
+    try:
+        assert session_probe.probe_over_http([cookie("live")], url) is True
+        assert session_probe.probe_over_http([cookie("stale")], url) is False
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_probe_without_netsuite_cookies_skips_the_request():
+    probe = session_probe.SessionProbe(url="http://127.0.0.1:1/unreachable")
+    driver = CdpDriver([{"name": "JSESSIONID", "domain": "app.netsuite.com", "expires": time.time() - 10}])
+
+    assert probe.check(driver) is False
+
+
+def test_probe_caches_a_live_session_for_its_ttl(monkeypatch):
+    monkeypatch.setattr(session_probe, "live_netsuite_cookies", lambda cookies: cookies)
+    server, url = serve_dashboard()
+    DashboardHandler.requests_seen = 0
+    try:
+        probe = session_probe.SessionProbe(url=url, ttl=60)
+        driver = CdpDriver([cookie("live")])
+        assert probe.check(driver) is True
+        assert probe.check(driver) is True
+        assert DashboardHandler.requests_seen == 1
+
+        probe.ttl = 0
+        assert probe.check(driver) is True
+        assert DashboardHandler.requests_seen == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_probe_is_inconclusive_without_cdp_or_visible_cookies():
+    class PlainDriver:
+        def get_cookies(self):
+            return []
+
+    assert session_probe.SessionProbe().check(PlainDriver()) is None
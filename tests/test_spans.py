@@ -0,0 +1,94 @@
+import json
+import os
+import sys
+import types
+
+import pytest
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import spans
+
+
+def test_spans_nest_and_record_attributes():
+    recorder = spans.SpanRecorder()
+
+    with recorder.span("scrape_record", record="Customer"):
+        with recorder.span("scrape_fields_grid"):
+            pass
+
+    inner, outer = recorder.spans
+    assert outer["name"] == "scrape_record" and outer["parent"] is None
+    assert outer["attrs"] == {"record": "Customer"}
+    assert inner["parent"] == "scrape_record"
+    assert inner["run"] == outer["run"] == recorder.run_id
+
+
+def test_timed_decorator_captures_named_arguments_and_failures():
+    recorder = spans.SpanRecorder()
+
+    @recorder.timed(attrs=("record_name",))
+    def scrape_joins_grid(driver, record_name, record_id):
+        if record_id == "bad":
+            raise RuntimeError("grid moved")
+        return record_id
+
+    assert scrape_joins_grid("driver", "Customer", record_id="1") == "1"
+    with pytest.raises(RuntimeError):
+        scrape_joins_grid("driver", "Vendor", "bad")
+
+    ok, failed = recorder.spans
+    assert ok["name"] == "scrape_joins_grid" and ok["attrs"] == {"record_name": "Customer"}
+    assert failed["ok"] is False
+    assert recorder.summary()["scrape_joins_grid"]["failed"] == 1
+
+
+def test_summary_aggregates_phases_and_save_appends_runs(tmp_path):
+    spans_path, summary_path = tmp_path / "spans.jsonl", tmp_path / "summary.json"
+    for _ in range(2):
+        recorder = spans.SpanRecorder()
+        for _ in range(3):
+            with recorder.span("expand_record"):
+                pass
+        recorder.save(str(spans_path), str(summary_path))
+
+    lines = [json.loads(line) for line in spans_path.read_text(encoding="utf-8").splitlines()]
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+
+    assert len(lines) == 6 and len({line["run"] for line in lines}) == 2
+    assert summary["run"] == recorder.run_id
+    assert summary["phases"]["expand_record"]["count"] == 3
+    assert set(summary["phases"]["expand_record"]) >= {"total_s", "p50_s", "p95_s", "max_s"}
+
+
+def test_save_without_spans_writes_nothing(tmp_path):
+    spans.SpanRecorder().save(str(tmp_path / "spans.jsonl"), str(tmp_path / "summary.json"))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_save_reports_browser_waits_when_they_ran(tmp_path, monkeypatch):
+    waits = types.SimpleNamespace(wait_summary=lambda: {"URL change": (2, 1.23456)})
+    monkeypatch.setitem(sys.modules, "waits", waits)
+    recorder = spans.SpanRecorder()
+    with recorder.span("login"):
+        pass
+    recorder.save(str(tmp_path / "spans.jsonl"), str(tmp_path / "summary.json"))
+
+    summary = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))
+    assert summary["waits"] == {"URL change": {"count": 2, "total_s": 1.235}}
+
+
+def test_flush_writes_and_forgets_saved_spans(tmp_path):
+    spans_path, summary_path = tmp_path / "spans.jsonl", tmp_path / "summary.json"
+    recorder = spans.SpanRecorder()
+    for name in ("first", "second"):
+        with recorder.span(name):
+            pass
+        recorder.flush(str(spans_path), str(summary_path))
+        assert recorder.spans == []
+
+    lines = [json.loads(line)["name"] for line in spans_path.read_text(encoding="utf-8").splitlines()]
+    assert lines == ["first", "second"]
+    assert list(json.loads(summary_path.read_text(encoding="utf-8"))["phases"]) == ["second"]
@@ -0,0 +1,58 @@
+import os
+import sys
+import threading
+import time
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import throttle
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = throttle.RateLimiter(requests_per_second=50)
+
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    # First request goes immediately, the next five wait 20ms each.
+    assert elapsed >= 0.09
+
+
+def test_rate_limiter_disabled_without_rate():
+    limiter = throttle.RateLimiter(requests_per_second=0)
+
+    start = time.monotonic()
+    for _ in range(100):
+        limiter.acquire()
+
+    assert time.monotonic() - start < 0.05
+
+
+def test_host_limiter_caps_in_flight_requests_per_host():
+    limiter = throttle.HostLimiter(max_per_host=2)
+    lock = threading.Lock()
+    in_flight = {"a.example.com": 0, "b.example.com": 0}
+    peak = dict(in_flight)
+
+    def worker(host):
+        with limiter.slot(f"https://{host}/page"):
+            with lock:
+                in_flight[host] += 1
+                peak[host] = max(peak[host], in_flight[host])
+            time.sleep(0.02)
+            with lock:
+                in_flight[host] -= 1
+
+    threads = [
+        threading.Thread(target=worker, args=(host,))
+        for host in ["a.example.com", "b.example.com"] * 5
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak == {"a.example.com": 2, "b.example.com": 2}
@@ -0,0 +1,35 @@
+import hashlib
+import os
+import sys
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import totp
+
+# RFC 6238 Appendix B test secret ("12345678901234567890") in base32.
+RFC_SECRET = "GEZDGNBVGY3TQOJQGEZDGNBVGY3TQOJQ"
+
+
+def test_totp_matches_rfc_6238_vectors():
+    vectors = {
+        59: "94287082",
+        1111111109: "07081804",
+        1111111111: "14050471",
+        1234567890: "89005924",
+        2000000000: "69279037",
+        20000000000: "65353130",
+    }
+    for for_time, expected in vectors.items():
+        assert totp.totp(RFC_SECRET, for_time, digits=8, digest=hashlib.sha1) == expected
+
+
+def test_totp_accepts_authenticator_formatting():
+    spaced = "gezd gnbv gy3t qojq gezd gnbv gy3t qojq"
+
+    assert totp.totp(spaced, 59) == totp.totp(RFC_SECRET, 59) == "287082"
+
+
+def test_seconds_remaining():
+    assert totp.seconds_remaining(60) == 30
+    assert totp.seconds_remaining(89.5) == 0.5
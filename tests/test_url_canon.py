@@ -0,0 +1,58 @@
+import os
+import sys
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import url_canon
+
+BASE = "https://1234.app.netsuite.com"
+
+
+def test_canonicalize_drops_volatile_params_and_sorts_the_rest():
+    url = (
+        "HTTPS://1234.App.NetSuite.com:443/app/common/custom/custlist.nl"
+        "?whence=&id=7&_csrf=abc&e=T&sortcol=name#values"
+    )
+    assert url_canon.canonicalize(url, BASE) == (
+        "https://1234.app.netsuite.com/app/common/custom/custlist.nl?e=T&id=7"
+    )
+
+
+def test_canonicalize_rejects_other_hosts_and_schemes():
+    assert url_canon.canonicalize("https://system.netsuite.com/pages/login.jsp", BASE) is None
+    assert url_canon.canonicalize("javascript:void(0)", BASE) is None
+    assert url_canon.canonicalize("mailto:admin@example.com", BASE) is None
+
+
+def test_canonicalize_keeps_non_default_port():
+    assert url_canon.canonicalize("http://127.0.0.1:8000?x=1") == "http://127.0.0.1:8000/?x=1"
+
+
+def test_pattern_cap_limits_query_string_explosions():
+    cap = url_canon.PatternCap(max_per_pattern=2)
+    admitted = [
+        cap.admit(f"{BASE}/app/common/search/searchresults.nl?searchid={i}")
+        for i in range(5)
+    ]
+
+    assert admitted == [True, True, False, False, False]
+    assert cap.admit(f"{BASE}/app/common/search/searchresults.nl") is True
+    assert sum(cap.rejected.values()) == 3
+
+
+def test_canonicalize_rejects_malformed_urls():
+    assert url_canon.canonicalize("http://host:abc/x") is None
+    assert url_canon.canonicalize("http://[::1/x") is None
+
+
+def test_pattern_cap_does_not_cap_distinct_records():
+    cap = url_canon.PatternCap(max_per_pattern=2)
+
+    assert all(cap.admit(f"{BASE}/app/common/custom/custlist.nl?id={i}") for i in range(300))
+    assert all(
+        cap.admit(f"{BASE}/app/common/custom/custrecordentry.nl?rectype=12&id={i}") for i in range(300)
+    )
+    # Variants of one record are still capped.
+    variants = [cap.admit(f"{BASE}/app/common/custom/custlist.nl?id=1&e=T&x={i}") for i in range(3)]
+    assert variants == [True, True, False]
@@ -0,0 +1,47 @@
+import os
+import sys
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import waits
+
+
+class NavigatingDriver:
+    """current_url / readyState change after a few polls."""
+
+    def __init__(self, urls, states=("loading", "complete")):
+        self._urls = list(urls)
+        self._states = list(states)
+
+    @property
+    def current_url(self):
+        return self._urls.pop(0) if len(self._urls) > 1 else self._urls[0]
+
+    def execute_script(self, script):
+        return self._states.pop(0) if len(self._states) > 1 else self._states[0]
+
+
+def test_url_and_ready_waits_return_as_soon_as_condition_holds():
+    waits.WAIT_TIMINGS.clear()
+    driver = NavigatingDriver(["https://x/login", "https://x/login", "https://x/app/center/card.nl"])
+
+    assert waits.wait_for_url_change(driver, "https://x/login", timeout=2) is True
+    assert waits.wait_for_document_ready(NavigatingDriver(["https://x"]), timeout=2) is True
+
+    names = [name for name, _, ok in waits.WAIT_TIMINGS if ok]
+    assert names == ["URL change", "document ready"]
+    assert all(elapsed < 1 for _, elapsed, _ in waits.WAIT_TIMINGS)
+
+
+def test_wait_times_out_without_raising():
+    waits.WAIT_TIMINGS.clear()
+    driver = NavigatingDriver(["https://x/loginchallenge/entry.nl"])
+
+    assert waits.wait_for_url_without(driver, "loginchallenge/entry.nl", timeout=0.2) is False
+    assert waits.WAIT_TIMINGS[-1][2] is False
+    assert waits.wait_summary()["URL without loginchallenge/entry.nl"][0] == 1
+
+
+def test_wait_timings_are_bounded():
+    assert waits.WAIT_TIMINGS.maxlen == waits.WAIT_TIMINGS_LIMIT
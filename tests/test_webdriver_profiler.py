@@ -0,0 +1,88 @@
+import json
+import os
+import sys
+
+# Ensure repository root on path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from selenium.webdriver.remote.webelement import WebElement
+
+import webdriver_profiler
+
+
+class FakeDriver:
+    """Answers every command immediately, like a very fast chromedriver."""
+
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        return {"value": "cell"}
+
+
+def read_row(driver):
+    cells = [WebElement(driver, f"cell-{i}") for i in range(3)]
+    return [cell.text for cell in cells]
+
+
+def read_header(driver):
+    return WebElement(driver, "header").tag_name
+
+
+def test_profiler_counts_commands_by_type_and_calling_function():
+    driver = FakeDriver()
+    profiler = webdriver_profiler.WebDriverProfiler()
+    profiler.install(driver)
+
+    with profiler.scope(driver, "user-roles"):
+        assert read_row(driver) == ["cell", "cell", "cell"]
+        read_header(driver)
+    read_header(driver)
+
+    report = profiler.report("user-roles")
+    assert report["calls"] == 4
+    assert {row["name"]: row["calls"] for row in report["commands"]} == {
+        "getElementText": 3,
+        "getElementTagName": 1,
+    }
+    sites = {row["name"]: row["calls"] for row in report["call_sites"]}
+    assert sites == {"test_webdriver_profiler.read_row": 3, "test_webdriver_profiler.read_header": 1}
+    assert profiler.report(webdriver_profiler.DEFAULT_SCOPE)["calls"] == 1
+    assert driver.commands.count("getElementText") == 3
+
+
+def test_uninstall_restores_the_driver():
+    driver = FakeDriver()
+    profiler = webdriver_profiler.WebDriverProfiler()
+    profiler.install(driver)
+    webdriver_profiler.WebDriverProfiler.uninstall(driver)
+
+    read_header(driver)
+
+    assert profiler.scopes == []
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+
+    assert webdriver_profiler.percentile(values, 50) == 50.0
+    assert webdriver_profiler.percentile(values, 95) == 95.0
+    assert webdriver_profiler.percentile([0.2], 95) == 0.2
+    assert webdriver_profiler.percentile([], 50) == 0.0
+
+
+def test_report_is_saved_and_formatted(tmp_path):
+    driver = FakeDriver()
+    profiler = webdriver_profiler.WebDriverProfiler()
+    profiler.install(driver)
+    with profiler.scope(driver, "workflows"):
+        read_row(driver)
+
+    path = tmp_path / "profile.json"
+    profiler.save(str(path))
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    text = profiler.format_report("workflows")
+
+    assert saved[0]["scope"] == "workflows" and saved[0]["calls"] == 3
+    assert "3 round trips" in text and "test_webdriver_profiler.read_row" in text
@@ -0,0 +1,50 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+
+class RateLimiter:
+    """Global requests-per-second cap shared by every crawl worker.
+
+    Callers reserve evenly spaced send slots, so bursts from many threads are
+    smoothed out instead of hitting NetSuite all at once.
+    """
+
+    def __init__(self, requests_per_second):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self):
+        """Block until the caller may send its next request."""
+
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class HostLimiter:
+    """Cap the number of in-flight requests per host."""
+
+    def __init__(self, max_per_host):
+        self.max_per_host = max_per_host
+        self._lock = threading.Lock()
+        self._slots = defaultdict(lambda: threading.BoundedSemaphore(self.max_per_host))
+
+    @contextmanager
+    def slot(self, url):
+        """Hold one of the per-host slots for ``url`` while the body runs."""
+
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            semaphore = self._slots[host]
+        with semaphore:
+            yield
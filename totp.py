@@ -0,0 +1,35 @@
+import base64
+import hashlib
+import hmac
+import struct
+import time
+
+TIME_STEP = 30
+DIGITS = 6
+
+
+def _decode_secret(secret):
+    """Decode a base32 authenticator secret, tolerating spaces, case and missing padding."""
+
+    secret = secret.replace(" ", "").upper()
+    return base64.b32decode(secret + "=" * (-len(secret) % 8))
+
+
+def totp(secret, for_time=None, time_step=TIME_STEP, digits=DIGITS, digest=hashlib.sha1):
+    """Return the RFC 6238 one-time code for ``secret`` at ``for_time`` (default: now)."""
+
+    if for_time is None:
+        for_time = time.time()
+    counter = int(for_time // time_step)
+    mac = hmac.new(_decode_secret(secret), struct.pack(">Q", counter), digest).digest()
+    offset = mac[-1] & 0x0F
+    code = struct.unpack(">I", mac[offset:offset + 4])[0] & 0x7FFFFFFF
+    return str(code % 10 ** digits).zfill(digits)
+
+
+def seconds_remaining(for_time=None, time_step=TIME_STEP):
+    """Seconds until the current code rolls over."""
+
+    if for_time is None:
+        for_time = time.time()
+    return time_step - (for_time % time_step)
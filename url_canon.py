@@ -0,0 +1,102 @@
+from collections import Counter
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that change between requests for the same NetSuite page:
+# navigation breadcrumbs, CSRF tokens, cache busters and list sort/paging state.
+VOLATILE_PARAMS = {
+    "whence",
+    "_csrf",
+    "csrf",
+    "_",
+    "ts",
+    "rand",
+    "sortcol",
+    "sortdir",
+    "sortfld",
+    "sortorder",
+    "segment",
+    "size",
+    "frame",
+    "ck",
+    "cktime",
+    "vid",
+}
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Distinct URLs admitted per path + parameter-name pattern before the
+# frontier treats further variants as a crawl trap.
+MAX_URLS_PER_PATTERN = 50
+
+# Parameters that name the record a page shows (custlist.nl?id=,
+# custrecordentry.nl?rectype=&id=). Their values are part of the pattern, so
+# each record gets its own cap instead of sharing one across hundreds of lists.
+RECORD_ID_PARAMS = {"id"}
+
+
+def canonicalize(url, base_url=None):
+    """Return a canonical form of ``url``, or ``None`` if it should not be crawled.
+
+    Scheme and host are lower-cased, default ports, fragments and volatile
+    parameters are dropped, and the remaining parameters are sorted. When
+    ``base_url`` is given, URLs on any other host are rejected.
+    """
+
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return None  # malformed port or IPv6 host
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return None
+
+    host = parts.hostname.lower()
+    if base_url and host != (urlsplit(base_url).hostname or "").lower():
+        return None
+
+    netloc = host
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc = f"{host}:{port}"
+
+    params = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in VOLATILE_PARAMS
+    )
+    return urlunsplit((scheme, netloc, parts.path or "/", urlencode(params), ""))
+
+
+def url_pattern(url):
+    """Group ``url`` with its query-string variants: path plus sorted parameter names.
+
+    ``RECORD_ID_PARAMS`` keep their values, so every record is its own pattern.
+    """
+
+    parts = urlsplit(url)
+    names = sorted(
+        {
+            f"{key}={value}" if key.lower() in RECORD_ID_PARAMS else key
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        }
+    )
+    return f"{parts.netloc}{parts.path}?{'&'.join(names)}"
+
+
+class PatternCap:
+    """Admit at most ``max_per_pattern`` distinct URLs for each :func:`url_pattern`."""
+
+    def __init__(self, max_per_pattern=MAX_URLS_PER_PATTERN):
+        self.max_per_pattern = max_per_pattern
+        self.counts = Counter()
+        self.rejected = Counter()
+
+    def admit(self, url):
+        """Count ``url`` against its pattern and return False once the cap is hit."""
+
+        pattern = url_pattern(url)
+        if self.max_per_pattern and self.counts[pattern] >= self.max_per_pattern:
+            self.rejected[pattern] += 1
+            return False
+        self.counts[pattern] += 1
+        return True
@@ -7,6 +7,7 @@ import csv
 import logging
 import re
 from auth_utils import switch_to_admin_role as _switch_to_admin_role
+from spans import timed
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ def switch_to_admin_role(driver):
     _switch_to_admin_role(driver, ADMIN_ROLE_URL)
 
 
+@timed()
 def navigate_to_user_roles_list(driver):
     """Navigate directly to the NetSuite page that lists all user roles."""
 
@@ -45,6 +47,7 @@ def _parse_table_rows(table, num_cols):
     return rows
 
 
+@timed("scrape_permission_section", attrs=("tab_id",))
 def _scrape_permission_section(driver, tab_id, table_id, num_cols):
     """Click a permission subtab and parse its table rows."""
 
@@ -64,6 +67,7 @@ def _scrape_permission_section(driver, tab_id, table_id, num_cols):
     return rows
 
 
+@timed(attrs=("role_name",))
 def scrape_permissions_for_role(driver, role_name, results):
     """Scrape permission tables for a single role and append to ``results``."""
 
@@ -88,6 +92,7 @@ def scrape_permissions_for_role(driver, role_name, results):
         logger.info(f"    ✔️ {label}: {len(rows)} entries")
 
 
+@timed()
 def scrape_all_user_roles(driver):
     """Iterate through all pages of roles and collect permission data."""
 
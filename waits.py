@@ -0,0 +1,77 @@
+import logging
+import threading
+import time
+from collections import deque
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 15
+POLL_FREQUENCY = 0.1
+# Waits kept for wait_summary(); older ones are dropped so long-lived
+# processes (the scrape daemon) do not grow without bound.
+WAIT_TIMINGS_LIMIT = 10000
+
+# Every wait appends (name, seconds, succeeded) here so runs can report how
+# long the browser actually took instead of how long we used to sleep.
+WAIT_TIMINGS = deque(maxlen=WAIT_TIMINGS_LIMIT)
+_timings_lock = threading.Lock()
+
+
+def _record(name, start, succeeded):
+    elapsed = time.monotonic() - start
+    with _timings_lock:
+        WAIT_TIMINGS.append((name, elapsed, succeeded))
+    if succeeded:
+        logger.info(f"⏱️ {name} after {elapsed:.2f}s")
+    else:
+        logger.warning(f"⚠️ Gave up waiting for {name} after {elapsed:.2f}s")
+    return succeeded
+
+
+def _wait(driver, name, condition, timeout):
+    start = time.monotonic()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(condition)
+        return _record(name, start, True)
+    except TimeoutException:
+        return _record(name, start, False)
+
+
+def wait_for_url_change(driver, old_url, timeout=DEFAULT_TIMEOUT):
+    """Wait until the browser has navigated away from ``old_url``."""
+
+    return _wait(driver, "URL change", lambda d: d.current_url != old_url, timeout)
+
+
+def wait_for_url_without(driver, fragment, timeout=DEFAULT_TIMEOUT):
+    """Wait until the current URL no longer contains ``fragment``."""
+
+    return _wait(
+        driver, f"URL without {fragment}", lambda d: fragment not in d.current_url, timeout
+    )
+
+
+def wait_for_document_ready(driver, timeout=DEFAULT_TIMEOUT):
+    """Wait until ``document.readyState`` is ``complete``."""
+
+    def ready(d):
+        try:
+            return d.execute_script("return document.readyState") == "complete"
+        except WebDriverException:
+            return False
+
+    return _wait(driver, "document ready", ready, timeout)
+
+
+def wait_summary():
+    """Return ``{wait name: (count, total seconds)}`` for the recorded waits."""
+
+    summary = {}
+    with _timings_lock:
+        for name, elapsed, _ in WAIT_TIMINGS:
+            count, total = summary.get(name, (0, 0.0))
+            summary[name] = (count + 1, total + elapsed)
+    return summary
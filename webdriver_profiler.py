@@ -0,0 +1,178 @@
+"""Opt-in profiler that counts and times every WebDriver round trip.
+
+``WebDriverProfiler.install(driver)`` wraps ``driver.execute``, which every
+driver *and* WebElement command goes through (``find_elements``,
+``get_attribute``, ``.text``, ``execute_script`` …). Each call is recorded
+with its command name, its latency and the first function outside selenium
+that issued it, grouped under the scope (normally the scraper name) set with
+:meth:`WebDriverProfiler.scope`.
+"""
+
+import json
+import logging
+import math
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import defaultdict
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FILE = "webdriver_profile.json"
+TOP_CALL_SITES = 10
+DEFAULT_SCOPE = "unscoped"
+
+# Comprehension and lambda frames are attributed to the function around them.
+_ANONYMOUS_CODE = {"<listcomp>", "<dictcomp>", "<setcomp>", "<genexpr>", "<lambda>"}
+
+_SELENIUM_DIR = None
+_THIS_FILE = os.path.abspath(__file__)
+
+
+def _selenium_dir():
+    global _SELENIUM_DIR
+    if _SELENIUM_DIR is None:
+        import selenium
+
+        _SELENIUM_DIR = os.path.dirname(os.path.abspath(selenium.__file__))
+    return _SELENIUM_DIR
+
+
+def call_site(depth=2):
+    """Return ``module.function`` of the nearest named caller outside selenium and this module."""
+
+    frame = sys._getframe(depth)
+    selenium_dir = _selenium_dir()
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if (
+            filename != _THIS_FILE
+            and not filename.startswith(selenium_dir)
+            and frame.f_code.co_name not in _ANONYMOUS_CODE
+        ):
+            return f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "?"
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of ``values`` (``pct`` in 0-100)."""
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)), 1) - 1]
+
+
+def _stats(latencies):
+    return {
+        "calls": len(latencies),
+        "total_s": round(sum(latencies), 4),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+    }
+
+
+class WebDriverProfiler:
+    """Record ``(command, call site, seconds)`` for every command of installed drivers."""
+
+    def __init__(self):
+        self._samples = defaultdict(list)  # scope → [(command, site, seconds)]
+        self._scopes = weakref.WeakKeyDictionary()  # driver → current scope
+        self._lock = threading.Lock()
+
+    def install(self, driver):
+        """Start profiling ``driver``; :meth:`uninstall` restores it."""
+
+        if "execute" in vars(driver):
+            return driver
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            site = call_site()
+            start = time.perf_counter()
+            try:
+                return original(driver_command, params)
+            finally:
+                self.record(driver, driver_command, site, time.perf_counter() - start)
+
+        driver.execute = execute
+        return driver
+
+    @staticmethod
+    def uninstall(driver):
+        vars(driver).pop("execute", None)
+
+    @contextmanager
+    def scope(self, driver, name):
+        """Attribute ``driver``'s commands to ``name`` inside the ``with`` block."""
+
+        with self._lock:
+            previous = self._scopes.get(driver)
+            self._scopes[driver] = name
+        try:
+            yield self
+        finally:
+            with self._lock:
+                if previous is None:
+                    self._scopes.pop(driver, None)
+                else:
+                    self._scopes[driver] = previous
+
+    def record(self, driver, command, site, seconds):
+        with self._lock:
+            scope = self._scopes.get(driver, DEFAULT_SCOPE)
+            self._samples[scope].append((command, site, seconds))
+
+    @property
+    def scopes(self):
+        with self._lock:
+            return list(self._samples)
+
+    def report(self, scope):
+        """Round trips, latency percentiles, per-command stats and top call sites for ``scope``."""
+
+        with self._lock:
+            samples = list(self._samples.get(scope, ()))
+        by_command, by_site = defaultdict(list), defaultdict(list)
+        for command, site, seconds in samples:
+            by_command[command].append(seconds)
+            by_site[site].append(seconds)
+
+        def ranked(groups):
+            rows = [{"name": name, **_stats(lat)} for name, lat in groups.items()]
+            return sorted(rows, key=lambda row: row["total_s"], reverse=True)
+
+        return {
+            "scope": scope,
+            **_stats([seconds for _, _, seconds in samples]),
+            "commands": ranked(by_command),
+            "call_sites": ranked(by_site)[:TOP_CALL_SITES],
+        }
+
+    def format_report(self, scope):
+        report = self.report(scope)
+        lines = [
+            f"🔎 WebDriver profile for {scope}: {report['calls']} round trips, "
+            f"{report['total_s']:.1f}s (p50 {report['p50_ms']:.1f} ms, p95 {report['p95_ms']:.1f} ms)",
+            f"  {'command':<32}{'calls':>8}{'total s':>10}{'p50 ms':>9}{'p95 ms':>9}",
+        ]
+        for row in report["commands"]:
+            lines.append(
+                f"  {row['name']:<32}{row['calls']:>8}{row['total_s']:>10.2f}"
+                f"{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}"
+            )
+        lines.append("  Top call sites:")
+        for row in report["call_sites"]:
+            lines.append(f"  {row['name']:<48}{row['calls']:>8}{row['total_s']:>10.2f}")
+        return "\n".join(lines)
+
+    def save(self, path=PROFILE_FILE):
+        """Write every scope's report to ``path`` as JSON."""
+
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump([self.report(scope) for scope in self.scopes], fh, indent=2)
+        logger.info(f"💾 WebDriver profile saved to {path}")
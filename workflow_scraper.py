@@ -3,23 +3,38 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, NoSuchElementException, ElementNotInteractableException
 from selenium.webdriver.common.action_chains import ActionChains
+import logging
 import time
 import csv
 import json
 import re
 from bs4 import BeautifulSoup
-from config import SECURITY_ANSWER, HEADLESS_MODE
+from config import SECURITY_ANSWER
+from auth_utils import ROLE_TRACKER, role_id_from_url, switch_to_admin_role as _switch_to_admin_role
+from fast_profile import full_resources
+from spans import timed
+
+logger = logging.getLogger(__name__)
 
 HARDCODED: list[str] = []  # e.g., ["Admin Request", "Feedback"]
 
+HRA_ROLE_URL = "https://4891605.app.netsuite.com/app/login/secure/changerole.nl?id=4891605~9203~1059~N"
+ADMIN_ROLE_URL = "https://4891605.app.netsuite.com/app/login/secure/changerole.nl?id=4891605~9203~1114~N"
+
 # ── Phase 1: HRA Record Types Extraction ────────────────────────────────────
+@timed("switch_role")
 def switch_to_hra_role(driver):
-    url = "https://4891605.app.netsuite.com/app/login/secure/changerole.nl?id=4891605~9203~1059~N"
-    driver.get(url)
+    role_id = role_id_from_url(HRA_ROLE_URL)
+    if ROLE_TRACKER.get(driver) == role_id:
+        logger.info("✅ HRA role already active, skipping role switch.")
+        return
+
+    ROLE_TRACKER.clear(driver)
+    driver.get(HRA_ROLE_URL)
 
     # ✅ Handle security questions
     if "securityquestions.nl" in driver.current_url:
-        print("🔐 Security questions detected! Answering...")
+        logger.info("🔐 Security questions detected! Answering...")
 
         try:
             # Wait for answer input field
@@ -27,18 +42,20 @@ def switch_to_hra_role(driver):
                 EC.presence_of_element_located((By.CSS_SELECTOR, "input[name='answer'][type='password']"))
             )
             driver.find_element(By.CSS_SELECTOR, "input[name='answer'][type='password']").send_keys(SECURITY_ANSWER)
-            print("✅ Answered security question.")
+            logger.info("✅ Answered security question.")
 
             # Click submit
             driver.find_element(By.CSS_SELECTOR, "input[name='submitter'][type='submit']").click()
             time.sleep(5)
 
         except Exception as e:
-            print(f"⚠️ Error filling the security answer: {e}")
+            logger.warning(f"⚠️ Error filling the security answer: {e}")
 
     WebDriverWait(driver, 10).until(EC.url_contains("center/card.nl"))
-    print("🔄 Switched to HRA role.")
+    ROLE_TRACKER.set(driver, role_id)
+    logger.info("🔄 Switched to HRA role.")
 
+@timed()
 def extract_hra_record_types(driver):
     driver.get("https://4891605.app.netsuite.com/app/center/card.nl?sc=13&whence=")
     WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.CLASS_NAME, "ns-link-button")))
@@ -51,62 +68,20 @@ def extract_hra_record_types(driver):
 
     elems = driver.find_elements(By.CSS_SELECTOR, "a.ns-searchable-value[target='_self']")
     names = [e.text.strip() for e in elems]
-    print(f"✅ HRA record types: {names}")
+    logger.info(f"✅ HRA record types: {names}")
     return names
 
 # ── Phase 2: Workflow List Navigation & Filter ─────────────────────────────
 def switch_to_admin_role(driver):
-    url = "https://4891605.app.netsuite.com/app/login/secure/changerole.nl?id=4891605~9203~1114~N"
-    driver.get(url)
-    
-    # ✅ Handle 2FA Authentication
-    if "loginchallenge/entry.nl" in driver.current_url:
-        print("🔐 2FA Authentication Required!")
-
-        if HEADLESS_MODE:
-            # Headless Mode → Enter 2FA Code in Console
-            two_fa_code = input("🔢 Enter 2FA Code: ")  # Prompt user for 6-digit code
-
-            try:
-                # Wait for the 2FA input field
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.ID, "uif56_input"))
-                )
-
-                # Enter the 2FA code from the console
-                two_fa_input = driver.find_element(By.ID, "uif56_input")
-                two_fa_input.send_keys(two_fa_code)
-                print("✅ 2FA Code Entered.")
-
-                    # Wait for the submit button
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-type='primary'][role='button']"))
-                )
-
-                # Click submit using JavaScript (since it's inside a <div>)
-                submit_button = driver.find_element(By.CSS_SELECTOR, "div[data-type='primary'][role='button']")
-                driver.execute_script("arguments[0].click();", submit_button)
-                print("✅ 2FA Code Submitted.")
-
-                time.sleep(5)  # Wait for redirection
-            except Exception as e:
-                    print(f"⚠️ Error entering 2FA code: {e}")
-                    driver.quit()
-                    return
-
-        else:
-            # Non-Headless Mode → User enters 2FA manually
-            print("⏳ Waiting for manual 2FA entry in the browser...")
-            time.sleep(30)  # Give user 30 seconds to enter the code manually
-            
-    WebDriverWait(driver, 10).until(EC.url_contains("whence"))
-    print("🔄 Switched to admin role.")
+    _switch_to_admin_role(driver, ADMIN_ROLE_URL)
 
+@timed()
 def navigate_to_workflow_list(driver):
     driver.get("https://4891605.app.netsuite.com/app/common/workflow/setup/workflowlist.nl?whence=")
     WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "div__footer")))
-    print("✅ On Workflow List page.")
+    logger.info("✅ On Workflow List page.")
 
+@timed(attrs=("record_name",))
 def filter_by_record_type(driver, record_name):
     """Open the Record Type dropdown, pick the closest match, then wait for the grid."""
     # 1. open the filter pane if it isn’t already
@@ -149,7 +124,7 @@ def filter_by_record_type(driver, record_name):
             prefix = " ".join(parts[:L]).lower()
             match = next((opt for opt in options if opt["text"].lower().startswith(prefix)), None)
             if match:
-                print(f"⚠️ Fallback matched on prefix '{prefix}'")
+                logger.warning(f"⚠️ Fallback matched on prefix '{prefix}'")
                 break
 
     # 7. *only now* fall back to single‐word prefix
@@ -157,10 +132,10 @@ def filter_by_record_type(driver, record_name):
         first = record_name.split()[0].lower()
         match = next((opt for opt in options if opt["text"].lower().startswith(first)), None)
         if match:
-            print(f"⚠️ Last‐resort single‐word fallback matched on '{first}'")
+            logger.warning(f"⚠️ Last‐resort single‐word fallback matched on '{first}'")
 
     if not match:
-        print(f"⚠️ No dropdown option matched '{record_name}'")
+        logger.warning(f"⚠️ No dropdown option matched '{record_name}'")
         return False
 
     # 8. set the hidden input and fire its onchange
@@ -179,10 +154,10 @@ def filter_by_record_type(driver, record_name):
 
     # 10. detect “no data”
     if driver.find_elements(By.CSS_SELECTOR, "td.uir-nodata-cell"):
-        print(f"➡️ No workflows for '{record_name}'")
+        logger.info(f"➡️ No workflows for '{record_name}'")
         return False
 
-    print(f"🔎 Filter applied via JS to '{match['text']}'")
+    logger.info(f"🔎 Filter applied via JS to '{match['text']}'")
     return True
 
 #— helper to grab the last <span class="action-arguments"> or fall back into the onmouseover JS
@@ -264,6 +239,7 @@ def reset_scroll_to_top(driver, max_clicks=30, pause=0.1, wait_timeout=5):
         """)
         # no need to wait longer
 
+@timed()
 def discover_all_states(driver, scroll_pause=0.3, max_rounds=50):
     """
     Scrolls the workflow canvas from top→bottom by bumping the scrollTop
@@ -354,6 +330,7 @@ def ensure_rect_visible(driver, raw_x, raw_y, max_scrolls=15):
 
     raise RuntimeError(f"Couldn’t scroll rect ({raw_x},{raw_y}) into view")
 
+@timed()
 def build_state_label_map(driver):
     """
     Scans the #diagrammer SVG for every <rect> and its matching <g transform="translate(x y)">
@@ -386,8 +363,9 @@ def build_state_label_map(driver):
     return label_map
 
 # ── Phase 3: Workflow Detail & Actions Extraction ──────────────────────────
+@timed(attrs=("record_name",))
 def scrape_workflow_for_record(driver, record_name, results):
-    print(f"🔍 Starting scrape for '{record_name}'")
+    logger.info(f"🔍 Starting scrape for '{record_name}'")
     # 1) Open the workflow (Name link → maybe View button)
     try:
         row = driver.find_element(By.CSS_SELECTOR, "tr.uir-list-row-tr")
@@ -400,7 +378,7 @@ def scrape_workflow_for_record(driver, record_name, results):
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "input#view.rndbuttoninpt.bntBgT"))
             ).click()
         except Exception as e:
-            print(f"⚠️ open fail “{record_name}”: {e}")
+            logger.warning(f"⚠️ open fail “{record_name}”: {e}")
             return
 
     # 2) Make sure the Workflow tab is active
@@ -422,7 +400,7 @@ def scrape_workflow_for_record(driver, record_name, results):
             svg_loaded = True
             break
         except TimeoutException:
-            print(f"⚠️ SVG didn’t appear for '{record_name}' (attempt {attempt}/3)")
+            logger.warning(f"⚠️ SVG didn’t appear for '{record_name}' (attempt {attempt}/3)")
             # go back and re-open this workflow record (in case it reloaded to login/etc)
             try:
                 navigate_to_workflow_list(driver)
@@ -434,7 +412,7 @@ def scrape_workflow_for_record(driver, record_name, results):
             except Exception:
                 pass
     if not svg_loaded:
-        print(f"➡️ Skipping '{record_name}' altogether — diagram never appeared.")
+        logger.info(f"➡️ Skipping '{record_name}' altogether — diagram never appeared.")
         # ensure we're back on the list before returning
         navigate_to_workflow_list(driver)
         return
@@ -458,14 +436,14 @@ def scrape_workflow_for_record(driver, record_name, results):
     coords = list(state_labels.keys())
     # sort by y then x, both numeric
     coords.sort(key=lambda t: (float(t[1]), float(t[0])))
-    print(f"⚐ Found {len(coords)} total states")
+    logger.info(f"⚐ Found {len(coords)} total states")
 
     for idx, (x, y) in enumerate(coords, start=1):
         # grab its coords and lookup the name
         # x = rect.get_attribute("x")
         # y = rect.get_attribute("y")
         state_name = state_labels.get((x, y), "")
-        print(f"→ State #{idx} at ({x},{y}) = “{state_name}”")
+        logger.info(f"→ State #{idx} at ({x},{y}) = “{state_name}”")
 
         # scroll it fully into view (even if it's in the overflow pane)
         rect = ensure_rect_visible(driver, x, y)
@@ -498,13 +476,13 @@ def scrape_workflow_for_record(driver, record_name, results):
             panel = WebDriverWait(driver, 5).until(panel_changed)
             panel_html = panel.get_attribute("innerHTML")
         except TimeoutException:
-            print(f"⚠️ Panel didn’t update for state #{idx}, skipping")
+            logger.warning(f"⚠️ Panel didn’t update for state #{idx}, skipping")
             # collapse back and move on
             driver.find_element(By.ID, "panel-tab-switch-workflow").click()
             continue
 
         if not panel_html:
-            print(f"⚠️ Couldn’t stabilize Actions panel for '{record_name}', skipping state")
+            logger.warning(f"⚠️ Couldn’t stabilize Actions panel for '{record_name}', skipping state")
             # collapse back and continue
             driver.find_element(By.ID, "panel-tab-switch-workflow").click()
             continue
@@ -516,13 +494,13 @@ def scrape_workflow_for_record(driver, record_name, results):
         for cat_li in soup.select("ul > li"):
             cat_label = cat_li.select_one("span.category-row")
             category_name = cat_label.get_text(strip=True) if cat_label else "<unnamed>"
-            print(f"• Category: {category_name}")
+            logger.info(f"• Category: {category_name}")
 
             # Loop triggers
             for trig_li in cat_li.select(":scope > ul > li"):
                 trig_label = trig_li.select_one("span.trigger-row")
                 trigger_name = trig_label.get_text(strip=True) if trig_label else "<none>"
-                print(f"↳ Trigger: {trigger_name}")
+                logger.info(f"↳ Trigger: {trigger_name}")
 
                 # Loop actions
                 for action_li in trig_li.select("ul > li.action-row"):
@@ -542,7 +520,7 @@ def scrape_workflow_for_record(driver, record_name, results):
                     # condition
                     cond = action_li.get("onmouseover", "")
 
-                    print(f"↪ Action: {name} | args={args}")
+                    logger.info(f"↪ Action: {name} | args={args}")
                     results.append([
                         record_name,
                         workflow_name,
@@ -560,7 +538,7 @@ def scrape_workflow_for_record(driver, record_name, results):
             time.sleep(0.3)
         except:
             pass
-    print(f"✅ Finished scrape for '{record_name}' ({len(coords)} states) \n")
+    logger.info(f"✅ Finished scrape for '{record_name}' ({len(coords)} states) \n")
 
     # 9) Finally go back to the workflow‐list for the next record
     navigate_to_workflow_list(driver)
@@ -570,7 +548,7 @@ def save_actions(results, filename="workflow_actions.csv"):
         writer = csv.writer(f)
         writer.writerow(["Record Type","Workflow","State","Category","Trigger","Action","Arguments","Condition"])
         writer.writerows(results)
-    print(f"📂 Saved actions to {filename}")
+    logger.info(f"📂 Saved actions to {filename}")
 
 
 def run(driver, records=None):
@@ -598,8 +576,10 @@ def run(driver, records=None):
     for rec in records:
         navigate_to_workflow_list(driver)
         if filter_by_record_type(driver, rec):
-            scrape_workflow_for_record(driver, rec, all_actions)
+            # The workflow diagram is drawn from computed layout.
+            with full_resources(driver):
+                scrape_workflow_for_record(driver, rec, all_actions)
         else:
-            print(f"➡️ Skipping {rec}")
+            logger.info(f"➡️ Skipping {rec}")
 
     save_actions(all_actions)